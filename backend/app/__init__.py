@@ -15,6 +15,14 @@ mail = Mail()
 jwt = JWTManager()
 
 
+def _env_flag(name, default=False):
+    """"1" / "true" / "yes" / "on" (any case) -> True, "0" / "false" / ... -> False, unset -> default."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
 def create_app():
     # 1. Load Environment Variables
     load_dotenv()
@@ -57,15 +65,39 @@ def create_app():
     app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024  # 100 MB
     app.config["ALLOWED_EXTENSIONS"] = {"pdf", "doc", "docx", "mp4", "webm"}
 
+    # Extracted resume text / transcripts cache (see app/artifact_cache.py)
+    app.config["ARTIFACT_CACHE_MAX_BYTES"] = int(os.getenv("ARTIFACT_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+    # Rendered GET /api/jobs responses (see app/response_cache.py); 0 disables
+    app.config["RESPONSE_CACHE_MAX_BYTES"] = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+    app.config["RESPONSE_CACHE_TTL_SECONDS"] = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 30))
+
     # -------------------------------------------
     # 5. EMAIL CONFIG
     # -------------------------------------------
-    app.config['MAIL_SERVER'] = 'smtp.gmail.com'
-    app.config['MAIL_PORT'] = 587
-    app.config['MAIL_USE_TLS'] = True
-    app.config['MAIL_USERNAME'] = os.getenv('EMAIL_USER')
-    app.config['MAIL_PASSWORD'] = os.getenv('EMAIL_PASS')
-    app.config['MAIL_DEFAULT_SENDER'] = os.getenv('EMAIL_USER')
+    # Same names as .env / Flask-Mail (MAIL_USERNAME ...); EMAIL_USER / EMAIL_PASS still work
+    mail_username = os.getenv('MAIL_USERNAME') or os.getenv('EMAIL_USER')
+    app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
+    app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
+    # Port 465 = SSL from the first byte, 587 = STARTTLS
+    app.config['MAIL_USE_SSL'] = _env_flag('MAIL_USE_SSL', app.config['MAIL_PORT'] == 465)
+    app.config['MAIL_USE_TLS'] = _env_flag('MAIL_USE_TLS', not app.config['MAIL_USE_SSL'])
+    app.config['MAIL_USERNAME'] = mail_username
+    app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD') or os.getenv('EMAIL_PASS')
+    app.config['MAIL_DEFAULT_SENDER'] = os.getenv('MAIL_DEFAULT_SENDER') or mail_username
+
+    # Emails are sent by the worker from the outbox (see app/email_outbox.py):
+    # "smtp" = Flask-Mail with the settings above, "console" = print them (local dev only)
+    app.config['MAIL_BACKEND'] = os.getenv('MAIL_BACKEND') or ('smtp' if mail_username else 'console')
+    if app.config['MAIL_BACKEND'] == 'console' and not os.getenv('MAIL_BACKEND'):
+        if os.getenv('FLASK_ENV') == 'production':
+            raise RuntimeError("MAIL_USERNAME / MAIL_PASSWORD are not set - refusing to start "
+                               "(set MAIL_BACKEND=console to print emails instead of sending them)")
+        print("⚠️ MAIL_USERNAME is not set: emails are only PRINTED by the worker, nobody gets them "
+              "(set the MAIL_* credentials, or MAIL_BACKEND=console to silence this)")
+    app.config['MAIL_BATCH_SIZE'] = int(os.getenv('MAIL_BATCH_SIZE', 50))
+    app.config['MAIL_CONNECTION_IDLE_SECONDS'] = float(os.getenv('MAIL_CONNECTION_IDLE_SECONDS', 60))
+    app.config['MAIL_MAX_EMAILS'] = int(os.getenv('MAIL_MAX_EMAILS', 100))  # then reconnect
 
     # -------------------------------------------
     # 6. INITIALIZE APPS
@@ -102,10 +134,31 @@ def create_app():
         print(f"❌ Error importing Blueprints: {e}")
 
     # -------------------------------------------
-    # 9. CREATE DB TABLES (With Crash Protection)
+    # 9. DB SCHEMA (Explicit step, NOT on every boot)
     # -------------------------------------------
+    # Run "python init_db.py" (or "flask --app run init-db") once after pulling new models;
+    # existing databases are upgraded with "python migrate_db.py" (flask ... migrate-db).
+    # AUTO_CREATE_TABLES=1 restores the old create-on-boot behaviour for throwaway dev DBs.
     os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 
+    @app.cli.command("init-db")
+    def init_db_command():
+        """Create all database tables."""
+        init_db(app)
+
+    @app.cli.command("migrate-db")
+    def migrate_db_command():
+        """Upgrade an existing database (columns, indexes, constraints)."""
+        from app.migrations import run_migrations
+        run_migrations(app)
+
+    if os.getenv("AUTO_CREATE_TABLES") == "1":
+        init_db(app)
+
+    return app
+
+
+def init_db(app):
     with app.app_context():
         try:
             db.create_all()
@@ -113,5 +166,3 @@ def create_app():
         except Exception as e:
             print(f"❌ DATABASE CONNECTION FAILED: {e}")
             print("⚠️ The server is running, but database features will fail.")
-
-    return app
\ No newline at end of file
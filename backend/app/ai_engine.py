@@ -1,54 +1,90 @@
 import re
 import os
-import PyPDF2
-import speech_recognition as sr
-from moviepy.editor import VideoFileClip
-from thefuzz import fuzz  # Handles spelling mistakes
-from pdfminer.high_level import extract_text  # 🟢 NEW: The Fix for "No Spaces"
-from textblob import TextBlob  # 🟢 NEW: Sentiment Analysis
+import time
+import importlib
+# 🟢 These wrappers import their heavy libraries (pdfminer, thefuzz, speech_recognition)
+# lazily, so importing the AI engine (and the API routes) stays cheap.
+from app.fuzzy_index import DocumentIndex, FUZZY_THRESHOLD  # Handles spelling mistakes
+from app.pdf_extractor import extract_clean_text  # 🟢 Page-streaming pdfminer wrapper
+from app.transcription import transcribe_media, get_backend as get_transcription_backend  # 🟢 Chunked STT
+from app.skill_matcher import get_skill_matcher, normalize_pattern
+from app.skill_ontology import get_ontology  # 🟢 Canonical skills + aliases (hot-reloadable)
+from app.scoring_metrics import ScoringMetrics  # 🟢 Per-stage timings / sizes / cache flags
+from app import artifact_cache
+
+# Heavy ML / media libraries, loaded on first use (or up front via warm_up())
+HEAVY_MODULES = ("pdfminer.high_level", "pdfminer.layout", "thefuzz.fuzz", "textblob", "speech_recognition")
+
+
+def warm_up():
+    """
+    Imports every heavy dependency + primes TextBlob's lexicon.
+    Worker processes call this once at start so the first application isn't slow.
+    """
+    for module_name in HEAVY_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            print(f"⚠️ Warm-up could not import {module_name}: {e}")
+    analyze_sentiment("warm up")
+    print("🔥 AI engine warmed up")
+
+# ---------------------------------------------------------
+# 🏷️ EXTRACTOR VERSIONS (bump when extraction output changes -> invalidates cache)
+# ---------------------------------------------------------
+PDF_EXTRACTOR_VERSION = "pdfminer-stream-3"  # 3: text inside figures (form XObjects)
+JD_EXTRACTOR_VERSION = "pdfminer-stream-raw-3"
+VIDEO_EXTRACTOR_VERSION = "ffmpeg-chunked-3"
 
 # ---------------------------------------------------------
 # 🧠 INTELLIGENT SKILL MAPPING (The Brain)
 # ---------------------------------------------------------
-# This allows the AI to understand that "React.js" is the same as "React"
-SYNONYM_DB = {
-    "react": ["reactjs", "react.js", "react native"],
-    "js": ["javascript", "es6", "ecmascript"],
-    "python": ["py", "python3", "django", "flask"],
-    "java": ["j2ee", "spring boot", "jvm"],
-    "ml": ["machine learning", "ai", "artificial intelligence", "deep learning"],
-    "aws": ["amazon web services", "ec2", "s3", "lambda"],
-    "communication": ["communicated", "communicating", "verbal skills"],
-    "node": ["node.js", "nodejs", "express"],
-    "sql": ["mysql", "postgresql", "database", "query"],
-}
-
-
-def extract_text_from_pdf(pdf_path):
+# Aliases / parent skills ("React.js" == "React", Django implies Python) now live in
+# app/data/skill_ontology.json - see app/skill_ontology.py. Edits are picked up without a restart.
+
+
+def extract_text_from_pdf(pdf_path, stats=None):
     """
-    🟢 FIXED VERSION: Uses pdfminer to ensure spaces are preserved.
-    Replaces the old PyPDF2 logic that was deleting spaces.
+    🟢 Streams the PDF page by page through pdfminer (spaces preserved),
+    cleaning each page as it comes. See app/pdf_extractor.py for the knobs
+    (page cap, fast layout, process pool).
     """
     try:
-        # 1. Extract Raw Text using the robust library
-        text = extract_text(pdf_path)
+        return extract_clean_text(pdf_path, mode="resume", stats=stats)
+    except Exception as e:
+        print(f"❌ Error reading PDF: {e}")
+        return ""
 
-        # 2. Fix Spacing (Convert newlines to spaces)
-        # This turns "Java\nDeveloper" into "Java Developer"
-        text = text.replace('\n', ' ').replace('\r', ' ')
 
-        # 3. Basic Cleanup (Remove multi-spaces, keep special chars like + and #)
-        # We keep . + # - to support "C++", "C#", "Node.js", "React-Native"
-        # The old regex [^a-z0-9] was deleting C++ and C#
-        text = re.sub(r'[^a-zA-Z0-9\s.+\-#]', '', text)
+def extract_jd_text(pdf_path):
+    """
+    Raw JD text for the HR form: keeps case + punctuation, only fixes spacing.
+    """
+    return extract_clean_text(pdf_path, mode="jd")
 
-        # 4. Collapse multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
 
-        return text.lower()
-    except Exception as e:
-        print(f"❌ Error reading PDF: {e}")
-        return ""
+# ---------------------------------------------------------
+# ⚡ CACHED EXTRACTION (content-addressed, see artifact_cache.py)
+# ---------------------------------------------------------
+def get_resume_text(pdf_path, artifacts=None, stats=None):
+    return artifact_cache.get_or_extract(
+        pdf_path, "resume", PDF_EXTRACTOR_VERSION, lambda path: extract_text_from_pdf(path, stats), artifacts
+    )
+
+
+def get_jd_text(pdf_path):
+    return artifact_cache.get_or_extract(pdf_path, "jd", JD_EXTRACTOR_VERSION, extract_jd_text)
+
+
+def video_transcript_version():
+    # Different backends give different transcripts -> part of the cache key
+    return f"{VIDEO_EXTRACTOR_VERSION}:{get_transcription_backend().name}"
+
+
+def get_video_transcript(video_path, artifacts=None, stats=None):
+    return artifact_cache.get_or_extract(
+        video_path, "video", video_transcript_version(), lambda path: extract_text_from_video(path, stats), artifacts
+    )
 
 
 def extract_name_from_text(text):
@@ -68,23 +104,20 @@ def extract_name_from_text(text):
     return "New Candidate"
 
 
-def extract_text_from_video(video_path):
+def extract_text_from_video(video_path, stats=None):
+    """
+    🟢 Audio is piped out of ffmpeg as 16 kHz mono PCM, cut into overlapping chunks
+    and transcribed concurrently by the configured backend (see app/transcription.py).
+    """
     if not video_path or not os.path.exists(video_path):
         return ""
     try:
-        print("🎥 Processing Video for Audio...")
-        video = VideoFileClip(video_path)
-        audio_path = video_path.replace(".mp4", ".wav").replace(".webm", ".wav")
-        video.audio.write_audiofile(audio_path, logger=None)
-
-        recognizer = sr.Recognizer()
-        with sr.AudioFile(audio_path) as source:
-            audio_data = recognizer.record(source)
-            text = recognizer.recognize_google(audio_data)
-
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
-        return text.lower()
+        print(f"🎥 Processing Video for Audio ({get_transcription_backend().name} backend)...")
+        stats = stats if stats is not None else {}
+        text = transcribe_media(video_path, stats=stats).lower()
+        if stats.get("failed_chunks"):
+            return artifact_cache.PartialText(text)  # Usable now, but not cached with its gaps
+        return text
     except Exception as e:
         print(f"⚠️ Video Processing Error: {e}")
         return ""
@@ -97,6 +130,8 @@ def analyze_sentiment(text):
     if not text:
         return 0, "No audio detected."
 
+    from textblob import TextBlob  # 🟢 Lazy: nltk + textblob cost ~0.3s to import
+
     # Analyze the text
     analysis = TextBlob(text)
     polarity = analysis.sentiment.polarity  # Range: -1 (Negative) to +1 (Positive)
@@ -111,21 +146,48 @@ def analyze_sentiment(text):
         return 0, "Neutral Tone"
 
 
-def calculate_ai_score(resume_path, video_path, job_skills):
+def calculate_ai_score(resume_path, video_path, job_skills, job_id=None, artifacts=None, metrics=None):
+    """
+    Extracts resume + video text (through the artifact cache) and scores them.
+    Pass an `artifacts` dict to get back the content hashes of the files
+    ("resume_hash" / "video_hash") so the texts can be re-used for re-scoring.
+    Pass a ScoringMetrics (app/scoring_metrics.py) to get per-stage timings,
+    input sizes and cache hit/miss flags.
+    """
+    metrics = metrics or ScoringMetrics()
+    artifacts = artifacts if artifacts is not None else {}
     print(f"\n🧠 AI DEBUG START ------------------")
     print(f"📄 Resume Path: {resume_path}")
     print(f"🛠️ Raw Job Skills from DB: {job_skills}")
 
     # 1. Extraction
-    resume_text = extract_text_from_pdf(resume_path)
+    with metrics.stage("resume_extract"):
+        pdf_stats = {}
+        resume_text = get_resume_text(resume_path, artifacts, pdf_stats)
     print(f"📝 Extracted Text Length: {len(resume_text)} characters")
+    metrics.record_extraction("resume", artifacts.get("resume_cache"), pages=pdf_stats.get("pages"), chars=len(resume_text))
 
     # 🟢 NEW: Process Video Text
-    video_text = extract_text_from_video(video_path)
+    with metrics.stage("video_extract"):
+        video_stats = {}
+        video_text = get_video_transcript(video_path, artifacts, video_stats) if video_path else ""
+    metrics.record_extraction("video", artifacts.get("video_cache") if video_path else None, chars=len(video_text), **video_stats)
+
+    return score_texts(resume_text, video_text, job_skills, job_id=job_id, metrics=metrics)
+
+
+def score_texts(resume_text, video_text, job_skills, job_id=None, sentiment=None, verbose=True, metrics=None):
+    """
+    Scoring half of calculate_ai_score, on already extracted text.
+    `sentiment` = (bonus, feedback) when it is already known (bulk re-scoring).
+    """
+    metrics = metrics or ScoringMetrics()
 
     # 🟢 NEW: Calculate Sentiment
-    sentiment_bonus, sentiment_feedback = analyze_sentiment(video_text)
-    print(f"🎤 Video Sentiment: {sentiment_feedback} (Bonus: {sentiment_bonus}%)")
+    with metrics.stage("sentiment"):
+        sentiment_bonus, sentiment_feedback = sentiment or analyze_sentiment(video_text)
+    if verbose:
+        print(f"🎤 Video Sentiment: {sentiment_feedback} (Bonus: {sentiment_bonus}%)")
 
     candidate_name = extract_name_from_text(resume_text)
     full_text = resume_text + " " + video_text
@@ -158,27 +220,27 @@ def calculate_ai_score(resume_path, video_path, job_skills):
         missing_skills_list = []
 
         # 3. Matching
+        match_started = time.perf_counter()
         full_text_lower = full_text.lower()
 
-        for skill in required_skills:
-            escaped_skill = re.escape(skill)
-            is_match = False
+        # 🟢 Ontology skills: every alias in the text resolves to a canonical skill in one
+        # dict lookup per token. Skills the ontology doesn't know go through the per-job automaton.
+        ontology = get_ontology()
+        ontology_hits, unknown_skills = ontology.match_required(
+            required_skills, ontology.skill_indexes_in(full_text_lower)
+        )
+        found_skills = {normalize_pattern(s) for s in ontology_hits}
+        if unknown_skills:
+            found_skills |= get_skill_matcher(job_id, unknown_skills, {}).find(full_text_lower)
+
+        # 🟢 Fuzzy fallback (typos / plurals) only for what the automaton missed,
+        # batched against a token + trigram index of this document
+        unmatched = [s for s in required_skills if normalize_pattern(s) not in found_skills]
+        if unmatched:
+            found_skills |= DocumentIndex(full_text_lower).find_fuzzy(unmatched, FUZZY_THRESHOLD)
 
-            # Check Exact
-            if skill in full_text_lower:
-                is_match = True
-
-            # Check Synonym
-            if not is_match and skill in SYNONYM_DB:
-                for syn in SYNONYM_DB[skill]:
-                    if syn in full_text_lower:
-                        is_match = True
-                        break
-
-            # Check Fuzzy
-            if not is_match:
-                if fuzz.partial_token_set_ratio(skill, full_text_lower) > 90:
-                    is_match = True
+        for skill in required_skills:
+            is_match = normalize_pattern(skill) in found_skills or skill in found_skills
 
             if is_match:
                 matched_count += 1
@@ -186,6 +248,9 @@ def calculate_ai_score(resume_path, video_path, job_skills):
             else:
                 missing_skills_list.append(skill.title())
 
+        metrics.add_time("skill_match", time.perf_counter() - match_started)
+        metrics.sizes.update({"required_skills": total_weight, "matched_skills": matched_count})
+
         # 4. Score Calculation (UPDATED WITH SENTIMENT)
         base_score = int((matched_count / total_weight) * 100) if total_weight > 0 else 0
 
@@ -195,7 +260,8 @@ def calculate_ai_score(resume_path, video_path, job_skills):
         # Cap at 100, Floor at 0
         final_score = max(0, min(100, final_score))
 
-        print(f"🏆 BASE: {base_score}% | SENTIMENT: {sentiment_bonus}% | FINAL: {final_score}%")
+        if verbose:
+            print(f"🏆 BASE: {base_score}% | SENTIMENT: {sentiment_bonus}% | FINAL: {final_score}%")
 
         # 5. Feedback
         if missing_skills_list:
@@ -206,7 +272,8 @@ def calculate_ai_score(resume_path, video_path, job_skills):
         ai_graph_data = {
             "matched": matched_skills_list,
             "missing": missing_skills_list,
-            "sentiment": sentiment_feedback  # Store for graphs
+            "sentiment": sentiment_feedback,  # Store for graphs
+            "sentiment_bonus": sentiment_bonus  # Lets re-scoring skip TextBlob
         }
 
         return final_score, feedback_str, ai_graph_data, candidate_name
@@ -0,0 +1,223 @@
+# backend/app/analytics.py
+# Incremental HR analytics (GET /api/hr/analytics).
+#
+# Instead of loading every Application and JSON-parsing graph_data on each page view,
+# one job_analytics_rollup row per job holds the running totals (applications, score
+# and trust sums, pipeline status counts, sentiment counts). Every write path bumps it
+# with atomic increments inside its own transaction:
+#   apply            -> record_application()
+#   status change    -> record_status_change() / record_status_changes() (bulk)
+#   proctoring flag  -> record_trust_change()
+#   (re-)scoring     -> record_scoring()
+# rebuild_rollups() recomputes everything with grouped SQL (rebuild_analytics.py).
+
+import json
+
+from sqlalchemy import case, func, insert
+
+from app import db
+from app.counters import increment_row
+
+STATUS_COLUMNS = {
+    "Applied": "applied_count",
+    "Shortlisted": "shortlisted_count",
+    "Hired": "hired_count",
+    "Rejected": "rejected_count",
+}
+SENTIMENT_COLUMNS = {
+    "Positive": "sentiment_positive",
+    "Neutral": "sentiment_neutral",
+    "Negative": "sentiment_negative",
+    "No Audio": "sentiment_no_audio",  # silent / empty video - not a Neutral tone
+}
+SUMMED_COLUMNS = ["application_count", "score_sum", "trust_sum"] + list(STATUS_COLUMNS.values()) \
+    + list(SENTIMENT_COLUMNS.values())
+
+MATRIX_PAGE_SIZE = 500
+MAX_MATRIX_PAGE_SIZE = 2000
+DEFAULT_TRUST = 100
+
+
+def sentiment_bucket(graph_data):
+    """
+    graph_data["sentiment"] ("Positive Tone 😃" ...) -> "Positive" / "Neutral" / "Negative", or
+    "No Audio" when the video had no speech ("No audio detected."); None if unscored.
+    """
+    if not graph_data:
+        return None
+    if not isinstance(graph_data, dict):
+        try:
+            graph_data = json.loads(graph_data)
+        except (TypeError, ValueError):
+            return None
+    text = str(graph_data.get("sentiment") or "Neutral")
+    if "Positive" in text:
+        return "Positive"
+    if "Negative" in text:
+        return "Negative"
+    if "no audio" in text.lower():
+        return "No Audio"
+    return "Neutral"
+
+
+# ---------------------------------------------------------
+# ➕ INCREMENTAL UPDATES (caller commits)
+# ---------------------------------------------------------
+def apply_deltas(job_id, deltas):
+    from app.models import JobAnalyticsRollup
+
+    deltas = {column: amount for column, amount in deltas.items() if column and amount}
+    if job_id is not None and deltas:
+        increment_row(JobAnalyticsRollup, {"job_id": job_id}, deltas)
+
+
+def record_application(application):
+    """A new application (after flush, so column defaults are filled in)."""
+    trust = application.trust_score if application.trust_score is not None else DEFAULT_TRUST
+    deltas = {"application_count": 1, "score_sum": application.score or 0, "trust_sum": trust}
+    deltas[STATUS_COLUMNS.get(application.status or "Applied")] = 1
+    deltas[SENTIMENT_COLUMNS.get(application.sentiment)] = 1
+    apply_deltas(application.job_id, deltas)
+
+
+def record_status_change(job_id, old_status, new_status):
+    if (old_status or "Applied") == new_status:
+        return
+    apply_deltas(job_id, {
+        STATUS_COLUMNS.get(old_status or "Applied"): -1,
+        STATUS_COLUMNS.get(new_status): 1,
+    })
+
+
+def record_status_changes(job_id, old_statuses, new_status):
+    """Many applications of one job moved to `new_status` - one increment for all of them."""
+    deltas = {}
+    for old_status in old_statuses:
+        if (old_status or "Applied") != new_status:
+            column = STATUS_COLUMNS.get(old_status or "Applied")
+            deltas[column] = deltas.get(column, 0) - 1
+            deltas[STATUS_COLUMNS.get(new_status)] = deltas.get(STATUS_COLUMNS.get(new_status), 0) + 1
+    apply_deltas(job_id, deltas)
+
+
+def record_trust_change(job_id, old_trust, new_trust):
+    apply_deltas(job_id, {"trust_sum": (new_trust or 0) - (old_trust or 0)})
+
+
+def record_scoring(job_id, old_score, new_score, old_sentiment, new_sentiment):
+    deltas = {"score_sum": (new_score or 0) - (old_score or 0)}
+    if old_sentiment != new_sentiment:
+        deltas[SENTIMENT_COLUMNS.get(old_sentiment)] = -1
+        deltas[SENTIMENT_COLUMNS.get(new_sentiment)] = 1
+    apply_deltas(job_id, deltas)
+
+
+def remove_job(job_id):
+    from app.models import JobAnalyticsRollup
+    JobAnalyticsRollup.query.filter_by(job_id=job_id).delete()
+
+
+# ---------------------------------------------------------
+# 📖 READING
+# ---------------------------------------------------------
+def summary(job_id=None):
+    """Totals for one job (one row by primary key) or all jobs (one SUM over the rollup rows)."""
+    from app.models import JobAnalyticsRollup
+
+    columns = [getattr(JobAnalyticsRollup, name) for name in SUMMED_COLUMNS]
+    if job_id is not None:
+        row = db.session.query(*columns).filter(JobAnalyticsRollup.job_id == job_id).first()
+    else:
+        row = db.session.query(*[func.coalesce(func.sum(column), 0) for column in columns]).first()
+    return {name: int(value or 0) for name, value in zip(SUMMED_COLUMNS, row or [])} or dict.fromkeys(SUMMED_COLUMNS, 0)
+
+
+def matrix_page(job_id=None, limit=MATRIX_PAGE_SIZE, cursor=None):
+    """
+    Talent-matrix points (trust vs AI score), newest applications first, keyset-paginated
+    on id so a job with 100k applicants is never loaded in one go.
+    Returns (points, next_cursor). Raises ValueError on a malformed cursor.
+    """
+    from app.models import Application
+
+    query = db.session.query(
+        Application.id, Application.full_name, Application.trust_score, Application.score, Application.status
+    )
+    if job_id is not None:
+        query = query.filter(Application.job_id == job_id)
+    if cursor:
+        query = query.filter(Application.id < int(cursor))
+
+    rows = query.order_by(Application.id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = str(rows[-1].id)
+
+    points = [{
+        "name": row.full_name.split()[0] if row.full_name else "Unknown",  # Just first name for graph
+        "x": row.trust_score or 0,  # X Axis: Trust
+        "y": row.score or 0,  # Y Axis: AI Skill Score
+        "status": row.status,
+    } for row in rows]
+    return points, next_cursor
+
+
+# ---------------------------------------------------------
+# 🔁 REBUILD / BACKFILL
+# ---------------------------------------------------------
+def backfill_sentiment(batch_size=1000, progress=None, current=None):
+    """
+    Fills Application.sentiment for rows scored before the column existed. Returns rows updated.
+    current="Neutral" re-buckets the rows that hold that bucket instead (e.g. silent videos that
+    were counted as Neutral before the "No Audio" bucket existed).
+    """
+    from app.models import Application
+
+    last_id, updated = 0, 0
+    while True:
+        rows = db.session.query(Application.id, Application.graph_data).filter(
+            Application.sentiment.is_(None) if current is None else Application.sentiment == current,
+            Application.graph_data.isnot(None),
+            Application.id > last_id
+        ).order_by(Application.id).limit(batch_size).all()
+        if not rows:
+            break
+
+        updates = [{"id": row.id, "sentiment": sentiment_bucket(row.graph_data)} for row in rows]
+        # unparseable graph_data keeps what it had
+        updates = [u for u in updates if u["sentiment"] and u["sentiment"] != current]
+        db.session.bulk_update_mappings(Application, updates)
+        db.session.commit()
+
+        updated += len(updates)
+        last_id = rows[-1].id
+        if progress:
+            progress(updated)
+    return updated
+
+
+def rebuild_rollups():
+    """Recomputes every job's rollup row with one grouped INSERT ... SELECT. Returns jobs written."""
+    from app.models import Application, Job, JobAnalyticsRollup
+
+    status = func.coalesce(Application.status, "Applied")
+
+    def count_where(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    grouped = db.session.query(
+        Application.job_id,
+        func.count(Application.id),
+        func.coalesce(func.sum(Application.score), 0),
+        func.coalesce(func.sum(func.coalesce(Application.trust_score, DEFAULT_TRUST)), 0),
+        *[count_where(status == name) for name in STATUS_COLUMNS],
+        *[count_where(Application.sentiment == name) for name in SENTIMENT_COLUMNS],
+    ).join(Job, Job.id == Application.job_id).group_by(Application.job_id)
+
+    JobAnalyticsRollup.query.delete()
+    db.session.execute(
+        insert(JobAnalyticsRollup).from_select(["job_id"] + SUMMED_COLUMNS, grouped.statement)
+    )
+    db.session.commit()
+    return JobAnalyticsRollup.query.count()
@@ -0,0 +1,211 @@
+# backend/app/applicant_listing.py
+# Applicants of one job (GET /api/hr/jobs/<id>/applicants): server-side sort, filters,
+# field selection and keyset pagination, plus an NDJSON export stream.
+#
+# Pages are ordered on (<sort column>, id) and continue from a cursor ("<value>:<id>" of
+# the last row), so every page is a range read on ix_application_job_<sort> - the
+# 5000th applicant costs the same as the first. Only the columns the requested fields
+# need are selected; the video sentiment comes from the bucketed Application.sentiment
+# column (graph_data is only read for rows scored before that column existed).
+# The export walks the same keyset in batches of plain row tuples, so memory stays flat
+# however many applicants a job has.
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from sqlalchemy import case, type_coerce
+
+from app import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+EXPORT_BATCH_SIZE = 500
+
+SORTS = ("ai_score", "trust_score", "created_at")
+ORDERS = ("desc", "asc")
+FIELDS = (
+    "id", "ai_score", "ai_feedback", "trust_score", "video_sentiment", "tab_switches",
+    "faces_detected", "voices_detected", "status", "scoring_status", "resume_url", "created_at", "user",
+)
+
+
+def _sort_column(sort):
+    from app.models import Application
+    return {"ai_score": Application.score, "trust_score": Application.trust_score,
+            "created_at": Application.created_at}[sort]
+
+
+def encode_cursor(sort, value, app_id):
+    return f"{value.isoformat() if sort == 'created_at' else value}:{app_id}"
+
+
+def decode_cursor(sort, cursor):
+    """"87:1520" -> (87, 1520); created_at cursors carry an ISO timestamp. ValueError on garbage."""
+    value, app_id = cursor.rsplit(":", 1)
+    return (datetime.fromisoformat(value) if sort == "created_at" else int(value)), int(app_id)
+
+
+def parse_fields(raw):
+    """"id,ai_score,user" -> that tuple; None / "" -> every field. ValueError on unknown names."""
+    if not raw:
+        return FIELDS
+    fields = tuple(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    unknown = [f for f in fields if f not in FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return fields
+
+
+# ---------------------------------------------------------
+# 🔎 QUERY
+# ---------------------------------------------------------
+def _query(job_id, fields, statuses=None, min_score=None, max_score=None):
+    from app.models import Application, Candidate, User
+
+    columns = [Application.id, Application.score, Application.trust_score, Application.created_at,
+               Application.status, Application.scoring_status, Application.resume_url,
+               Application.tab_switches, Application.faces_detected, Application.voices_detected]
+    if "ai_feedback" in fields:
+        columns.append(Application.feedback)
+    if "video_sentiment" in fields:
+        columns += [
+            Application.sentiment,
+            type_coerce(case((Application.sentiment.is_(None), Application.graph_data)), db.JSON)
+            .label("legacy_graph_data"),
+        ]
+    if "user" in fields:
+        columns += [
+            Application.full_name, Application.email,
+            Candidate.id.label("candidate_id"), Candidate.name.label("candidate_name"),
+            Candidate.phone.label("candidate_phone"), Candidate.location.label("candidate_location"),
+            Candidate.experience.label("candidate_experience"), Candidate.education.label("candidate_education"),
+            Candidate.skills.label("candidate_skills"), User.email.label("user_email"),
+        ]
+
+    query = db.session.query(*columns).filter(Application.job_id == job_id)
+    if "user" in fields:
+        query = query.outerjoin(Candidate, Application.candidate_id == Candidate.id) \
+            .outerjoin(User, Candidate.user_id == User.id)
+    if statuses:
+        query = query.filter(Application.status.in_(statuses))
+    if min_score is not None:
+        query = query.filter(Application.score >= min_score)
+    if max_score is not None:
+        query = query.filter(Application.score <= max_score)
+    return query
+
+
+def _page(query, sort, order, limit, after):
+    """One keyset page of `query`: rows after (value, id) in (sort, id) order."""
+    from app.models import Application
+
+    column = _sort_column(sort)
+    if after:
+        value, app_id = after
+        # The plain range bound lets the index seek to the cursor instead of filtering from the top
+        if order == "desc":
+            query = query.filter(column <= value, (column < value) | (Application.id < app_id))
+        else:
+            query = query.filter(column >= value, (column > value) | (Application.id > app_id))
+
+    if order == "desc":
+        query = query.order_by(column.desc(), Application.id.desc())
+    else:
+        query = query.order_by(column.asc(), Application.id.asc())
+    return query.limit(limit).all()
+
+
+def _sort_value(row, sort):
+    return {"ai_score": row.score, "trust_score": row.trust_score, "created_at": row.created_at}[sort]
+
+
+# ---------------------------------------------------------
+# 🧾 SERIALIZATION
+# ---------------------------------------------------------
+def _video_sentiment(row):
+    if row.sentiment:
+        return row.sentiment
+    if row.legacy_graph_data:
+        from app.analytics import sentiment_bucket
+        return sentiment_bucket(row.legacy_graph_data) or "Not Analyzed"
+    return "Not Analyzed"
+
+
+def serialize_rows(rows, fields):
+    """Row tuples -> applicant dicts with only `fields` (skills of the whole batch in one query)."""
+    from app.skills import candidate_skill_names
+
+    skill_names = {}
+    if "user" in fields:
+        candidates = {r.candidate_id: SimpleNamespace(id=r.candidate_id, skills=r.candidate_skills)
+                      for r in rows if r.candidate_id}
+        skill_names = candidate_skill_names(candidates.values())
+
+    applicants = []
+    for row in rows:
+        item = {
+            "id": row.id,
+            "ai_score": row.score or 0,
+            "trust_score": row.trust_score,
+            "tab_switches": row.tab_switches,
+            "faces_detected": row.faces_detected,
+            "voices_detected": row.voices_detected,
+            "status": row.status,
+            "scoring_status": row.scoring_status,
+            "resume_url": row.resume_url,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        }
+        if "ai_feedback" in fields:
+            item["ai_feedback"] = row.feedback or "No feedback yet."
+        if "video_sentiment" in fields:
+            item["video_sentiment"] = _video_sentiment(row)
+        if "user" in fields:
+            has_candidate = row.candidate_id is not None
+            item["user"] = {
+                "name": row.full_name or (row.candidate_name if has_candidate else "Unknown"),
+                "email": row.email or row.user_email or "No Email",
+                "phone": row.candidate_phone if has_candidate else "N/A",
+                "location": row.candidate_location if has_candidate else "N/A",
+                "experience": row.candidate_experience if has_candidate else "No experience listed.",
+                "education": row.candidate_education if has_candidate else "No education listed.",
+                "skills": skill_names.get(row.candidate_id, []),
+            }
+        applicants.append({field: item[field] for field in fields})
+    return applicants
+
+
+# ---------------------------------------------------------
+# 📄 PAGE / 📤 EXPORT
+# ---------------------------------------------------------
+def list_applicants_page(job_id, sort="ai_score", order="desc", statuses=None, min_score=None,
+                         max_score=None, fields=FIELDS, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    One page of a job's applicants. Returns (applicants, next_cursor); next_cursor is None
+    on the last page. Raises ValueError on a malformed cursor.
+    """
+    after = decode_cursor(sort, cursor) if cursor else None
+    query = _query(job_id, fields, statuses, min_score, max_score)
+    rows = _page(query, sort, order, limit + 1, after)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort, _sort_value(rows[-1], sort), rows[-1].id)
+    return serialize_rows(rows, fields), next_cursor
+
+
+def export_applicants(job_id, sort="ai_score", order="desc", statuses=None, min_score=None,
+                      max_score=None, fields=FIELDS, batch_size=EXPORT_BATCH_SIZE):
+    """Yields every matching applicant as one NDJSON line, EXPORT_BATCH_SIZE rows per query."""
+    query = _query(job_id, fields, statuses, min_score, max_score)
+    after = None
+    while True:
+        rows = _page(query, sort, order, batch_size, after)
+        if not rows:
+            return
+        for applicant in serialize_rows(rows, fields):
+            yield json.dumps(applicant) + "\n"
+        after = (_sort_value(rows[-1], sort), rows[-1].id)
+        if len(rows) < batch_size:
+            return
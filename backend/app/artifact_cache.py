@@ -0,0 +1,174 @@
+# backend/app/artifact_cache.py
+# Content-addressed cache for extracted resume text, JD text and video transcripts.
+#
+# Key = SHA-256 of the uploaded file bytes + artifact kind + extractor version.
+# The same resume uploaded for 10 different jobs is only parsed by pdfminer once.
+
+import hashlib
+import os
+from datetime import datetime
+
+from flask import current_app, has_app_context
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of cached text
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class PartialText(str):
+    """
+    Text an extractor only partly produced (e.g. some transcription chunks failed).
+    get_or_extract() hands it to the caller but never stores it - the next run retries.
+    """
+
+
+def file_sha256(path):
+    """Streams the file through SHA-256 (never loads a whole video into memory)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _table():
+    from app.models import ExtractedArtifact
+    return ExtractedArtifact.__table__
+
+
+def lookup(content_hash, kind, version):
+    """Returns cached text for this hash/kind/version (or None). Bumps LRU stats on hit."""
+    table = _table()
+    key = (
+        (table.c.content_hash == content_hash)
+        & (table.c.kind == kind)
+        & (table.c.extractor_version == version)
+    )
+
+    # Own short transaction so we never commit the caller's pending ORM changes
+    with db.engine.begin() as conn:
+        text = conn.execute(select(table.c.text).where(key)).scalar()
+        if text is not None:
+            conn.execute(
+                update(table).where(key).values(
+                    hit_count=table.c.hit_count + 1,
+                    last_used_at=datetime.utcnow(),
+                )
+            )
+    return text
+
+
+def store(content_hash, kind, version, text):
+    table = _table()
+    size = len(text.encode("utf-8"))
+    now = datetime.utcnow()
+
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(insert(table).values(
+                content_hash=content_hash,
+                kind=kind,
+                extractor_version=version,
+                text=text,
+                size_bytes=size,
+                hit_count=0,
+                created_at=now,
+                last_used_at=now,
+            ))
+    except IntegrityError:
+        # Another worker extracted the same file at the same time - keep theirs
+        return
+
+    _evict_if_needed()
+
+
+def _evict_if_needed():
+    """Size-bounded eviction: drop least-recently-used artifacts until we fit again."""
+    table = _table()
+    max_bytes = current_app.config.get("ARTIFACT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+
+    with db.engine.begin() as conn:
+        total = conn.execute(select(func.coalesce(func.sum(table.c.size_bytes), 0))).scalar()
+        if total <= max_bytes:
+            return
+
+        # Free down to 90% of the budget so we don't evict on every single insert
+        to_free = total - int(max_bytes * 0.9)
+        freed = 0
+        victims = []
+        rows = conn.execute(
+            select(table.c.id, table.c.size_bytes).order_by(table.c.last_used_at.asc())
+        )
+        for row_id, size in rows:
+            victims.append(row_id)
+            freed += size or 0
+            if freed >= to_free:
+                break
+
+        if victims:
+            conn.execute(delete(table).where(table.c.id.in_(victims)))
+            print(f"🧹 Artifact cache evicted {len(victims)} entries ({freed} bytes)")
+
+
+def lookup_many(content_hashes, kind, version):
+    """Batch lookup for bulk jobs (re-scoring): {content_hash: text} for the hashes we have."""
+    table = _table()
+    content_hashes = [h for h in set(content_hashes) if h]
+    if not content_hashes:
+        return {}
+
+    with db.engine.connect() as conn:
+        rows = conn.execute(
+            select(table.c.content_hash, table.c.text).where(
+                table.c.content_hash.in_(content_hashes),
+                table.c.kind == kind,
+                table.c.extractor_version == version,
+            )
+        )
+        return {content_hash: text for content_hash, text in rows}
+
+
+def get_or_extract(path, kind, version, extractor, info=None):
+    """
+    Returns the extracted text for `path`, running `extractor(path)` only on a cache miss.
+    Falls back to plain extraction when there is no app context (scripts, benchmarks).
+    If `info` is a dict, "<kind>_hash" is recorded in it so callers can find the
+    artifact again later without re-reading the file, and "<kind>_cache" says
+    whether the text came from the cache ("hit"), was extracted ("miss") or the
+    cache was not used ("off").
+    """
+    info = info if info is not None else {}
+    info[f"{kind}_cache"] = "off"
+
+    if not path or not os.path.exists(path) or not has_app_context():
+        return extractor(path)
+
+    try:
+        content_hash = file_sha256(path)
+        info[f"{kind}_hash"] = content_hash
+        cached = lookup(content_hash, kind, version)
+    except Exception as e:
+        print(f"⚠️ Artifact cache unavailable: {e}")
+        return extractor(path)
+
+    if cached is not None:
+        print(f"⚡ Artifact cache HIT ({kind}, {content_hash[:12]})")
+        info[f"{kind}_cache"] = "hit"
+        return cached
+
+    info[f"{kind}_cache"] = "miss"
+    text = extractor(path)
+
+    # Empty output usually means extraction failed - don't pin that failure in the cache
+    if isinstance(text, PartialText):
+        print(f"⚠️ Partial {kind} text ({content_hash[:12]}) not cached - next run extracts again")
+    elif text:
+        try:
+            store(content_hash, kind, version, text)
+        except Exception as e:
+            print(f"⚠️ Could not store artifact: {e}")
+
+    return text
@@ -0,0 +1,83 @@
+# backend/app/audio_stream.py
+# Streams interview audio straight out of ffmpeg as 16 kHz mono PCM chunks.
+#
+# No temporary WAV file is written: ffmpeg decodes into a pipe and we read it
+# in fixed-size chunks, so memory stays flat no matter how long the video is.
+
+import os
+import shutil
+import subprocess
+
+SAMPLE_RATE = 16000  # Hz, what speech recognizers expect
+SAMPLE_WIDTH = 2  # bytes per sample (signed 16-bit little endian)
+CHUNK_SECONDS = int(os.getenv("AUDIO_CHUNK_SECONDS", 30))
+
+BYTES_PER_SECOND = SAMPLE_RATE * SAMPLE_WIDTH
+
+
+def ffmpeg_binary():
+    """FFMPEG_BINARY env > ffmpeg on PATH > the binary bundled with imageio-ffmpeg."""
+    configured = os.getenv("FFMPEG_BINARY")
+    if configured:
+        return configured
+    on_path = shutil.which("ffmpeg")
+    if on_path:
+        return on_path
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        raise RuntimeError("ffmpeg not found (install it or set FFMPEG_BINARY)")
+
+
+def _read_exact(stream, size):
+    """Reads up to `size` bytes (pipes can return short reads)."""
+    buf = bytearray()
+    while len(buf) < size:
+        data = stream.read(size - len(buf))
+        if not data:
+            break
+        buf.extend(data)
+    return bytes(buf)
+
+
+def iter_pcm_chunks(media_path, chunk_seconds=CHUNK_SECONDS, overlap_seconds=0):
+    """
+    Yields raw PCM chunks of `chunk_seconds` (the last one may be shorter).
+    With `overlap_seconds`, each chunk is prefixed with the tail of the previous one
+    so a word cut at a boundary is heard in full by at least one chunk.
+
+    The ffmpeg process is always killed + reaped, even if the consumer stops early
+    or raises (use it with contextlib.closing to make that immediate).
+    """
+    chunk_bytes = int(chunk_seconds * BYTES_PER_SECOND)
+    overlap_bytes = int(overlap_seconds * BYTES_PER_SECOND)
+    overlap_bytes -= overlap_bytes % SAMPLE_WIDTH
+
+    cmd = [
+        ffmpeg_binary(), "-nostdin", "-v", "error",
+        "-i", media_path,
+        "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "-f", "s16le", "-",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    try:
+        tail = b""
+        while True:
+            data = _read_exact(proc.stdout, chunk_bytes)
+            if not data:
+                break
+            yield tail + data
+            tail = data[-overlap_bytes:] if overlap_bytes else b""
+
+        return_code = proc.wait()
+        if return_code != 0:
+            error = proc.stderr.read().decode("utf-8", "replace").strip()
+            raise RuntimeError(f"ffmpeg exited with {return_code}: {error[:500]}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
@@ -0,0 +1,111 @@
+# backend/app/bulk_status.py
+# Bulk status change (POST /api/hr/applications/bulk-status): shortlist / reject / hire many
+# applications - picked by id or by a filter ("job 7, score <= 39, still Applied") - in
+# one transaction instead of one PATCH (commit + link + SMTP round trip) per applicant.
+#
+# Per batch of BATCH_SIZE ids:
+#   1 SELECT ... FOR UPDATE           current status / link / name / email
+#   1 UPDATE ... WHERE id IN (...)    the new status
+#   1 executemany UPDATE              meeting links (Shortlisted rows that had none)
+# then one analytics increment per job and one INSERT of all notifications into the
+# email outbox - the worker sends them (app/email_outbox.py).
+
+import uuid
+
+from sqlalchemy import bindparam, func, select, update
+
+from app import db
+
+BATCH_SIZE = 500
+MAX_APPLICATIONS = 10000  # per call - a bigger filter is almost certainly a mistake
+
+OUTCOME_UPDATED = "updated"
+OUTCOME_UNCHANGED = "unchanged"  # already had the status: no email, no new link
+OUTCOME_NOT_FOUND = "not_found"
+
+
+def meeting_link(app_id):
+    return f"https://meet.jit.si/Interview-{app_id}-{uuid.uuid4().hex[:6]}"
+
+
+def _filter_query(job_id, statuses=None, min_score=None, max_score=None):
+    from app.models import Application
+
+    query = select(Application.id).where(Application.job_id == job_id)
+    if statuses:
+        query = query.where(Application.status.in_(statuses))
+    if min_score is not None:
+        query = query.where(Application.score >= min_score)
+    if max_score is not None:
+        query = query.where(Application.score <= max_score)
+    return query
+
+
+def matching_ids(job_id, statuses=None, min_score=None, max_score=None):
+    """Ids of a job's applications matching the filter. ValueError past MAX_APPLICATIONS."""
+    query = _filter_query(job_id, statuses, min_score, max_score)
+    total = db.session.execute(select(func.count()).select_from(query.subquery())).scalar()
+    if total > MAX_APPLICATIONS:
+        raise ValueError(f"{total} applications match - at most {MAX_APPLICATIONS} per call, narrow the filter")
+    # Index order (no sort) - the result lists every id anyway
+    return db.session.execute(query).scalars().all()
+
+
+def _update_batch(ids, new_status, results, status_deltas, emails):
+    from app.email_outbox import application_status_email
+    from app.models import Application
+
+    rows = db.session.execute(
+        select(Application.id, Application.job_id, Application.status, Application.meeting_link,
+               Application.full_name, Application.email)
+        .where(Application.id.in_(ids)).with_for_update()
+    ).all()
+
+    changed, links = [], []
+    for row in rows:
+        if (row.status or "Applied") == new_status:
+            results[row.id] = OUTCOME_UNCHANGED
+            continue
+        results[row.id] = OUTCOME_UPDATED
+        changed.append(row.id)
+        status_deltas.setdefault(row.job_id, []).append(row.status)
+
+        link = row.meeting_link
+        if new_status == "Shortlisted" and not link:
+            link = meeting_link(row.id)
+            links.append({"b_id": row.id, "b_link": link})
+        email = application_status_email(row.full_name, new_status, link)
+        if email:
+            emails.append({"recipient": row.email, "subject": email[0], "body": email[1],
+                           "application_id": row.id})
+
+    if changed:
+        db.session.execute(
+            update(Application).where(Application.id.in_(changed)).values(status=new_status)
+        )
+    if links:
+        table = Application.__table__  # Core UPDATE: executemany with one link per row
+        db.session.execute(
+            update(table).where(table.c.id == bindparam("b_id")).values(meeting_link=bindparam("b_link")),
+            links,
+        )
+
+
+def bulk_update_status(application_ids, new_status):
+    """
+    Moves the applications to `new_status` (caller commits). Returns
+    ({application id: "updated" | "unchanged" | "not_found"}, emails queued).
+    """
+    from app.analytics import record_status_changes
+    from app.email_outbox import queue_emails
+
+    ids = list(dict.fromkeys(application_ids))
+    results, status_deltas, emails = {}, {}, []
+    for start in range(0, len(ids), BATCH_SIZE):
+        _update_batch(ids[start:start + BATCH_SIZE], new_status, results, status_deltas, emails)
+
+    for app_id in ids:
+        results.setdefault(app_id, OUTCOME_NOT_FOUND)
+    for job_id, old_statuses in status_deltas.items():
+        record_status_changes(job_id, old_statuses, new_status)
+    return results, queue_emails(emails)
@@ -0,0 +1,493 @@
+# backend/app/candidate_search.py
+# BM25 full-text search over the whole candidate pool (resume text + profile fields).
+#
+# - inverted index lives in the DB: candidate_search_posting (term, candidate_id, tf)
+# - corpus totals (N, total length) sit in one search_index_stats row, updated atomically
+# - candidates are (re)indexed in the background worker when they apply or edit their profile
+# - ranking is top-k with early termination: a term with more than TERM_POSTINGS_CAP
+#   postings is only read best-impact-first (ix_candidate_search_posting_term_impact) up
+#   to the cap; the candidates found are scored exactly, and a MaxScore-style bound says
+#   whether anyone left unread could still reach the page (then the cap grows)
+# - document frequencies (for idf) are cached in-process for DOC_FREQ_TTL_SECONDS
+
+import math
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import case, delete, func, insert, select, union, update
+
+from app import db
+from app.fuzzy_index import tokenize
+from app.scoring import parse_skill_list, upload_path_from_url
+from app.task_queue import enqueue_once, task_handler
+
+INDEX_TASK = "index_candidate"
+DEFAULT_BATCH_SIZE = 500
+MAX_PER_PAGE = 100
+MAX_TERM_LENGTH = 64
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Early termination: postings read per common term before checking the bound (x4 per round)
+TERM_POSTINGS_CAP = int(os.getenv("SEARCH_TERM_POSTINGS_CAP", 2000))
+MAX_PRUNING_ROUNDS = 3
+DOC_FREQ_TTL_SECONDS = float(os.getenv("SEARCH_DOC_FREQ_TTL_SECONDS", 300))
+
+# Profile fields count more than a passing mention somewhere in the resume
+FIELD_WEIGHTS = {
+    "skills": 3,
+    "location": 2,
+    "experience": 1,
+    "education": 1,
+    "name": 1,
+    "resume": 1,
+}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it",
+    "of", "on", "or", "the", "to", "with", "i", "my", "we", "our", "you", "your", "this", "that",
+}
+
+_AND_RE = re.compile(r"\bAND\b")
+
+
+def bm25_weight(tf, length, avg_length):
+    """BM25 term weight without the idf factor (numbers or SQL column expressions)."""
+    return tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length))
+
+
+def _avg_length(doc_count, total_length):
+    return max(total_length / doc_count, 1.0) if doc_count else 1.0
+
+
+def _terms(text):
+    return [
+        token for token in tokenize(text or "")
+        if token not in STOPWORDS and len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+# -------------------------------------------------------
+# DOCUMENT BUILDING
+# -------------------------------------------------------
+def _resume_path(candidate):
+    """Profile resume first, otherwise the resume from the candidate's latest application."""
+    from app.models import Application
+
+    resume_url = candidate.resume_url
+    if not resume_url:
+        resume_url = db.session.execute(
+            select(Application.resume_url)
+            .where(Application.candidate_id == candidate.id)
+            .order_by(Application.id.desc())
+            .limit(1)
+        ).scalar()
+    return upload_path_from_url(resume_url)
+
+
+def build_document(candidate, resume_text=None):
+    """Returns ({term: weighted tf}, resume_hash) for a candidate."""
+    from app.ai_engine import get_resume_text
+
+    info = {}
+    if resume_text is None:
+        resume_path = _resume_path(candidate)
+        resume_text = get_resume_text(resume_path, info) if resume_path else ""
+
+    fields = {
+        "skills": " ".join(parse_skill_list(candidate.skills)),
+        "location": candidate.location,
+        "experience": candidate.experience,
+        "education": candidate.education,
+        "name": candidate.name if candidate.name != "New Candidate" else "",
+        "resume": resume_text,
+    }
+
+    term_freqs = {}
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for term in _terms(text):
+            term_freqs[term] = term_freqs.get(term, 0) + weight
+    return term_freqs, info.get("resume_hash")
+
+
+# -------------------------------------------------------
+# INDEX MAINTENANCE
+# -------------------------------------------------------
+def _bump_stats(doc_delta, length_delta):
+    from app.models import SearchIndexStats
+
+    result = db.session.execute(
+        update(SearchIndexStats).where(SearchIndexStats.id == 1).values(
+            doc_count=SearchIndexStats.doc_count + doc_delta,
+            total_length=SearchIndexStats.total_length + length_delta,
+        )
+    )
+    if result.rowcount == 0:
+        db.session.execute(insert(SearchIndexStats).values(
+            id=1, doc_count=max(doc_delta, 0), total_length=max(length_delta, 0)
+        ))
+
+
+def remove_candidate(candidate_id):
+    """Drops a candidate from the index (caller commits)."""
+    from app.models import CandidateSearchDoc, CandidateSearchPosting
+
+    doc = db.session.get(CandidateSearchDoc, candidate_id)
+    if not doc:
+        return
+    db.session.execute(delete(CandidateSearchPosting).where(CandidateSearchPosting.candidate_id == candidate_id))
+    _bump_stats(-1, -doc.length)
+    db.session.delete(doc)
+
+
+def index_candidate(candidate_id):
+    """(Re)indexes one candidate: replaces their postings and adjusts the corpus totals."""
+    from app.models import Candidate, CandidateSearchDoc, CandidateSearchPosting, SearchIndexStats
+
+    candidate = db.session.get(Candidate, candidate_id)
+    if not candidate:
+        remove_candidate(candidate_id)
+        db.session.commit()
+        return
+
+    term_freqs, resume_hash = build_document(candidate)
+    if not term_freqs:
+        remove_candidate(candidate_id)
+        db.session.commit()
+        return
+
+    length = sum(term_freqs.values())
+    doc = db.session.get(CandidateSearchDoc, candidate_id)
+
+    # Average length as it will be once this document is in
+    stats = db.session.get(SearchIndexStats, 1)
+    avg_length = _avg_length(
+        (stats.doc_count if stats else 0) + (0 if doc else 1),
+        (stats.total_length if stats else 0) + length - (doc.length if doc else 0),
+    )
+    db.session.execute(delete(CandidateSearchPosting).where(CandidateSearchPosting.candidate_id == candidate_id))
+    db.session.execute(insert(CandidateSearchPosting), [
+        {"term": term, "candidate_id": candidate_id, "tf": tf, "impact": bm25_weight(tf, length, avg_length)}
+        for term, tf in term_freqs.items()
+    ])
+
+    if doc:
+        _bump_stats(0, length - doc.length)
+        doc.length = length
+        doc.resume_hash = resume_hash
+        doc.indexed_at = datetime.utcnow()
+    else:
+        _bump_stats(1, length)
+        db.session.add(CandidateSearchDoc(
+            candidate_id=candidate_id, length=length, resume_hash=resume_hash
+        ))
+
+    # Fresh skills / resume text -> refresh this candidate's job recommendations too
+    from app.recommendations import enqueue_candidate_recommendations
+    enqueue_candidate_recommendations(candidate_id)
+    db.session.commit()
+    print(f"🔎 Indexed candidate {candidate_id} ({len(term_freqs)} terms)")
+
+
+def enqueue_indexing(candidate_id):
+    """Queues a re-index unless one is already waiting for this candidate (caller commits)."""
+    return enqueue_once(INDEX_TASK, {"candidate_id": candidate_id}, ref_id=candidate_id)
+
+
+@task_handler(INDEX_TASK, process_pool=True)
+def run_index_task(payload):
+    index_candidate(payload.get("candidate_id"))
+
+
+def rebuild_index(batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """
+    Drops and rebuilds the whole index from the candidate table (id-ordered batches,
+    one bulk INSERT per batch). Resume text comes from the artifact cache where possible.
+    `progress(indexed, total)` is called after every batch.
+    """
+    from app.models import Candidate, CandidateSearchDoc, CandidateSearchPosting, SearchIndexStats
+
+    db.session.execute(delete(CandidateSearchPosting))
+    db.session.execute(delete(CandidateSearchDoc))
+    db.session.execute(delete(SearchIndexStats))
+    db.session.execute(insert(SearchIndexStats).values(id=1, doc_count=0, total_length=0))
+    db.session.commit()
+
+    total = db.session.query(func.count(Candidate.id)).scalar()
+    indexed = 0
+    last_id = 0
+
+    while True:
+        candidates = Candidate.query.filter(Candidate.id > last_id).order_by(Candidate.id).limit(batch_size).all()
+        if not candidates:
+            break
+
+        postings = []
+        docs = []
+        for candidate in candidates:
+            term_freqs, resume_hash = build_document(candidate)
+            if not term_freqs:
+                continue
+            postings.extend(
+                {"term": term, "candidate_id": candidate.id, "tf": tf} for term, tf in term_freqs.items()
+            )
+            docs.append({
+                "candidate_id": candidate.id,
+                "length": sum(term_freqs.values()),
+                "resume_hash": resume_hash,
+                "indexed_at": datetime.utcnow(),
+            })
+
+        if docs:
+            db.session.execute(insert(CandidateSearchPosting), postings)
+            db.session.execute(insert(CandidateSearchDoc), docs)
+            _bump_stats(len(docs), sum(d["length"] for d in docs))
+        db.session.commit()
+
+        indexed += len(candidates)
+        last_id = candidates[-1].id
+        db.session.expunge_all()  # keep memory flat on big tables
+        if progress:
+            progress(indexed, total)
+
+    refresh_impacts()
+    db.session.commit()
+    with _doc_freq_lock:
+        _doc_freq_cache.clear()
+    return indexed
+
+
+def refresh_impacts():
+    """
+    Recomputes every posting's impact against the current average document length
+    (caller commits). Single postings are written with the average of their time, which
+    drifts as the pool grows; rebuild_index() ends with this, and it is cheap to re-run.
+    Returns the number of postings updated.
+    """
+    from app.models import CandidateSearchDoc, CandidateSearchPosting, SearchIndexStats
+
+    stats = db.session.get(SearchIndexStats, 1)
+    if not stats or not stats.doc_count:
+        return 0
+    postings = CandidateSearchPosting.__table__
+    docs = CandidateSearchDoc.__table__
+    length = select(docs.c.length).where(docs.c.candidate_id == postings.c.candidate_id).scalar_subquery()
+    result = db.session.execute(
+        update(postings).values(
+            impact=bm25_weight(postings.c.tf, length, _avg_length(stats.doc_count, stats.total_length))
+        )
+    )
+    return result.rowcount
+
+
+# -------------------------------------------------------
+# SEARCH
+# -------------------------------------------------------
+def parse_query(query, match=None):
+    """
+    "kubernetes AND terraform, Pune" -> (["kubernetes", "terraform", "pune"], True)
+    An uppercase AND (or match="all") makes every term required; otherwise any term matches.
+    """
+    require_all = match == "all" or (match is None and bool(_AND_RE.search(query or "")))
+    terms = list(dict.fromkeys(_terms(query)))  # unique, keep order
+    return terms, require_all
+
+
+_doc_freq_cache = {}  # term -> (document frequency, fetched at)
+_doc_freq_lock = threading.Lock()
+
+
+def _doc_freqs(terms):
+    """{term: number of candidates containing it} - cached, counting "python" is a long range scan."""
+    from app.models import CandidateSearchPosting
+
+    now = time.monotonic()
+    with _doc_freq_lock:
+        found = {t: entry[0] for t, entry in ((t, _doc_freq_cache.get(t)) for t in terms)
+                 if entry and now - entry[1] < DOC_FREQ_TTL_SECONDS}
+    missing = [t for t in terms if t not in found]
+    if missing:
+        postings = CandidateSearchPosting.__table__
+        counted = dict(db.session.execute(
+            select(postings.c.term, func.count())
+            .where(postings.c.term.in_(missing))
+            .group_by(postings.c.term)
+        ).all())
+        with _doc_freq_lock:
+            for term in missing:
+                found[term] = counted.get(term, 0)
+                _doc_freq_cache[term] = (found[term], now)
+    return found
+
+
+def _impact_at(term, rank):
+    """Impact of a term's `rank`-th best posting (0-based) - the best any unread posting can have."""
+    from app.models import CandidateSearchPosting
+
+    postings = CandidateSearchPosting.__table__
+    return db.session.execute(
+        select(postings.c.impact).where(postings.c.term == term)
+        .order_by(postings.c.impact.desc()).offset(rank).limit(1)
+    ).scalar() or 0.0
+
+
+def _candidate_pool(terms, capped, cap):
+    """Candidates worth scoring: every posting of the rare terms, the `cap` best of the common ones."""
+    from app.models import CandidateSearchPosting
+
+    postings = CandidateSearchPosting.__table__
+    parts = []
+    for term in terms:
+        part = select(postings.c.candidate_id).where(postings.c.term == term)
+        if term in capped:
+            top = part.order_by(postings.c.impact.desc()).limit(cap).subquery()
+            part = select(top.c.candidate_id)
+        parts.append(part)
+    return union(*parts).subquery() if len(parts) > 1 else parts[0].subquery()
+
+
+def _estimate_total(doc_freqs, n_docs, require_all):
+    """Matches if the terms were independent: N * P(all) for AND, N * P(any) for OR."""
+    miss_all = hit_all = 1.0
+    for df in doc_freqs.values():
+        share = min(df / n_docs, 1.0)
+        hit_all *= share
+        miss_all *= 1 - share
+    return round(n_docs * (hit_all if require_all else 1 - miss_all))
+
+
+def search(query, page=1, per_page=20, match=None):
+    """
+    BM25-ranked candidates for `query`.
+    Returns {"total", "total_is_estimate", "exact", "terms", "page", "per_page",
+             "results": [{"candidate_id", "score", "matched_terms"}]}.
+
+    Terms with at most `cap` postings are read in full. A more common term only
+    contributes its `cap` best-impact postings to the candidate pool; the pool is then
+    scored exactly over all query terms. Anyone outside the pool has at most the cap-th
+    impact of each capped term, so if the last hit of the page scores at least that
+    bound the page is exact; otherwise the cap grows (x4, MAX_PRUNING_ROUNDS rounds) and
+    the best page found is returned with exact=False. Cost per round:
+    O(cap x terms) index reads + the pool's postings, independent of how many
+    candidates contain the common terms. Worst case: AND of several common terms that
+    rarely occur together - the page fills slowly and the cap grows to 16x.
+    With a capped term, `total` is an independence estimate (total_is_estimate=True).
+    """
+    from app.models import CandidateSearchDoc, CandidateSearchPosting, SearchIndexStats
+
+    terms, require_all = parse_query(query, match)
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    page = max(1, page)
+    empty = {"total": 0, "total_is_estimate": False, "exact": True, "results": [],
+             "terms": terms, "page": page, "per_page": per_page}
+    if not terms:
+        return empty
+
+    stats = db.session.get(SearchIndexStats, 1)
+    if not stats or not stats.doc_count:
+        return empty
+
+    postings = CandidateSearchPosting.__table__
+    docs = CandidateSearchDoc.__table__
+
+    doc_freqs = {term: df for term, df in _doc_freqs(terms).items() if df}
+    if require_all and len(doc_freqs) < len(terms):
+        return empty  # some required term appears nowhere
+    terms = [t for t in terms if t in doc_freqs]
+    if not terms:
+        return empty
+
+    n_docs = stats.doc_count
+    avg_length = _avg_length(n_docs, stats.total_length)
+    idf = {
+        term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        for term, df in doc_freqs.items()
+    }
+
+    term_idf = case({term: idf[term] for term in terms}, value=postings.c.term, else_=0.0)
+    score = func.sum(term_idf * bm25_weight(postings.c.tf, docs.c.length, avg_length)).label("score")
+    ranked = (
+        select(postings.c.candidate_id, score)
+        .join(docs, docs.c.candidate_id == postings.c.candidate_id)
+        .where(postings.c.term.in_(terms))
+        .group_by(postings.c.candidate_id)
+    )
+    if require_all:
+        ranked = ranked.having(func.count() == len(terms))
+
+    needed = page * per_page
+    cap = max(TERM_POSTINGS_CAP, needed)
+    rarest = min(terms, key=doc_freqs.get)
+    for _ in range(MAX_PRUNING_ROUNDS):
+        capped = {t for t in terms if doc_freqs[t] > cap}
+        complete = True  # the pool holds every match (total is exact)
+        if not capped:
+            pool, bound = None, 0.0
+        elif require_all and rarest not in capped:
+            # Every hit has the rarest term, and all of its postings fit under the cap
+            pool, bound = _candidate_pool([rarest], set(), cap), 0.0
+        else:
+            pool = _candidate_pool(terms, capped, cap)
+            bound = sum(idf[t] * _impact_at(t, cap - 1) for t in capped)
+            complete = False
+
+        query_ranked = ranked
+        if pool is not None:
+            query_ranked = ranked.where(postings.c.candidate_id.in_(select(pool.c.candidate_id)))
+        # COUNT(*) OVER () = number of groups, computed in the same pass as the ranking
+        rows = db.session.execute(
+            query_ranked.add_columns(func.count().over().label("total"))
+            .order_by(score.desc(), postings.c.candidate_id)
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+        ).all()
+
+        exact = bound == 0.0 or (len(rows) == per_page and rows[-1].score >= bound)
+        if exact:
+            break
+        cap *= 4
+
+    total_is_estimate = not complete
+    if rows:
+        total = rows[0].total
+    elif complete:
+        # Page past the end: no row to carry the count
+        total = db.session.execute(select(func.count()).select_from(query_ranked.subquery())).scalar()
+    else:
+        total = 0
+    if total_is_estimate:
+        total = max(total, _estimate_total(doc_freqs, n_docs, require_all))
+
+    # Which query terms each hit matched (only for the page we return)
+    matched = {}
+    if rows:
+        for candidate_id, term in db.session.execute(
+            select(postings.c.candidate_id, postings.c.term).where(
+                postings.c.candidate_id.in_([r.candidate_id for r in rows]),
+                postings.c.term.in_(terms),
+            )
+        ):
+            matched.setdefault(candidate_id, []).append(term)
+
+    return {
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "exact": exact,
+        "terms": terms,
+        "page": page,
+        "per_page": per_page,
+        "results": [
+            {
+                "candidate_id": row.candidate_id,
+                "score": round(float(row.score), 4),
+                "matched_terms": sorted(matched.get(row.candidate_id, []), key=terms.index),
+            }
+            for row in rows
+        ],
+    }
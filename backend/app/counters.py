@@ -0,0 +1,27 @@
+# backend/app/counters.py
+# Race-free counter rows shared by the aggregate tables (scoring histograms, analytics rollups).
+
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+
+
+def increment_row(model, key, values):
+    """
+    UPDATE ... SET col = col + n WHERE key; INSERT the row the first time it is needed.
+    Runs in the caller's transaction (caller commits), so the counters move together
+    with the change they describe.
+    """
+    table = model.__table__
+    where = [table.c[column] == value for column, value in key.items()]
+    increments = {column: table.c[column] + amount for column, amount in values.items()}
+
+    if db.session.execute(update(table).where(*where).values(**increments)).rowcount:
+        return
+    try:
+        with db.session.begin_nested():
+            db.session.execute(insert(table).values(**key, **values))
+    except IntegrityError:
+        # Another worker created the row in between - increment it instead
+        db.session.execute(update(table).where(*where).values(**increments))
@@ -0,0 +1,308 @@
+# backend/app/email_outbox.py
+# Outgoing email: requests only add email_outbox rows, the background worker sends them.
+#
+# - queue_email() / queue_emails() insert in the caller's transaction (the status change
+#   and its notification commit together) and wake the "flush_email_outbox" task
+# - the flush claims due rows in batches (atomic UPDATE, safe with several workers) and
+#   sends them over ONE connection that stays open between batches and flushes:
+#   one TLS handshake + login per MAIL_CONNECTION_IDLE_SECONDS, not one per email
+#   (Flask-Mail reconnects by itself after MAIL_MAX_EMAILS messages)
+# - a refused recipient / bad message fails that row only; a connection or login error
+#   puts the whole rest of the batch back with backoff (60s, 120s, 240s, ...), then
+#   "failed" after max_attempts
+# - MAIL_BACKEND: "smtp" (Flask-Mail, the MAIL_* settings) or "console" (prints the
+#   message - local dev without a mail server). A local debugging SMTP server works with
+#   "smtp" too: MAIL_SERVER=localhost MAIL_PORT=1025 MAIL_USE_TLS=0
+
+import smtplib
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import func, insert, select, update
+
+from app import db
+from app.task_queue import TASK_PENDING, enqueue_once, task_handler
+
+FLUSH_TASK = "flush_email_outbox"
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+DEFAULT_BATCH_SIZE = 50
+MAX_PER_FLUSH = 1000  # then the next flush task continues (other task kinds get a turn)
+RETRY_BASE_SECONDS = 60
+STALE_AFTER = timedelta(minutes=10)  # "sending" this long = worker died mid-batch
+
+
+# ---------------------------------------------------------
+# ✉️ QUEUEING (caller commits)
+# ---------------------------------------------------------
+def queue_emails(messages):
+    """Adds [{"recipient", "subject", "body", "application_id"?}, ...] in one INSERT."""
+    from app.models import EmailOutbox
+
+    now = datetime.utcnow()
+    rows = [{
+        "recipient": message["recipient"], "subject": message["subject"][:255], "body": message["body"],
+        "application_id": message.get("application_id"), "status": STATUS_PENDING,
+        "attempts": 0, "max_attempts": 5, "send_after": now, "created_at": now,
+    } for message in messages if message.get("recipient")]
+    if rows:
+        db.session.execute(insert(EmailOutbox), rows)
+        _wake_flush(now)
+    return len(rows)
+
+
+def _wake_flush(when):
+    """Makes sure a flush task is due at `when` at the latest (caller commits)."""
+    from app.models import BackgroundTask
+
+    task = enqueue_once(FLUSH_TASK)
+    if task is not None:
+        task.run_after = when
+    else:
+        # One is waiting (e.g. for a retry in 4 minutes) - new mail shouldn't wait with it
+        db.session.execute(
+            update(BackgroundTask)
+            .where(BackgroundTask.kind == FLUSH_TASK, BackgroundTask.status == TASK_PENDING,
+                   BackgroundTask.run_after > when)
+            .values(run_after=when)
+        )
+
+
+def queue_email(recipient, subject, body, application_id=None):
+    return queue_emails([{"recipient": recipient, "subject": subject, "body": body,
+                          "application_id": application_id}])
+
+
+def application_status_email(full_name, status, meeting_link=None):
+    """(subject, body) of the email a status change sends, or None if that status sends none."""
+    if status == "Shortlisted":
+        body = f"Hello {full_name},\n\nYou have been Shortlisted! Join here:\n{meeting_link}\n\n- RecruitPro HR"
+    elif status == "Hired":
+        body = f"Hello {full_name},\n\nCongratulations! You are Hired.\n\n- RecruitPro HR"
+    elif status == "Rejected":
+        body = f"Hello {full_name},\n\nThank you for applying.\n\n- RecruitPro HR"
+    else:
+        return None
+    return f"Update: You are {status}!", body
+
+
+# ---------------------------------------------------------
+# 📮 SENDERS (one per worker process, reused between flushes)
+# ---------------------------------------------------------
+class SmtpSender:
+    """Flask-Mail connection kept open across messages, batches and flushes."""
+
+    def __init__(self):
+        self._connection = None
+        self._last_used = 0.0
+
+    def _connect(self):
+        from app import mail
+
+        self.close()
+        connection = mail.connect()
+        connection.__enter__()  # TCP + STARTTLS + login
+        self._connection = connection
+
+    def send(self, recipient, subject, body):
+        from flask_mail import Message
+
+        idle = float(current_app.config.get("MAIL_CONNECTION_IDLE_SECONDS", 60))
+        if self._connection is None or time.monotonic() - self._last_used > idle:
+            self._connect()
+
+        message = Message(subject=subject, recipients=[recipient], body=body)
+        try:
+            self._connection.send(message)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection - once more on a fresh one
+            self._connect()
+            self._connection.send(message)
+        self._last_used = time.monotonic()
+
+    def close(self):
+        if self._connection is not None:
+            try:
+                self._connection.__exit__(None, None, None)
+            except Exception:
+                pass  # Already closed by the server
+            self._connection = None
+
+
+class ConsoleSender:
+    """Prints instead of sending (MAIL_BACKEND=console)."""
+
+    def send(self, recipient, subject, body):
+        print(f"📧 [console mail] To: {recipient} | {subject}\n{body}\n")
+
+    def close(self):
+        pass
+
+
+SENDERS = {"smtp": SmtpSender, "console": ConsoleSender}
+_senders = {}
+
+
+def get_sender():
+    backend = current_app.config.get("MAIL_BACKEND", "smtp")
+    if backend not in SENDERS:
+        raise RuntimeError(f"Unknown MAIL_BACKEND '{backend}' (use one of: {', '.join(SENDERS)})")
+    if backend not in _senders:
+        _senders[backend] = SENDERS[backend]()
+    return _senders[backend]
+
+
+def _message_error(error):
+    """True if `error` is about this one message (the connection is still fine)."""
+    from flask_mail import BadHeaderError
+    return isinstance(error, (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError, BadHeaderError))
+
+
+def _is_permanent(error):
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return _message_error(error)
+
+
+# ---------------------------------------------------------
+# 📤 FLUSHING (worker)
+# ---------------------------------------------------------
+def _requeue_stale():
+    from app.models import EmailOutbox
+
+    cutoff = datetime.utcnow() - STALE_AFTER
+    result = db.session.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.status == STATUS_SENDING, EmailOutbox.locked_at < cutoff)
+        .values(status=STATUS_PENDING, locked_at=None)
+    )
+    if result.rowcount:
+        print(f"♻️ Re-queued {result.rowcount} stale email(s)")
+
+
+def _claim(limit):
+    """Moves up to `limit` due emails to "sending". Returns their rows."""
+    from app.models import EmailOutbox
+
+    _requeue_stale()
+    now = datetime.utcnow()
+    candidates = db.session.execute(
+        select(EmailOutbox.id)
+        .where(EmailOutbox.status == STATUS_PENDING, EmailOutbox.send_after <= now)
+        .order_by(EmailOutbox.send_after)
+        .limit(limit)
+    ).scalars().all()
+
+    claimed = []
+    for email_id in candidates:
+        # Only one worker can win this UPDATE (status check in the WHERE clause)
+        result = db.session.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == email_id, EmailOutbox.status == STATUS_PENDING)
+            .values(status=STATUS_SENDING, locked_at=now, attempts=EmailOutbox.attempts + 1)
+        )
+        if result.rowcount == 1:
+            claimed.append(email_id)
+
+    rows = db.session.execute(
+        select(EmailOutbox.id, EmailOutbox.recipient, EmailOutbox.subject, EmailOutbox.body,
+               EmailOutbox.attempts, EmailOutbox.max_attempts)
+        .where(EmailOutbox.id.in_(claimed)).order_by(EmailOutbox.id)
+    ).all() if claimed else []
+    db.session.commit()
+    return rows
+
+
+def _retry_or_fail(row, error, permanent=False):
+    message = f"{type(error).__name__}: {error}"[:2000]
+    if permanent or row.attempts >= row.max_attempts:
+        return {"id": row.id, "status": STATUS_FAILED, "last_error": message, "locked_at": None}
+    delay = RETRY_BASE_SECONDS * (2 ** max(0, row.attempts - 1))
+    return {"id": row.id, "status": STATUS_PENDING, "last_error": message, "locked_at": None,
+            "send_after": datetime.utcnow() + timedelta(seconds=delay)}
+
+
+def _schedule_next_flush():
+    """Queues the next flush for when the earliest pending email is due."""
+    from app.models import EmailOutbox
+
+    due = db.session.execute(
+        select(func.min(EmailOutbox.send_after)).where(EmailOutbox.status == STATUS_PENDING)
+    ).scalar()
+    if due is not None:
+        _wake_flush(max(due, datetime.utcnow()))
+        db.session.commit()
+
+
+def flush_outbox(batch_size=DEFAULT_BATCH_SIZE, max_messages=MAX_PER_FLUSH):
+    """Sends due emails batch by batch. Returns (sent, failed_or_retrying)."""
+    from app.models import EmailOutbox
+
+    sender = get_sender()
+    sent = failed = 0
+    connection_down = False
+
+    while not connection_down and sent + failed < max_messages:
+        rows = _claim(batch_size)
+        if not rows:
+            break
+
+        results = []
+        for index, row in enumerate(rows):
+            try:
+                sender.send(row.recipient, row.subject, row.body)
+                results.append({"id": row.id, "status": STATUS_SENT, "sent_at": datetime.utcnow(),
+                                "last_error": None, "locked_at": None})
+                sent += 1
+            except Exception as e:
+                if _message_error(e):
+                    results.append(_retry_or_fail(row, e, permanent=_is_permanent(e)))
+                    failed += 1
+                    continue
+                # Can't reach / log in to the server: the rest of the batch waits as well
+                print(f"❌ Mail server error, {len(rows) - index} email(s) back in the outbox: {e}")
+                sender.close()
+                results += [_retry_or_fail(r, e) for r in rows[index:]]
+                failed += len(rows) - index
+                connection_down = True
+                break
+
+        db.session.bulk_update_mappings(EmailOutbox, results)
+        db.session.commit()
+
+    if sent or failed:
+        print(f"📬 Outbox flush: {sent} sent, {failed} failed / retrying")
+    _schedule_next_flush()
+    return sent, failed
+
+
+@task_handler(FLUSH_TASK)
+def _flush_task(payload):
+    flush_outbox(batch_size=int(current_app.config.get("MAIL_BATCH_SIZE", DEFAULT_BATCH_SIZE)))
+
+
+# ---------------------------------------------------------
+# 📊 STATS
+# ---------------------------------------------------------
+def stats():
+    from app.models import EmailOutbox
+
+    counts = dict(db.session.execute(
+        select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)
+    ).all())
+    oldest = db.session.execute(
+        select(func.min(EmailOutbox.created_at)).where(EmailOutbox.status == STATUS_PENDING)
+    ).scalar()
+    return {
+        "pending": counts.get(STATUS_PENDING, 0),
+        "sending": counts.get(STATUS_SENDING, 0),
+        "sent": counts.get(STATUS_SENT, 0),
+        "failed": counts.get(STATUS_FAILED, 0),
+        "oldest_pending_at": oldest.isoformat() if oldest else None,
+        "backend": current_app.config.get("MAIL_BACKEND", "smtp"),
+    }
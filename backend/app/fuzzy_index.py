@@ -0,0 +1,167 @@
+# backend/app/fuzzy_index.py
+# Fuzzy skill lookup against an index of the resume, built once per document.
+#
+# The old fallback ran fuzz.partial_token_set_ratio(skill, whole_resume) for every
+# unmatched skill. That is slow on long resumes and over-matches: any single shared
+# word ("learning") was enough for "machine learning". Here the document is tokenized
+# once, tokens get a character-trigram index, and each skill word is only compared
+# (is_typo_of: edit distance / fuzz.ratio by word length) with the few tokens that share
+# trigrams with it. Multi-word skills
+# must have all their words fuzzily present next to each other, in order.
+
+import os
+import re
+from collections import defaultdict
+
+FUZZY_THRESHOLD = int(os.getenv("FUZZY_SKILL_THRESHOLD", 90))  # fuzz.ratio cutoff for long words
+MIN_FUZZY_TOKEN_LEN = 4  # "js", "aws", "sql" must match exactly - typos there are other words
+# Length-dependent typo tolerance (one typo costs a 6-letter word 17 ratio points, a 12-letter one 8):
+#   4-5 letters  only a swapped letter pair ("raect") - one substitution is usually another
+#                English word ("scala" / "scale", "react" / "reach")
+#   6-8 letters  one edit (insert / delete / substitute / swap), same first letter ("pythen", "djnago")
+#   longer       one edit, or fuzz.ratio >= FUZZY_THRESHOLD
+SHORT_WORD_LEN = 5
+MEDIUM_WORD_LEN = 8
+MAX_WORD_GAP = 2  # "machine (and) learning": allow one filler word between skill words
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9.+#\-]*")
+
+
+def tokenize(text):
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        token = token.rstrip(".-")  # sentence dots / dashes glued to the word
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def _trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _light_stem(token):
+    """Plural folding so "apis" finds "api" and "microservices" finds "microservice"."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _one_swap(a, b):
+    """True if b is a with exactly one pair of adjacent letters swapped."""
+    if len(a) != len(b):
+        return False
+    diff = [i for i in range(len(a)) if a[i] != b[i]]
+    return len(diff) == 2 and diff[1] == diff[0] + 1 and a[diff[0]] == b[diff[1]] and a[diff[1]] == b[diff[0]]
+
+
+def _one_edit(a, b):
+    """Damerau-Levenshtein distance <= 1 (one insert, delete, substitution or adjacent swap)."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) == len(b):
+        return sum(x != y for x, y in zip(a, b)) == 1 or _one_swap(a, b)
+    shorter, longer = (a, b) if len(a) < len(b) else (b, a)
+    i = 0
+    while i < len(shorter) and shorter[i] == longer[i]:
+        i += 1
+    return shorter[i:] == longer[i + 1:]
+
+
+def is_typo_of(word, token, threshold=FUZZY_THRESHOLD):
+    """Is `token` (from the document) `word` (from the skill) with a typo? See the length rules above."""
+    if len(word) <= SHORT_WORD_LEN:
+        return _one_swap(word, token)
+    if len(word) <= MEDIUM_WORD_LEN:
+        return word[0] == token[0] and _one_edit(word, token)
+    if _one_edit(word, token):
+        return True
+    from thefuzz import fuzz  # Lazy: only needed when the automaton missed a skill
+    return fuzz.ratio(word, token) >= threshold
+
+
+class DocumentIndex:
+    """Tokenized resume/transcript with a trigram -> token index."""
+
+    def __init__(self, text):
+        self.positions = defaultdict(list)  # token -> [positions in the document]
+        for position, token in enumerate(tokenize(text)):
+            self.positions[token].append(position)
+
+        self.vocab = list(self.positions)
+        self.by_stem = defaultdict(set)
+        self.gram_index = defaultdict(set)  # trigram -> {vocab ids}
+        for token_id, token in enumerate(self.vocab):
+            self.by_stem[_light_stem(token)].add(token)
+            if len(token) >= MIN_FUZZY_TOKEN_LEN:
+                for gram in _trigrams(token):
+                    self.gram_index[gram].add(token_id)
+
+        self._similar_cache = {}
+
+    def similar_tokens(self, word, threshold=FUZZY_THRESHOLD):
+        """Document tokens that are the same word as `word` (exact, plural, or typo)."""
+        key = (word, threshold)
+        if key in self._similar_cache:
+            return self._similar_cache[key]
+
+        matches = set(self.by_stem.get(_light_stem(word), ()))
+        if word in self.positions:
+            matches.add(word)
+
+        if MIN_FUZZY_TOKEN_LEN <= len(word) <= SHORT_WORD_LEN:
+            # A swapped pair can leave no trigram in common ("rust" / "rsut") - look the swaps up
+            for i in range(len(word) - 1):
+                swapped = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+                if swapped != word and swapped in self.positions:
+                    matches.add(swapped)
+        elif len(word) > SHORT_WORD_LEN:
+            grams = _trigrams(word)
+            shared = defaultdict(int)
+            for gram in grams:
+                for token_id in self.gram_index.get(gram, ()):
+                    shared[token_id] += 1
+
+            # One edit in a 6+ letter word leaves at least half of its trigrams
+            min_shared = max(1, len(grams) // 3)
+            for token_id, count in shared.items():
+                if count < min_shared:
+                    continue
+                token = self.vocab[token_id]
+                if is_typo_of(word, token, threshold):
+                    matches.add(token)
+
+        self._similar_cache[key] = matches
+        return matches
+
+    def _positions_for(self, word, threshold):
+        found = set()
+        for token in self.similar_tokens(word, threshold):
+            found.update(self.positions[token])
+        return found
+
+    def contains(self, skill, threshold=FUZZY_THRESHOLD):
+        words = tokenize(skill)
+        if not words:
+            return False
+
+        # Start positions where the first word occurs, then walk the remaining words forward
+        current = self._positions_for(words[0], threshold)
+        for word in words[1:]:
+            if not current:
+                return False
+            following = self._positions_for(word, threshold)
+            current = {
+                position for position in following
+                if any(0 < position - prev <= MAX_WORD_GAP for prev in current)
+            }
+        return bool(current)
+
+    def find_fuzzy(self, skills, threshold=FUZZY_THRESHOLD):
+        """Batched lookup: returns the subset of `skills` fuzzily present in the document."""
+        return {skill for skill in skills if self.contains(skill, threshold)}
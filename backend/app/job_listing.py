@@ -0,0 +1,112 @@
+# backend/app/job_listing.py
+# Public job listing (GET /api/jobs): server-side filters + keyset pagination.
+#
+# Pages are ordered newest first on (created_at, id) and continue from a cursor
+# ("<created_at iso>:<id>" of the last row) instead of an OFFSET, so every page is
+# an index range read on ix_job_created_at_id - page 500 costs the same as page 1.
+# The default "summary" view leaves the description out (only a short preview,
+# cut in SQL so the full text never leaves the database).
+# ?skill= is an exact (ontology-aware) skill match through job_skill, not a substring.
+
+import os
+from datetime import datetime
+
+from sqlalchemy import func, or_
+
+from app import db
+
+DEFAULT_PAGE_SIZE = int(os.getenv("JOBS_PAGE_SIZE", 20))
+MAX_PAGE_SIZE = 100
+PREVIEW_CHARS = 160
+VIEWS = ("summary", "full")
+
+
+def encode_cursor(created_at, job_id):
+    return f"{created_at.isoformat()}:{job_id}"
+
+
+def decode_cursor(cursor):
+    """"2026-01-05T10:00:00:81" -> (datetime, 81); raises ValueError on garbage."""
+    stamp, job_id = cursor.rsplit(":", 1)
+    return datetime.fromisoformat(stamp), int(job_id)
+
+
+def _contains(column, value):
+    """Case-insensitive substring match with LIKE wildcards in `value` taken literally."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+def _columns(view):
+    from app.models import Job
+
+    columns = [
+        Job.id, Job.title, Job.required_skills, Job.location, Job.experience_required,
+        Job.salary_range, Job.jd_upload, Job.created_by, Job.created_at, Job.is_active,
+    ]
+    if view == "full":
+        columns.append(Job.description)
+    else:
+        columns.append(func.substr(Job.description, 1, PREVIEW_CHARS).label("description_preview"))
+    return columns
+
+
+def serialize_row(row, view):
+    job = {
+        "id": row.id,
+        "title": row.title,
+        "required_skills": row.required_skills,
+        "location": row.location,
+        "experience_required": row.experience_required,
+        "salary_range": row.salary_range,
+        "jd_upload": row.jd_upload,
+        "created_by": row.created_by,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "is_active": row.is_active,
+    }
+    if view == "full":
+        job["description"] = row.description
+    else:
+        job["description_preview"] = row.description_preview
+    return job
+
+
+def list_jobs_page(q=None, location=None, is_active=None, created_by=None, skill=None,
+                   limit=DEFAULT_PAGE_SIZE, cursor=None, view="summary"):
+    """
+    One page of jobs, newest first. Returns (jobs, next_cursor); next_cursor is None on
+    the last page. No total count on purpose - counting is a full scan of the filter.
+    Raises ValueError on a malformed cursor.
+    """
+    from app.models import Job
+    from app.skills import find_skill, jobs_needing_skill
+
+    query = db.session.query(*_columns(view))
+    if skill:
+        known = find_skill(skill)
+        if not known:
+            return [], None  # No job ever listed it
+        query = query.filter(Job.id.in_(jobs_needing_skill(known.id)))
+    if q:
+        # Same semantics the dashboards used client-side: keyword in the title or the skills
+        query = query.filter(or_(_contains(Job.title, q), _contains(Job.required_skills, q)))
+    if location:
+        query = query.filter(_contains(Job.location, location))
+    if is_active is not None:
+        query = query.filter(Job.is_active.is_(is_active))
+    if created_by is not None:
+        query = query.filter(Job.created_by == created_by)
+
+    if cursor:
+        created_at, job_id = decode_cursor(cursor)
+        query = query.filter(
+            (Job.created_at < created_at)
+            | ((Job.created_at == created_at) & (Job.id < job_id))
+        )
+
+    rows = query.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return [serialize_row(row, view) for row in rows], next_cursor
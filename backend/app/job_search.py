@@ -0,0 +1,180 @@
+# backend/app/job_search.py
+# Full-text search over job postings (GET /api/jobs/search): title, description,
+# required skills and location, relevance ranked, prefix matched, paginated.
+#
+# One interface, one index per database:
+#   sqlite      FTS5 table job_fts (external content = job, kept in sync by triggers),
+#               ranked with bm25() and per-column weights
+#   postgresql  job.search_vector tsvector (title A > skills B > location C > description D)
+#               + GIN index, refreshed by index_job() from create_job / update_job;
+#               a deleted job takes its vector with it
+#   others      no index yet (MySQL): every word must appear somewhere (LIKE), newest first
+# Every query word is a prefix: "reac nati" finds "React Native".
+# ensure_index() creates and fills the index (migration 0006); until it ran, search
+# falls back to LIKE instead of failing.
+
+from sqlalchemy import Float, Integer, and_, inspect, or_, text
+
+from app import db
+from app.fuzzy_index import tokenize
+
+MAX_TERMS = 8
+MAX_OFFSET = 1000  # relevance pages past this are noise - refine the query instead
+
+# FTS5 bm25() weights, in job_fts column order (title, description, required_skills, location)
+FTS5_WEIGHTS = (10.0, 1.0, 5.0, 2.0)
+
+PG_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(required_skills, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(location, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'D')"
+)
+
+_available = {}
+
+
+def query_terms(q):
+    return list(dict.fromkeys(tokenize(q or "")))[:MAX_TERMS]
+
+
+def _dialect():
+    return db.engine.dialect.name
+
+
+def index_available():
+    """True when this database's full-text index exists (checked once per process)."""
+    dialect = _dialect()
+    if dialect not in _available:
+        if dialect == "sqlite":
+            _available[dialect] = "job_fts" in inspect(db.engine).get_table_names()
+        elif dialect == "postgresql":
+            _available[dialect] = "search_vector" in {c["name"] for c in inspect(db.engine).get_columns("job")}
+        else:
+            _available[dialect] = False
+        if not _available[dialect]:
+            print(f"⚠️ No job full-text index on {dialect} - /api/jobs/search falls back to LIKE")
+    return _available[dialect]
+
+
+# ---------------------------------------------------------
+# 🏗️ INDEX SETUP / MAINTENANCE
+# ---------------------------------------------------------
+def _ensure_sqlite():
+    statements = [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS job_fts USING fts5(
+            title, description, required_skills, location,
+            content='job', content_rowid='id',
+            tokenize="unicode61 remove_diacritics 2 tokenchars '+#'", prefix='2 3'
+        )""",
+        """CREATE TRIGGER IF NOT EXISTS job_fts_ai AFTER INSERT ON job BEGIN
+            INSERT INTO job_fts(rowid, title, description, required_skills, location)
+            VALUES (new.id, new.title, new.description, new.required_skills, new.location);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS job_fts_ad AFTER DELETE ON job BEGIN
+            INSERT INTO job_fts(job_fts, rowid, title, description, required_skills, location)
+            VALUES ('delete', old.id, old.title, old.description, old.required_skills, old.location);
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS job_fts_au AFTER UPDATE OF title, description, required_skills, location ON job BEGIN
+            INSERT INTO job_fts(job_fts, rowid, title, description, required_skills, location)
+            VALUES ('delete', old.id, old.title, old.description, old.required_skills, old.location);
+            INSERT INTO job_fts(rowid, title, description, required_skills, location)
+            VALUES (new.id, new.title, new.description, new.required_skills, new.location);
+        END""",
+        # (Re)reads every job row into the index
+        "INSERT INTO job_fts(job_fts) VALUES ('rebuild')",
+    ]
+    for statement in statements:
+        db.session.execute(text(statement))
+
+
+def _ensure_postgres():
+    db.session.execute(text("ALTER TABLE job ADD COLUMN IF NOT EXISTS search_vector tsvector"))
+    db.session.execute(text(f"UPDATE job SET search_vector = {PG_VECTOR_SQL} WHERE search_vector IS NULL"))
+    db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_job_search_vector ON job USING GIN (search_vector)"))
+
+
+def ensure_index():
+    """Creates + fills the full-text index for this database (caller commits). False if unsupported."""
+    dialect = _dialect()
+    _available.pop(dialect, None)
+    if dialect == "sqlite":
+        _ensure_sqlite()
+    elif dialect == "postgresql":
+        _ensure_postgres()
+    else:
+        return False
+    print(f"   ✅ Job full-text index ready ({dialect})")
+    return True
+
+
+def index_job(job_id):
+    """Refreshes one job's search entry after create / update (caller commits)."""
+    if _dialect() != "postgresql" or not index_available():
+        return  # SQLite: triggers did it; others: nothing to maintain
+    db.session.flush()
+    db.session.execute(text(f"UPDATE job SET search_vector = {PG_VECTOR_SQL} WHERE id = :id"), {"id": job_id})
+
+
+# ---------------------------------------------------------
+# 🔎 SEARCH
+# ---------------------------------------------------------
+def _ranked_matches(terms):
+    """Subquery (id, rank) of the jobs matching every term; higher rank = more relevant."""
+    if _dialect() == "sqlite":
+        match = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+        weights = ", ".join(str(w) for w in FTS5_WEIGHTS)
+        statement = text(
+            f"SELECT rowid AS id, -bm25(job_fts, {weights}) AS rank FROM job_fts WHERE job_fts MATCH :match"
+        ).bindparams(match=match)
+    else:
+        tsquery = " & ".join(f"'{term}':*" for term in terms)
+        statement = text(
+            "SELECT id, ts_rank_cd(search_vector, to_tsquery('simple', :tsquery)) AS rank "
+            "FROM job WHERE search_vector @@ to_tsquery('simple', :tsquery)"
+        ).bindparams(tsquery=tsquery)
+    return statement.columns(id=Integer, rank=Float).subquery("matches")
+
+
+def search_jobs(q, location=None, is_active=None, limit=20, cursor=None):
+    """
+    One page of jobs matching `q`, most relevant first. Returns (jobs, next_cursor) like
+    list_jobs_page(); the cursor is the offset of the next page. Raises ValueError on a
+    malformed cursor.
+    """
+    from app.job_listing import _columns, _contains, serialize_row
+    from app.models import Job
+
+    offset = int(cursor) if cursor else 0
+    if offset < 0:
+        raise ValueError("negative cursor")
+    terms = query_terms(q)
+    if not terms or offset > MAX_OFFSET:
+        return [], None
+
+    ranked = index_available()
+    if ranked:
+        matches = _ranked_matches(terms)
+        query = db.session.query(*_columns("summary"), matches.c.rank) \
+            .join(matches, matches.c.id == Job.id) \
+            .order_by(matches.c.rank.desc(), Job.id.desc())
+    else:
+        columns = (Job.title, Job.description, Job.required_skills, Job.location)
+        query = db.session.query(*_columns("summary")) \
+            .filter(and_(*[or_(*[_contains(column, term) for column in columns]) for term in terms])) \
+            .order_by(Job.created_at.desc(), Job.id.desc())
+
+    if location:
+        query = query.filter(_contains(Job.location, location))
+    if is_active is not None:
+        query = query.filter(Job.is_active.is_(is_active))
+
+    rows = query.offset(offset).limit(limit + 1).all()
+    next_cursor = str(offset + limit) if len(rows) > limit else None
+
+    jobs = []
+    for row in rows[:limit]:
+        job = serialize_row(row, "summary")
+        job["score"] = round(row.rank, 4) if ranked else None
+        jobs.append(job)
+    return jobs, next_cursor
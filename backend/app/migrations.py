@@ -0,0 +1,239 @@
+# backend/app/migrations.py
+# Versioned, idempotent schema migrations for existing SQLite / Postgres / MySQL databases
+# (replaces the old ad-hoc fix_db_schema.py). Run with "python migrate_db.py" or
+# "flask --app run migrate-db".
+#
+# - db.create_all() first: brand-new tables come straight from app/models.py
+# - then every migration in MIGRATIONS that is not recorded in schema_migration yet,
+#   each in its own transaction, recorded on success
+# - every step inspects the live schema before touching it (add a column only if it is
+#   missing, create an index only if no index of that name exists), so a fresh database
+#   - where create_all already made everything - just gets the migrations marked as done
+# - unique indexes are never forced: if existing rows violate one, the migration stops
+#   with the offending keys and nothing is deleted
+
+from datetime import datetime
+
+from sqlalchemy import func, inspect, text
+
+from app import db
+
+
+class MigrationError(Exception):
+    pass
+
+
+# ---------------------------------------------------------
+# 🔧 SCHEMA HELPERS
+# ---------------------------------------------------------
+def _inspector():
+    return inspect(db.session.connection())
+
+
+def add_column(model, name, default_sql=None):
+    """ALTER TABLE ... ADD COLUMN for model.<name> (type compiled for the live dialect) if missing."""
+    table = model.__table__
+    if name in {c["name"] for c in _inspector().get_columns(table.name)}:
+        return False
+
+    column = table.c[name]
+    ddl_type = column.type.compile(dialect=db.engine.dialect)
+    default = f" DEFAULT {default_sql}" if default_sql is not None else ""
+    db.session.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {ddl_type}{default}"))
+    print(f"   ✅ Added '{table.name}.{name}'")
+    return True
+
+
+def index_names(table_name):
+    inspector = _inspector()
+    names = {ix["name"] for ix in inspector.get_indexes(table_name)}
+    names |= {uc["name"] for uc in inspector.get_unique_constraints(table_name) if uc.get("name")}
+    return names
+
+
+def duplicate_keys(table_name, columns, limit=5):
+    """Up to `limit` key tuples that appear more than once (would break a unique index)."""
+    table = db.Model.metadata.tables[table_name]
+    key = [table.c[c] for c in columns]
+    return db.session.query(*key).filter(*[c.isnot(None) for c in key]) \
+        .group_by(*key).having(func.count() > 1).limit(limit).all()
+
+
+def create_index(table_name, name, columns, unique=False):
+    """CREATE [UNIQUE] INDEX name ON table (columns) unless an index / constraint of that name exists."""
+    if name in index_names(table_name):
+        return False
+
+    if unique:
+        duplicates = duplicate_keys(table_name, columns)
+        if duplicates:
+            raise MigrationError(
+                f"Cannot create unique index {name}: {table_name} has duplicate "
+                f"({', '.join(columns)}) values, e.g. {[tuple(d) for d in duplicates]}. "
+                f"Resolve them by hand and re-run."
+            )
+
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    db.session.execute(text(f"CREATE {kind} {name} ON {table_name} ({', '.join(columns)})"))
+    print(f"   ✅ Added {kind.lower()} '{name}'")
+    return True
+
+
+# ---------------------------------------------------------
+# 📜 MIGRATIONS (append only - never edit one that has shipped)
+# ---------------------------------------------------------
+def m0001_legacy_columns():
+    """Columns added after the first deploy (what fix_db_schema.py used to do)."""
+    from app.models import Application, Job
+
+    add_column(Job, "salary_range")
+    add_column(Job, "jd_upload")
+
+    # Existing rows were scored inside the request -> mark them "done"
+    add_column(Application, "scoring_status", default_sql="'done'")
+    add_column(Application, "scoring_error")
+    # Content hashes of the uploads (bulk re-scoring reads cached text by hash)
+    add_column(Application, "resume_hash")
+    add_column(Application, "video_hash")
+    # Per-stage timings of the scoring pipeline
+    add_column(Application, "scoring_metrics")
+    # HR analytics rollups (then run rebuild_analytics.py)
+    add_column(Application, "sentiment")
+
+
+def m0002_listing_and_pipeline_indexes():
+    """Keyset pagination of /api/jobs, grouped pipeline counts, talent-matrix pages."""
+    # Keyset pagination needs created_at on every row
+    db.session.execute(text("UPDATE job SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL"))
+    create_index("job", "ix_job_created_at_id", ["created_at", "id"])
+    create_index("application", "ix_application_job_status", ["job_id", "status"])
+    create_index("application", "ix_application_job_id_id", ["job_id", "id"])
+
+
+def m0003_hot_path_indexes_and_constraints():
+    """Foreign-key lookups of every endpoint + one application / profile / preference row per owner."""
+    # HR dashboard: an HR user's jobs, newest first
+    create_index("job", "ix_job_created_by_created_at", ["created_by", "created_at"])
+    # Candidate dashboard: my applications, newest first
+    create_index("application", "ix_application_candidate_created", ["candidate_id", "created_at"])
+    # A candidate applies to a job once (replaces the racy read-then-insert check)
+    create_index("application", "ux_application_job_candidate", ["job_id", "candidate_id"], unique=True)
+    # One profile / one preference row per login - every request looks them up by user_id
+    create_index("candidate", "ux_candidate_user_id", ["user_id"], unique=True)
+    create_index("candidate_preferences", "ux_candidate_preferences_user_id", ["user_id"], unique=True)
+
+
+def m0004_job_updated_at():
+    """Job.updated_at (Last-Modified of the cached job reads)."""
+    from app.models import Job
+
+    if add_column(Job, "updated_at"):
+        db.session.execute(text("UPDATE job SET updated_at = created_at WHERE updated_at IS NULL"))
+
+
+def m0005_applicant_sort_indexes():
+    """Sorted / keyset-paginated applicant lists (GET /api/hr/jobs/<id>/applicants)."""
+    # Keyset comparisons skip NULLs - give old rows the values new rows get by default
+    db.session.execute(text("UPDATE application SET score = 0 WHERE score IS NULL"))
+    db.session.execute(text("UPDATE application SET trust_score = 100 WHERE trust_score IS NULL"))
+    db.session.execute(text("UPDATE application SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL"))
+    create_index("application", "ix_application_job_score", ["job_id", "score", "id"])
+    create_index("application", "ix_application_job_trust", ["job_id", "trust_score", "id"])
+    create_index("application", "ix_application_job_created", ["job_id", "created_at", "id"])
+
+
+def m0006_job_full_text_index():
+    """Full-text index over job postings (FTS5 on SQLite, tsvector + GIN on Postgres)."""
+    from app.job_search import ensure_index
+    ensure_index()
+
+
+def m0007_proctoring_events():
+    """Proctoring warnings move out of Application.feedback into proctoring_event rows."""
+    from app.proctoring import move_feedback_warnings
+    create_index("proctoring_event", "ix_proctoring_event_application_type", ["application_id", "type", "id"])
+    print(f"   ✅ Moved the warnings of {move_feedback_warnings()} application(s)")
+
+
+def m0008_created_at_format():
+    """created_at written by func.now() / CURRENT_TIMESTAMP gets the ORM's datetime format (SQLite)."""
+    if db.engine.dialect.name != "sqlite":
+        return  # Real DATETIME / TIMESTAMP columns: nothing stored as text
+    # CURRENT_TIMESTAMP wrote 'YYYY-MM-DD HH:MM:SS', SQLAlchemy binds '... HH:MM:SS.ffffff': as text
+    # the keyset cursor of such a row never matched itself (same-second jobs paged in a loop)
+    for table in ("job", "application"):
+        result = db.session.execute(text(
+            f"UPDATE {table} SET created_at = created_at || '.000000' WHERE length(created_at) = 19"
+        ))
+        print(f"   ✅ Normalised created_at of {result.rowcount} {table} row(s)")
+
+
+def m0009_search_posting_impact():
+    """Impact-ordered search postings (early termination for common query terms)."""
+    from app.candidate_search import refresh_impacts
+    from app.models import CandidateSearchPosting
+    add_column(CandidateSearchPosting, "impact", "0")
+    create_index("candidate_search_posting", "ix_candidate_search_posting_term_impact", ["term", "impact"])
+    print(f"   ✅ Computed the impact of {refresh_impacts()} posting(s)")
+
+
+def m0010_no_audio_sentiment():
+    """Silent videos get their own "No Audio" sentiment bucket instead of counting as Neutral."""
+    from app.analytics import backfill_sentiment, rebuild_rollups
+    from app.models import JobAnalyticsRollup
+    add_column(JobAnalyticsRollup, "sentiment_no_audio", "0")
+    print(f"   ✅ Re-bucketed {backfill_sentiment(current='Neutral')} silent video(s)")
+    print(f"   ✅ Rebuilt the analytics rollups of {rebuild_rollups()} job(s)")
+
+
+MIGRATIONS = [
+    ("0001_legacy_columns", m0001_legacy_columns),
+    ("0002_listing_and_pipeline_indexes", m0002_listing_and_pipeline_indexes),
+    ("0003_hot_path_indexes_and_constraints", m0003_hot_path_indexes_and_constraints),
+    ("0004_job_updated_at", m0004_job_updated_at),
+    ("0005_applicant_sort_indexes", m0005_applicant_sort_indexes),
+    ("0006_job_full_text_index", m0006_job_full_text_index),
+    ("0007_proctoring_events", m0007_proctoring_events),
+    ("0008_created_at_format", m0008_created_at_format),
+    ("0009_search_posting_impact", m0009_search_posting_impact),
+    ("0010_no_audio_sentiment", m0010_no_audio_sentiment),
+]
+
+
+# ---------------------------------------------------------
+# ▶️ RUNNER
+# ---------------------------------------------------------
+def applied_migrations():
+    from app.models import SchemaMigration
+    return {row.id for row in SchemaMigration.query.all()}
+
+
+def run_migrations(app, dry_run=False):
+    """Creates missing tables, then applies pending migrations in order. Returns the ids applied."""
+    from app.models import SchemaMigration
+
+    with app.app_context():
+        db.create_all()
+        done = applied_migrations()
+        pending = [(mid, step) for mid, step in MIGRATIONS if mid not in done]
+        if not pending:
+            print("✅ Database schema is up to date")
+            return []
+
+        applied = []
+        for migration_id, step in pending:
+            print(f"🔨 {migration_id}: {(step.__doc__ or '').strip()}")
+            if dry_run:
+                continue
+            try:
+                step()
+                db.session.add(SchemaMigration(id=migration_id, applied_at=datetime.utcnow()))
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                print(f"❌ {migration_id} failed - nothing from it was recorded; fix and re-run")
+                raise
+            applied.append(migration_id)
+
+        print(f"🚀 Applied {len(applied)} migration(s)" if not dry_run else "ℹ️ Dry run - nothing changed")
+        return applied
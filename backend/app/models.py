@@ -2,6 +2,7 @@
 
 from app import db
 from datetime import datetime
+from sqlalchemy.dialects import mysql
 
 
 # -------------------------------------------------------
@@ -22,6 +23,13 @@ class User(db.Model):
 # JOB MODEL (HR creates jobs)
 # -------------------------------------------------------
 class Job(db.Model):
+    __table_args__ = (
+        # Keyset pagination of the public listing (newest first)
+        db.Index("ix_job_created_at_id", "created_at", "id"),
+        # HR dashboard: an HR user's jobs, newest first
+        db.Index("ix_job_created_by_created_at", "created_by", "created_at"),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=True)
@@ -34,7 +42,9 @@ class Job(db.Model):
     jd_upload = db.Column(db.String(300), nullable=True)
 
     created_by = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
-    created_at = db.Column(db.DateTime, default=db.func.now())
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # Bumped on every ORM update; Last-Modified of GET /api/jobs/<id>
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
 
     applications = db.relationship(
@@ -49,6 +59,9 @@ class Job(db.Model):
 # CANDIDATE MODEL
 # -------------------------------------------------------
 class Candidate(db.Model):
+    # One profile per login (looked up by user_id on almost every candidate request)
+    __table_args__ = (db.Index("ux_candidate_user_id", "user_id", unique=True),)
+
     id = db.Column(db.Integer, primary_key=True)
 
     name = db.Column(db.String(120), nullable=False)
@@ -75,6 +88,21 @@ class Candidate(db.Model):
 # backend/app/models.py
 
 class Application(db.Model):
+    __table_args__ = (
+        # Per-job pipeline counts (GROUP BY job_id, status) are answered from this index alone
+        db.Index("ix_application_job_status", "job_id", "status"),
+        # Talent-matrix pages of one job, newest first (keyset on id)
+        db.Index("ix_application_job_id_id", "job_id", "id"),
+        # Applicant list of one job sorted by AI score / trust / date (keyset on (value, id))
+        db.Index("ix_application_job_score", "job_id", "score", "id"),
+        db.Index("ix_application_job_trust", "job_id", "trust_score", "id"),
+        db.Index("ix_application_job_created", "job_id", "created_at", "id"),
+        # Candidate dashboard: my applications, newest first
+        db.Index("ix_application_candidate_created", "candidate_id", "created_at"),
+        # A candidate applies to a job once - enforced here, not by a read-then-insert check
+        db.Index("ux_application_job_candidate", "job_id", "candidate_id", unique=True),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     job_id = db.Column(db.Integer, db.ForeignKey('job.id'), nullable=False)
     candidate_id = db.Column(db.Integer, db.ForeignKey('candidate.id'), nullable=False)
@@ -99,12 +127,28 @@ class Application(db.Model):
     tab_switches = db.Column(db.Integer, default=0)
     faces_detected = db.Column(db.String(50), default="Single Face")
     voices_detected = db.Column(db.String(50), default="Single Voice")
+
+    # AI scoring runs in the background worker: pending -> processing -> done / retrying / failed
+    scoring_status = db.Column(db.String(20), default="pending")
+    scoring_error = db.Column(db.Text, nullable=True)
+
+    # SHA-256 of the uploaded files -> keys into extracted_artifact (re-scoring without re-parsing)
+    resume_hash = db.Column(db.String(64), nullable=True)
+    video_hash = db.Column(db.String(64), nullable=True)
+
+    # Per-stage timings / input sizes / cache flags of the last scoring run (app/scoring_metrics.py)
+    scoring_metrics = db.Column(db.JSON, nullable=True)
+
+    # Positive / Neutral / Negative / No Audio bucket of graph_data["sentiment"] (NULL until scored)
+    sentiment = db.Column(db.String(10), nullable=True)
+
 class CandidatePreference(db.Model):
     """
     SQLAlchemy model for candidate_preferences table.
     Stores a candidate's saved job search preferences.
     """
     __tablename__ = "candidate_preferences"
+    __table_args__ = (db.Index("ux_candidate_preferences_user_id", "user_id", unique=True),)
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
@@ -117,3 +161,303 @@ class CandidatePreference(db.Model):
 
     # relationship (optional if you want access to user)
     user = db.relationship("User", backref=db.backref("preferences", lazy=True))
+
+
+# -------------------------------------------------------
+# EXTRACTED ARTIFACT CACHE (resume text / video transcripts)
+# -------------------------------------------------------
+class ExtractedArtifact(db.Model):
+    """
+    Normalized text pulled out of an uploaded file, keyed by the SHA-256 of the
+    file bytes + the extractor version. Lets us skip pdfminer / speech recognition
+    when the exact same file has been processed before.
+    """
+    __tablename__ = "extracted_artifact"
+    __table_args__ = (
+        db.UniqueConstraint("content_hash", "kind", "extractor_version", name="uq_artifact_key"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    content_hash = db.Column(db.String(64), nullable=False)
+    kind = db.Column(db.String(20), nullable=False)  # "resume", "video", "jd"
+    extractor_version = db.Column(db.String(50), nullable=False)
+
+    # Plain TEXT caps at 64 KB on MySQL; Postgres / SQLite text has no length (and rejects one)
+    text = db.Column(db.Text().with_variant(mysql.MEDIUMTEXT(), "mysql"), nullable=False)
+    size_bytes = db.Column(db.Integer, nullable=False, default=0)
+    hit_count = db.Column(db.Integer, nullable=False, default=0)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+
+# -------------------------------------------------------
+# BACKGROUND TASK QUEUE (AI scoring etc. - see app/task_queue.py)
+# -------------------------------------------------------
+class BackgroundTask(db.Model):
+    """
+    A unit of background work. Lives in the main DB so queued work survives restarts.
+    status: pending -> running -> done | failed (pending again while retries remain)
+    """
+    __tablename__ = "background_task"
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    ref_id = db.Column(db.Integer, nullable=True, index=True)  # e.g. the Application being scored
+    payload = db.Column(db.JSON, nullable=True)
+
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    last_error = db.Column(db.Text, nullable=True)
+
+    run_after = db.Column(db.DateTime, default=datetime.utcnow)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_background_task_status_run_after", "status", "run_after"),
+    )
+
+
+# -------------------------------------------------------
+# BULK RE-SCORE RUNS (job skills changed -> recompute every application)
+# -------------------------------------------------------
+class RescoreRun(db.Model):
+    __tablename__ = "rescore_run"
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey("job.id"), nullable=False, index=True)
+    status = db.Column(db.String(20), nullable=False, default="queued")  # queued/running/done/failed/superseded
+    reason = db.Column(db.String(50), nullable=True)  # "skills_changed", "manual", "cli"
+
+    total = db.Column(db.Integer, nullable=False, default=0)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    reextracted = db.Column(db.Integer, nullable=False, default=0)  # cache misses that needed pdfminer/STT
+    error = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+
+# -------------------------------------------------------
+# CANDIDATE SEARCH INDEX (BM25 over resumes + profiles - see app/candidate_search.py)
+# -------------------------------------------------------
+class CandidateSearchDoc(db.Model):
+    """One row per indexed candidate: document length for BM25 length normalization."""
+    __tablename__ = "candidate_search_doc"
+
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id"), primary_key=True)
+    length = db.Column(db.Integer, nullable=False, default=0)
+    resume_hash = db.Column(db.String(64), nullable=True)  # which resume text went into the index
+    indexed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class CandidateSearchPosting(db.Model):
+    """
+    Inverted index: term -> candidates containing it (tf = weighted term frequency).
+    impact = the posting's BM25 term weight (without idf) at indexing time; search reads
+    the postings of very common terms best-impact-first and stops early.
+    """
+    __tablename__ = "candidate_search_posting"
+    __table_args__ = (
+        db.Index("ix_candidate_search_posting_term_impact", "term", "impact"),
+    )
+
+    term = db.Column(db.String(64), primary_key=True)
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id"), primary_key=True, index=True)
+    tf = db.Column(db.Integer, nullable=False, default=1)
+    impact = db.Column(db.Float, nullable=False, default=0.0)
+
+
+class SearchIndexStats(db.Model):
+    """Single row (id=1) of corpus totals, kept up to date with atomic increments."""
+    __tablename__ = "search_index_stats"
+
+    id = db.Column(db.Integer, primary_key=True)
+    doc_count = db.Column(db.Integer, nullable=False, default=0)
+    total_length = db.Column(db.BigInteger, nullable=False, default=0)
+
+
+# -------------------------------------------------------
+# JOB RECOMMENDATIONS (precomputed feed + alerts - see app/recommendations.py)
+# -------------------------------------------------------
+class JobRecommendation(db.Model):
+    """
+    Precomputed match of an active job for a candidate (preferences + skills + resume).
+    alerted_at is set when the job was new and a strong match -> shows up as a job alert.
+    """
+    __tablename__ = "job_recommendation"
+    __table_args__ = (
+        db.Index("ix_job_recommendation_feed", "candidate_id", "score", "job_id"),
+        db.Index("ix_job_recommendation_alerts", "candidate_id", "alerted_at"),
+    )
+
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id"), primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey("job.id"), primary_key=True, index=True)
+    score = db.Column(db.Float, nullable=False, default=0)
+    reasons = db.Column(db.JSON, nullable=True)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    alerted_at = db.Column(db.DateTime, nullable=True)
+    seen_at = db.Column(db.DateTime, nullable=True)
+
+
+class RecommendationTerm(db.Model):
+    """Reverse index: interest term (preferred role / location / skill) -> candidates."""
+    __tablename__ = "recommendation_term"
+
+    term = db.Column(db.String(64), primary_key=True)
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id"), primary_key=True, index=True)
+
+
+# -------------------------------------------------------
+# SCORING PIPELINE METRICS (aggregated per stage - see app/scoring_metrics.py)
+# -------------------------------------------------------
+class ScoringStageHistogram(db.Model):
+    """How many scoring runs had this stage finish within `le_ms` (fixed buckets, not cumulative)."""
+    __tablename__ = "scoring_stage_histogram"
+
+    stage = db.Column(db.String(30), primary_key=True)
+    le_ms = db.Column(db.Integer, primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class ScoringStageStat(db.Model):
+    __tablename__ = "scoring_stage_stat"
+
+    stage = db.Column(db.String(30), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+    total_ms = db.Column(db.Float, nullable=False, default=0)
+    max_ms = db.Column(db.Float, nullable=False, default=0)
+    cache_hits = db.Column(db.Integer, nullable=False, default=0)
+    cache_misses = db.Column(db.Integer, nullable=False, default=0)
+
+
+# -------------------------------------------------------
+# HR ANALYTICS ROLLUPS (one row per job, kept current by app/analytics.py)
+# -------------------------------------------------------
+class JobAnalyticsRollup(db.Model):
+    __tablename__ = "job_analytics_rollup"
+
+    job_id = db.Column(db.Integer, db.ForeignKey("job.id"), primary_key=True)
+    application_count = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.BigInteger, nullable=False, default=0)
+    trust_sum = db.Column(db.BigInteger, nullable=False, default=0)
+
+    applied_count = db.Column(db.Integer, nullable=False, default=0)
+    shortlisted_count = db.Column(db.Integer, nullable=False, default=0)
+    hired_count = db.Column(db.Integer, nullable=False, default=0)
+    rejected_count = db.Column(db.Integer, nullable=False, default=0)
+
+    sentiment_positive = db.Column(db.Integer, nullable=False, default=0)
+    sentiment_neutral = db.Column(db.Integer, nullable=False, default=0)
+    sentiment_negative = db.Column(db.Integer, nullable=False, default=0)
+    sentiment_no_audio = db.Column(db.Integer, nullable=False, default=0)
+
+
+# -------------------------------------------------------
+# SCHEMA MIGRATIONS APPLIED (see app/migrations.py)
+# -------------------------------------------------------
+class SchemaMigration(db.Model):
+    __tablename__ = "schema_migration"
+
+    id = db.Column(db.String(100), primary_key=True)
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# -------------------------------------------------------
+# SKILLS (normalized; the legacy text columns are kept in sync for old readers)
+# -------------------------------------------------------
+class Skill(db.Model):
+    """
+    One row per distinct skill. `key` is the ontology's canonical id when the ontology
+    knows the skill ("ReactJS" / "react.js" -> "react"), else the normalized spelling.
+    """
+    __tablename__ = "skill"
+
+    id = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(120), nullable=False, unique=True)
+    name = db.Column(db.String(120), nullable=False)  # display name (ontology name / first spelling seen)
+
+
+class JobSkill(db.Model):
+    __tablename__ = "job_skill"
+    __table_args__ = (
+        # "Jobs needing skill Y" (the primary key covers "skills of job X")
+        db.Index("ix_job_skill_skill_job", "skill_id", "job_id"),
+    )
+
+    job_id = db.Column(db.Integer, db.ForeignKey("job.id"), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey("skill.id"), primary_key=True)
+    position = db.Column(db.Integer, nullable=False, default=0)  # order HR listed them in
+
+
+class CandidateSkill(db.Model):
+    __tablename__ = "candidate_skill"
+    __table_args__ = (
+        # "Candidates with skill X"
+        db.Index("ix_candidate_skill_skill_candidate", "skill_id", "candidate_id"),
+    )
+
+    candidate_id = db.Column(db.Integer, db.ForeignKey("candidate.id"), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey("skill.id"), primary_key=True)
+    position = db.Column(db.Integer, nullable=False, default=0)
+
+
+# -------------------------------------------------------
+# PROCTORING (append-only log of the interview room's violations)
+# -------------------------------------------------------
+class ProctoringEvent(db.Model):
+    """
+    One detected violation of one interview. Repeats of the same type inside the coalescing
+    window are folded into the row (`occurrences` + `last_seen_at`) instead of adding rows.
+    """
+    __tablename__ = "proctoring_event"
+    __table_args__ = (
+        # Latest event per type of an interview (coalescing) + per-type summary
+        db.Index("ix_proctoring_event_application_type", "application_id", "type", "id"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, db.ForeignKey("application.id"), nullable=False)
+    type = db.Column(db.String(30), nullable=False)  # tab_switch, multiple_faces, no_face, multiple_voices
+    reason = db.Column(db.String(255), nullable=True)
+    penalty = db.Column(db.Integer, nullable=False, default=0)  # trust points this row took off
+    occurrences = db.Column(db.Integer, nullable=False, default=1)
+    occurred_at = db.Column(db.DateTime, nullable=False)  # first detection (browser clock, clamped)
+    last_seen_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# -------------------------------------------------------
+# EMAIL OUTBOX (sent by the background worker, never inside a request)
+# -------------------------------------------------------
+class EmailOutbox(db.Model):
+    """
+    One outgoing email. status: pending -> sending -> sent | failed
+    (pending again with a later send_after while retries remain).
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Sender: due messages, oldest first
+        db.Index("ix_email_outbox_status_send_after", "status", "send_after"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String(120), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    application_id = db.Column(db.Integer, nullable=True, index=True)  # what the email is about
+
+    status = db.Column(db.String(20), nullable=False, default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    last_error = db.Column(db.Text, nullable=True)
+
+    send_after = db.Column(db.DateTime, default=datetime.utcnow)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
@@ -0,0 +1,174 @@
+# backend/app/pdf_extractor.py
+# Page-streaming PDF text extraction (pdfminer) for resumes and JDs.
+#
+# - pages are laid out + cleaned one at a time, so a 50-page PDF never sits in memory twice
+# - "fast layout" LAParams skip the expensive reading-order analysis (fine for plain-text CVs)
+# - optional process pool: big PDFs are split into page ranges and parsed in parallel
+
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# ---------------------------------------------------------
+# ⚙️ SETTINGS (env overridable)
+# ---------------------------------------------------------
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", 50))  # 0 = no cap
+PDF_FAST_LAYOUT = os.getenv("PDF_FAST_LAYOUT", "1") == "1"
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", 0))  # 0 = never use the process pool
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 12))
+
+# boxes_flow=None turns off the advanced layout (reading order) analysis entirely.
+# Resumes are mostly single-column text, so this is much cheaper and loses nothing we use.
+FAST_LAYOUT_PARAMS = dict(
+    line_overlap=0.5,
+    char_margin=2.0,
+    line_margin=0.5,
+    word_margin=0.1,
+    boxes_flow=None,
+    detect_vertical=False,
+    all_texts=False,
+)
+
+# 🟢 Cleanup regexes compiled once (used per page, not on the whole document)
+# We keep . + # - to support "C++", "C#", "Node.js", "React-Native"
+_DISALLOWED_CHARS = re.compile(r'[^a-zA-Z0-9\s.+\-#]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+# pdfminer is imported on first use so importing the AI engine stays cheap
+def _laparams(fast_layout):
+    from pdfminer.layout import LAParams
+    return LAParams(**FAST_LAYOUT_PARAMS) if fast_layout else LAParams()
+
+
+def _extract_pages(pdf_path, **kwargs):
+    from pdfminer.high_level import extract_pages
+    return extract_pages(pdf_path, **kwargs)
+
+
+def _page_text(layout_page):
+    """
+    All text of a laid-out page, walked recursively like pdfminer's TextConverter: text in
+    figures (form XObjects - many resume builders draw whole sections that way) is only
+    loose characters inside an LTFigure, never a top-level text box.
+    """
+    from pdfminer.layout import LTContainer, LTFigure, LTText, LTTextBox
+
+    parts = []
+
+    def render(item):
+        if isinstance(item, LTContainer):
+            for child in item:
+                render(child)
+        elif isinstance(item, LTText):
+            parts.append(item.get_text())
+        if isinstance(item, (LTTextBox, LTFigure)):
+            parts.append("\n")  # a figure's last word must not run into the next block
+
+    render(layout_page)
+    return "".join(parts)
+
+
+def clean_resume_page(text):
+    """Resume normalization: strip odd symbols, collapse whitespace, lowercase."""
+    text = _DISALLOWED_CHARS.sub('', text)
+    return _WHITESPACE.sub(' ', text).strip().lower()
+
+
+def clean_jd_page(text):
+    """JD normalization: only fix spacing (newlines -> spaces), keep case + punctuation."""
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def page_count(pdf_path):
+    from pdfminer.pdfpage import PDFPage
+    with open(pdf_path, "rb") as fh:
+        return sum(1 for _ in PDFPage.get_pages(fh))
+
+
+def iter_pdf_pages(pdf_path, max_pages=None, fast_layout=None):
+    """Yields the raw text of each page, one page at a time."""
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    fast_layout = PDF_FAST_LAYOUT if fast_layout is None else fast_layout
+
+    for layout_page in _extract_pages(pdf_path, maxpages=max_pages, laparams=_laparams(fast_layout)):
+        yield _page_text(layout_page)
+
+
+# ---------------------------------------------------------
+# 🧵 PROCESS POOL (optional, for long PDFs)
+# ---------------------------------------------------------
+_pool = None
+_pool_lock = threading.Lock()
+
+CLEANERS = {"resume": clean_resume_page, "jd": clean_jd_page}
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _extract_page_range(pdf_path, page_numbers, fast_layout, mode):
+    """Runs in a child process: lays out + cleans only the given pages."""
+    cleaner = CLEANERS[mode]
+    parts = []
+    for layout_page in _extract_pages(pdf_path, page_numbers=page_numbers, laparams=_laparams(fast_layout)):
+        cleaned = cleaner(_page_text(layout_page))
+        if cleaned:
+            parts.append(cleaned)
+    return " ".join(parts)
+
+
+def _extract_parallel(pdf_path, total_pages, fast_layout, mode):
+    workers = max(1, PDF_WORKERS)
+    chunk = -(-total_pages // workers)  # ceil division
+    ranges = [list(range(start, min(start + chunk, total_pages))) for start in range(0, total_pages, chunk)]
+
+    pool = _get_pool()
+    results = pool.map(
+        _extract_page_range,
+        [pdf_path] * len(ranges),
+        ranges,
+        [fast_layout] * len(ranges),
+        [mode] * len(ranges),
+    )
+    return " ".join(part for part in results if part)
+
+
+def extract_clean_text(pdf_path, mode="resume", max_pages=None, fast_layout=None, stats=None):
+    """
+    Full cleaned text of a PDF. `mode` picks the cleanup ("resume" or "jd").
+    Cleanup runs incrementally per page; long PDFs fan out over the process pool
+    when PDF_WORKERS > 0. If `stats` is a dict, "pages" is recorded in it.
+    """
+    stats = stats if stats is not None else {}
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    fast_layout = PDF_FAST_LAYOUT if fast_layout is None else fast_layout
+    cleaner = CLEANERS[mode]
+
+    if PDF_WORKERS > 0:
+        total = page_count(pdf_path)
+        if max_pages:
+            total = min(total, max_pages)
+        if total >= PDF_PARALLEL_MIN_PAGES:
+            stats["pages"] = total
+            return _extract_parallel(pdf_path, total, fast_layout, mode)
+
+    parts = []
+    pages = 0
+    for page_text in iter_pdf_pages(pdf_path, max_pages=max_pages, fast_layout=fast_layout):
+        pages += 1
+        cleaned = cleaner(page_text)
+        if cleaned:
+            parts.append(cleaned)
+    stats["pages"] = pages
+    return " ".join(parts)
@@ -0,0 +1,246 @@
+# backend/app/proctoring.py
+# Proctoring events of the interview room (POST /api/applications/<id>/proctoring-events).
+#
+# - every violation is an append-only proctoring_event row (type, reason, when, penalty)
+# - the browser buffers detections and sends them in batches; one batch costs one INSERT
+#   (executemany) and one UPDATE of the application, where trust_score / tab_switches move
+#   with SQL arithmetic (trust_score = max(0, trust_score - n)) - parallel batches can't
+#   overwrite each other's penalties like the old read-modify-write could
+# - coalescing (the per-interview rate limit): a repeat of the same type within
+#   COALESCE_SECONDS of the newest row of that type (or older than it) is folded into it
+#   (occurrences + 1, no new penalty). A camera loop reporting "no face" every 5 s costs one
+#   penalty per 30 s, not six, and a re-sent batch costs nothing
+# - Application.feedback no longer collects "⚠️ reason" lines (they grew without bound and
+#   went out with every listing); summary() is computed from the events
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, func, insert, select, update
+
+from app import db
+
+# Trust points taken off per recorded (not coalesced) event
+PENALTIES = {"tab_switch": 5, "multiple_faces": 5, "no_face": 10, "multiple_voices": 5}
+COALESCE_SECONDS = {"tab_switch": 2, "multiple_faces": 30, "no_face": 30, "multiple_voices": 30}
+# Denormalized labels on Application (shown in the applicant list)
+FACE_LABELS = {"multiple_faces": "Multiple Faces", "no_face": "No Face Detected"}
+VOICE_LABELS = {"multiple_voices": "Multiple Voices"}
+
+MAX_BATCH_EVENTS = 100
+MAX_EVENT_AGE = timedelta(minutes=10)  # older browser timestamps are clamped to this
+MAX_REASON_LENGTH = 255
+RECENT_EVENTS = 20
+LEGACY_BATCH_SIZE = 500
+
+
+def parse_events(raw):
+    """
+    [{"type": "no_face", "reason": "...", "at": <epoch ms>}, ...] -> [(type, reason, datetime)]
+    sorted by time. `at` is optional (now) and clamped to the last MAX_EVENT_AGE.
+    Raises ValueError on anything malformed.
+    """
+    if not isinstance(raw, list) or not raw:
+        raise ValueError("'events' must be a non-empty list")
+    if len(raw) > MAX_BATCH_EVENTS:
+        raise ValueError(f"At most {MAX_BATCH_EVENTS} events per request")
+
+    now = datetime.utcnow()
+    events = []
+    for item in raw:
+        if not isinstance(item, dict) or item.get("type") not in PENALTIES:
+            raise ValueError(f"Event type must be one of: {', '.join(PENALTIES)}")
+        reason = str(item.get("reason") or "Suspicious Activity")[:MAX_REASON_LENGTH]
+        at = item.get("at")
+        if at is None:
+            occurred_at = now
+        elif isinstance(at, (int, float)) and not isinstance(at, bool):
+            occurred_at = datetime.utcfromtimestamp(at / 1000) if 0 < at < 1e14 else now
+            occurred_at = min(max(occurred_at, now - MAX_EVENT_AGE), now)
+        else:
+            raise ValueError("'at' must be epoch milliseconds")
+        events.append((item["type"], reason, occurred_at))
+    return sorted(events, key=lambda event: event[2])
+
+
+# ---------------------------------------------------------
+# ✍️ INGESTION (caller commits)
+# ---------------------------------------------------------
+def _latest_by_type(application_id):
+    """{type: {"id", "occurred_at"}} of the interview's newest row per type (coalescing targets)."""
+    from app.models import ProctoringEvent as Event
+
+    newest = select(func.max(Event.id)).where(Event.application_id == application_id).group_by(Event.type)
+    rows = db.session.execute(
+        select(Event.id, Event.type, Event.occurred_at).where(Event.id.in_(newest))
+    ).all()
+    return {row.type: {"id": row.id, "occurred_at": row.occurred_at, "folded": 0, "last_seen_at": None}
+            for row in rows}
+
+
+def ingest(application_id, events):
+    """
+    Records a parse_events() batch for one interview. Returns None if the application
+    doesn't exist, else {"received", "recorded", "coalesced", "new_trust_score"}.
+    """
+    from app.analytics import record_trust_change
+    from app.models import Application, ProctoringEvent as Event
+
+    # Row lock (Postgres / MySQL): batches of one interview coalesce against each other in order
+    current = db.session.execute(
+        select(Application.job_id, Application.trust_score)
+        .where(Application.id == application_id).with_for_update()
+    ).first()
+    if current is None:
+        return None
+
+    groups = _latest_by_type(application_id)
+    new_rows, coalesced = [], 0
+    for event_type, reason, occurred_at in events:
+        group = groups.get(event_type)
+        window = timedelta(seconds=COALESCE_SECONDS[event_type])
+        # Older than the row it would join = late or re-sent batch -> folded as well
+        if group and occurred_at < group["occurred_at"] + window:
+            if "id" in group:
+                group["folded"] += 1  # joins a row of an earlier batch
+            else:
+                group["occurrences"] += 1
+            group["last_seen_at"] = max(group["last_seen_at"] or occurred_at, occurred_at)
+            coalesced += 1
+            continue
+        group = {
+            "application_id": application_id, "type": event_type, "reason": reason,
+            "penalty": PENALTIES[event_type], "occurrences": 1,
+            "occurred_at": occurred_at, "last_seen_at": occurred_at, "created_at": datetime.utcnow(),
+        }
+        groups[event_type] = group
+        new_rows.append(group)
+
+    if new_rows:
+        db.session.execute(insert(Event), new_rows)
+    for group in groups.values():
+        if "id" in group and group["folded"]:
+            db.session.execute(update(Event).where(Event.id == group["id"]).values(
+                occurrences=Event.occurrences + group["folded"],
+                last_seen_at=case((Event.last_seen_at < group["last_seen_at"], group["last_seen_at"]),
+                                  else_=Event.last_seen_at),
+            ))
+
+    penalty = sum(row["penalty"] for row in new_rows)
+    values = {}
+    if penalty:
+        trust = func.coalesce(Application.trust_score, 100)
+        values["trust_score"] = case((trust > penalty, trust - penalty), else_=0)
+    tab_switches = sum(1 for row in new_rows if row["type"] == "tab_switch")
+    if tab_switches:
+        values["tab_switches"] = func.coalesce(Application.tab_switches, 0) + tab_switches
+    for column, labels in (("faces_detected", FACE_LABELS), ("voices_detected", VOICE_LABELS)):
+        latest = [row for row in new_rows if row["type"] in labels]
+        if latest:
+            values[column] = labels[latest[-1]["type"]]
+
+    old_trust = current.trust_score if current.trust_score is not None else 100
+    new_trust = old_trust
+    if values:
+        db.session.execute(update(Application).where(Application.id == application_id).values(**values))
+        new_trust = db.session.execute(
+            select(Application.trust_score).where(Application.id == application_id)
+        ).scalar()
+    if penalty:
+        record_trust_change(current.job_id, old_trust, new_trust)
+
+    return {"received": len(events), "recorded": len(new_rows), "coalesced": coalesced,
+            "new_trust_score": new_trust}
+
+
+def remove_job(job_id):
+    """Deletes the events of a job's applications (before the applications themselves)."""
+    from app.models import Application, ProctoringEvent as Event
+
+    db.session.query(Event).filter(
+        Event.application_id.in_(select(Application.id).where(Application.job_id == job_id))
+    ).delete(synchronize_session=False)
+
+
+# ---------------------------------------------------------
+# 📖 READING
+# ---------------------------------------------------------
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+def summary(application_id, recent=RECENT_EVENTS):
+    """Per-type counts / penalties (one GROUP BY on the events) plus the newest `recent` rows."""
+    from app.models import ProctoringEvent as Event
+
+    by_type = {}
+    for row in db.session.execute(
+        select(Event.type, func.count(), func.sum(Event.occurrences), func.sum(Event.penalty),
+               func.min(Event.occurred_at), func.max(Event.last_seen_at))
+        .where(Event.application_id == application_id).group_by(Event.type)
+    ).all():
+        by_type[row[0]] = {"events": row[1], "occurrences": int(row[2] or 0), "penalty": int(row[3] or 0),
+                           "first_at": _iso(row[4]), "last_at": _iso(row[5])}
+
+    latest = db.session.execute(
+        select(Event).where(Event.application_id == application_id).order_by(Event.id.desc()).limit(recent)
+    ).scalars().all()
+    return {
+        "total_events": sum(t["events"] for t in by_type.values()),
+        "total_penalty": sum(t["penalty"] for t in by_type.values()),
+        "by_type": by_type,
+        "recent": [{
+            "type": event.type, "reason": event.reason, "penalty": event.penalty,
+            "occurrences": event.occurrences,
+            "occurred_at": _iso(event.occurred_at), "last_seen_at": _iso(event.last_seen_at),
+        } for event in latest],
+    }
+
+
+# ---------------------------------------------------------
+# 🔁 LEGACY "⚠️ reason" LINES IN Application.feedback
+# ---------------------------------------------------------
+# What InterviewRoom.jsx used to send as `reason`
+LEGACY_REASON_TYPES = {
+    "Candidate switched tabs": "tab_switch",
+    "Visual: Multiple persons detected": "multiple_faces",
+    "Visual: No candidate detected": "no_face",
+    "Critical: Audio detected while candidate missing (Proxy Suspected)": "no_face",
+    "Audio: High conversation volume (Potential Coaching)": "multiple_voices",
+}
+
+
+def move_feedback_warnings(batch_size=LEGACY_BATCH_SIZE):
+    """
+    Turns the warning lines of old feedback into events (penalty 0 - trust_score already
+    has them; identical lines -> one row with occurrences) and strips them from the
+    feedback. Runs in the caller's transaction. Returns the number of applications changed.
+    """
+    from app.models import Application, ProctoringEvent as Event
+
+    last_id, changed = 0, 0
+    while True:
+        rows = db.session.query(Application.id, Application.feedback, Application.created_at).filter(
+            Application.id > last_id, Application.feedback.like("%⚠️%")
+        ).order_by(Application.id).limit(batch_size).all()
+        if not rows:
+            return changed
+
+        events, feedback = [], []
+        for row in rows:
+            lines = (row.feedback or "").split("\n")
+            warnings = Counter(line[len("⚠️"):].strip() for line in lines if line.startswith("⚠️"))
+            at = row.created_at or datetime.utcnow()
+            events += [{
+                "application_id": row.id, "type": LEGACY_REASON_TYPES.get(reason, "other"),
+                "reason": reason[:MAX_REASON_LENGTH], "penalty": 0, "occurrences": count,
+                "occurred_at": at, "last_seen_at": at, "created_at": datetime.utcnow(),
+            } for reason, count in warnings.items()]
+            kept = "\n".join(line for line in lines if not line.startswith("⚠️")).strip()
+            feedback.append({"id": row.id, "feedback": kept or None})
+
+        if events:
+            db.session.execute(insert(Event), events)
+        db.session.bulk_update_mappings(Application, feedback)
+        changed += len(rows)
+        last_id = rows[-1].id
@@ -0,0 +1,377 @@
+# backend/app/recommendations.py
+# Precomputed job recommendations + new-job alerts for candidates.
+#
+# - every (candidate, active job) match above MIN_SCORE is stored in job_recommendation,
+#   so the feed is one indexed, keyset-paginated read
+# - a job create/update re-scores only the candidates found through the reverse index
+#   (recommendation_term: preferred role / location / profile skill -> candidates)
+# - a preference / profile change re-scores that one candidate against the active jobs
+# - all of it runs in the background worker, never in the request
+
+import re
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+
+from app import db, artifact_cache
+from app.candidate_search import STOPWORDS
+from app.fuzzy_index import tokenize
+from app.skill_ontology import get_ontology
+from app.skills import candidate_skill_names, job_skill_names
+from app.task_queue import enqueue_once, task_handler
+
+RECOMMEND_JOB_TASK = "recommend_for_job"
+RECOMMEND_CANDIDATE_TASK = "recommend_for_candidate"
+
+MIN_SCORE = 15  # below this a job is not worth showing (keeps the table small)
+ALERT_MIN_SCORE = 60  # new jobs at least this good become alerts
+BATCH_SIZE = 500
+MAX_TERM_LENGTH = 64
+
+# Share of the 0-100 score each signal can contribute
+WEIGHTS = {"skills": 50, "role": 25, "location": 15, "experience": 5, "salary": 5}
+
+EXPERIENCE_LEVELS = {
+    "fresher": 0, "entry": 0, "intern": 0, "junior": 1,
+    "mid": 3, "intermediate": 3, "senior": 6, "lead": 8, "principal": 10,
+}
+
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(k|lpa|lakhs?|l)?\b", re.IGNORECASE)
+_AMOUNT_UNITS = {"k": 1_000, "l": 100_000, "lpa": 100_000, "lakh": 100_000, "lakhs": 100_000}
+
+
+def _terms(text):
+    return {
+        token for token in tokenize(text or "")
+        if token not in STOPWORDS and len(token) <= MAX_TERM_LENGTH
+    }
+
+
+def _amounts(text):
+    """"10-15 LPA" -> [1000000.0, 1500000.0]; "$80k" -> [80000.0]"""
+    matches = _NUMBER_RE.findall(text or "")
+    units = [unit.lower() for _, unit in matches if unit]
+    # "10-15 LPA": a single unit written after the last number applies to all of them
+    shared_multiplier = _AMOUNT_UNITS[units[0]] if len(units) == 1 else 1
+    return [
+        float(number) * (_AMOUNT_UNITS[unit.lower()] if unit else shared_multiplier)
+        for number, unit in matches
+    ]
+
+
+def _years(text):
+    """"3-5 years" -> 3.0, "Senior" -> 6, unknown -> None"""
+    if not text:
+        return None
+    match = _NUMBER_RE.search(text)
+    if match:
+        return float(match.group(1))
+    for word, years in EXPERIENCE_LEVELS.items():
+        if word in text.lower():
+            return years
+    return None
+
+
+# -------------------------------------------------------
+# PROFILES / JOBS
+# -------------------------------------------------------
+def _interest_terms(skills, preference):
+    terms = set()
+    for skill in skills:
+        terms |= _terms(skill)
+    if preference:
+        terms |= _terms(preference.preferred_role)
+        terms |= _terms(preference.preferred_location)
+    return terms
+
+
+def _load_profiles(candidate_ids):
+    """{candidate_id: profile dict} with skills, preferences and cached resume text."""
+    from app.ai_engine import PDF_EXTRACTOR_VERSION
+    from app.models import Candidate, CandidatePreference, CandidateSearchDoc
+
+    if not candidate_ids:
+        return {}
+
+    candidates = Candidate.query.filter(Candidate.id.in_(candidate_ids)).all()
+    skill_names = candidate_skill_names(candidates)
+    user_ids = [c.user_id for c in candidates if c.user_id]
+    preferences = {
+        p.user_id: p for p in CandidatePreference.query.filter(CandidatePreference.user_id.in_(user_ids)).all()
+    } if user_ids else {}
+
+    # Resume text: only what the search indexer already extracted (never run pdfminer here)
+    resume_hashes = dict(db.session.execute(
+        select(CandidateSearchDoc.candidate_id, CandidateSearchDoc.resume_hash)
+        .where(CandidateSearchDoc.candidate_id.in_(candidate_ids))
+    ).all())
+    resume_texts = artifact_cache.lookup_many(resume_hashes.values(), "resume", PDF_EXTRACTOR_VERSION)
+
+    ontology = get_ontology()
+    profiles = {}
+    for candidate in candidates:
+        preference = preferences.get(candidate.user_id)
+        skills = skill_names[candidate.id]
+        resume_text = resume_texts.get(resume_hashes.get(candidate.id)) or ""
+        skill_text = (" ".join(skills) + " " + resume_text).lower()
+
+        preferred_location = candidate.location
+        experience = candidate.experience
+        if preference:
+            preferred_location = preference.preferred_location or preferred_location
+            experience = preference.experience_level or experience
+
+        profiles[candidate.id] = {
+            "candidate": candidate,
+            "interest_terms": _interest_terms(skills, preference),
+            "skill_text": skill_text,
+            "skill_indexes": ontology.skill_indexes_in(skill_text),  # canonical skills, computed once per profile
+            "role_terms": _terms(preference.preferred_role) if preference else set(),
+            "location_terms": _terms(preferred_location),
+            "years": _years(experience),
+            "expected_salary": min(_amounts(preference.expected_salary), default=None) if preference else None,
+        }
+    return profiles
+
+
+def _job_info(job, skills_by_job):
+    """`skills_by_job`: job_skill_names() of the whole page of jobs (one query, not one per job)."""
+    skills = skills_by_job[job.id]
+    title_terms = _terms(job.title)
+    location_terms = _terms(job.location)
+    skill_terms = set()
+    for skill in skills:
+        skill_terms |= _terms(skill)
+
+    return {
+        "job": job,
+        "skills": skills,
+        "title_terms": title_terms,
+        "location_terms": location_terms,
+        "min_years": _years(job.experience_required),
+        "max_salary": max(_amounts(job.salary_range), default=None),
+        "terms": title_terms | location_terms | skill_terms,  # reverse index lookup keys
+    }
+
+
+def score_match(job_info, profile):
+    """(score 0-100, reasons) for one candidate / job pair."""
+    from app.skill_matcher import get_skill_matcher, normalize_pattern
+
+    score = 0.0
+    reasons = []
+
+    skills = job_info["skills"]
+    if skills and profile["skill_text"].strip():
+        matched, unknown = get_ontology().match_required(skills, profile["skill_indexes"])
+        if unknown:
+            found = get_skill_matcher(job_info["job"].id, [s.lower() for s in unknown], {}).find(profile["skill_text"])
+            matched += [s for s in unknown if normalize_pattern(s.lower()) in found]
+        if matched:
+            score += WEIGHTS["skills"] * len(matched) / len(skills)
+            reasons.append(f"Matches {len(matched)}/{len(skills)} skills: {', '.join(matched[:5])}")
+
+    role_terms = profile["role_terms"]
+    if role_terms:
+        overlap = role_terms & job_info["title_terms"]
+        if overlap:
+            score += WEIGHTS["role"] * len(overlap) / len(role_terms)
+            reasons.append("Matches your preferred role")
+
+    job_location = job_info["location_terms"]
+    if profile["location_terms"] & job_location or "remote" in job_location:
+        score += WEIGHTS["location"]
+        reasons.append("Remote" if "remote" in job_location else f"Located in {job_info['job'].location}")
+
+    if profile["years"] is not None and job_info["min_years"] is not None and profile["years"] >= job_info["min_years"]:
+        score += WEIGHTS["experience"]
+        reasons.append("Fits your experience")
+
+    if profile["expected_salary"] and job_info["max_salary"] and job_info["max_salary"] >= profile["expected_salary"]:
+        score += WEIGHTS["salary"]
+        reasons.append("Meets your expected salary")
+
+    return round(score, 1), reasons
+
+
+# -------------------------------------------------------
+# INCREMENTAL UPDATES
+# -------------------------------------------------------
+def _refresh_interest_terms(candidate_id, terms):
+    from app.models import RecommendationTerm
+
+    db.session.execute(delete(RecommendationTerm).where(RecommendationTerm.candidate_id == candidate_id))
+    if terms:
+        db.session.execute(insert(RecommendationTerm), [
+            {"term": term, "candidate_id": candidate_id} for term in terms
+        ])
+
+
+def _alert_state(key_column, condition):
+    """{key: (alerted_at, seen_at)} of the rows about to be replaced."""
+    from app.models import JobRecommendation
+
+    rows = db.session.execute(
+        select(key_column, JobRecommendation.alerted_at, JobRecommendation.seen_at).where(condition)
+    )
+    return {key: (alerted_at, seen_at) for key, alerted_at, seen_at in rows}
+
+
+def recommend_for_candidate(candidate_id):
+    """Re-scores one candidate against every active job (preference / profile changed)."""
+    from app.models import Job, JobRecommendation
+
+    profile = _load_profiles([candidate_id]).get(candidate_id)
+    old = _alert_state(JobRecommendation.job_id, JobRecommendation.candidate_id == candidate_id)
+    db.session.execute(delete(JobRecommendation).where(JobRecommendation.candidate_id == candidate_id))
+
+    if not profile:
+        _refresh_interest_terms(candidate_id, set())
+        db.session.commit()
+        return 0
+
+    _refresh_interest_terms(candidate_id, profile["interest_terms"])
+
+    now = datetime.utcnow()
+    stored = 0
+    last_id = 0
+    while True:
+        jobs = Job.query.filter(Job.is_active.is_(True), Job.id > last_id).order_by(Job.id).limit(BATCH_SIZE).all()
+        if not jobs:
+            break
+        skills_by_job = job_skill_names(jobs)
+        rows = []
+        for job in jobs:
+            score, reasons = score_match(_job_info(job, skills_by_job), profile)
+            if score < MIN_SCORE:
+                continue
+            previous = old.get(job.id)
+            rows.append({
+                "candidate_id": candidate_id, "job_id": job.id, "score": score, "reasons": reasons,
+                "computed_at": now,
+                # Re-scoring must not re-fire or forget alerts
+                "alerted_at": previous[0] if previous else None,
+                "seen_at": previous[1] if previous else None,
+            })
+        if rows:
+            db.session.execute(insert(JobRecommendation), rows)
+            stored += len(rows)
+        last_id = jobs[-1].id
+
+    db.session.commit()
+    print(f"💡 {stored} job recommendations for candidate {candidate_id}")
+    return stored
+
+
+def recommend_for_job(job_id, alert=True):
+    """
+    Re-scores one job for the candidates interested in any of its terms
+    (reverse index lookup, no scan over all candidates).
+    With `alert`, candidates seeing this job for the first time with a strong
+    match get a job alert.
+    """
+    from app.models import Job, JobRecommendation, RecommendationTerm
+
+    job = db.session.get(Job, job_id)
+    old = _alert_state(JobRecommendation.candidate_id, JobRecommendation.job_id == job_id)
+    db.session.execute(delete(JobRecommendation).where(JobRecommendation.job_id == job_id))
+
+    if not job or not job.is_active:
+        db.session.commit()
+        return 0
+
+    info = _job_info(job, job_skill_names([job]))
+    candidate_ids = [
+        row[0] for row in db.session.execute(
+            select(RecommendationTerm.candidate_id)
+            .where(RecommendationTerm.term.in_(info["terms"]))
+            .distinct()
+        )
+    ] if info["terms"] else []
+
+    now = datetime.utcnow()
+    stored = alerts = 0
+    for start in range(0, len(candidate_ids), BATCH_SIZE):
+        profiles = _load_profiles(candidate_ids[start:start + BATCH_SIZE])
+        rows = []
+        for candidate_id, profile in profiles.items():
+            score, reasons = score_match(info, profile)
+            if score < MIN_SCORE:
+                continue
+            previous = old.get(candidate_id)
+            alerted_at = previous[0] if previous else None
+            if alert and not previous and score >= ALERT_MIN_SCORE:
+                alerted_at = now
+                alerts += 1
+            rows.append({
+                "candidate_id": candidate_id, "job_id": job_id, "score": score, "reasons": reasons,
+                "computed_at": now, "alerted_at": alerted_at,
+                "seen_at": previous[1] if previous else None,
+            })
+        if rows:
+            db.session.execute(insert(JobRecommendation), rows)
+            stored += len(rows)
+        db.session.expunge_all()
+
+    db.session.commit()
+    print(f"💡 Job {job_id}: {stored} recommendations, {alerts} new alerts ({len(candidate_ids)} candidates checked)")
+    return stored
+
+
+def enqueue_job_recommendations(job_id):
+    return enqueue_once(RECOMMEND_JOB_TASK, {"job_id": job_id}, ref_id=job_id)
+
+
+def enqueue_candidate_recommendations(candidate_id):
+    return enqueue_once(RECOMMEND_CANDIDATE_TASK, {"candidate_id": candidate_id}, ref_id=candidate_id)
+
+
+@task_handler(RECOMMEND_JOB_TASK)
+def run_job_recommendations(payload):
+    recommend_for_job(payload.get("job_id"))
+
+
+@task_handler(RECOMMEND_CANDIDATE_TASK)
+def run_candidate_recommendations(payload):
+    recommend_for_candidate(payload.get("candidate_id"))
+
+
+# -------------------------------------------------------
+# FEED
+# -------------------------------------------------------
+def encode_cursor(score, job_id):
+    return f"{score}:{job_id}"
+
+
+def decode_cursor(cursor):
+    """"72.5:81" -> (72.5, 81); raises ValueError on garbage."""
+    score, job_id = cursor.split(":")
+    return float(score), int(job_id)
+
+
+def feed(candidate_id, limit=20, cursor=None):
+    """
+    One page of recommendations, best first. Keyset pagination on (score, job_id)
+    -> every page is an index range read, however many jobs exist.
+    Returns (rows, next_cursor) with rows = [(JobRecommendation, Job)].
+    """
+    from app.models import Job, JobRecommendation
+
+    query = db.session.query(JobRecommendation, Job).join(Job, Job.id == JobRecommendation.job_id).filter(
+        JobRecommendation.candidate_id == candidate_id,
+        Job.is_active.is_(True),
+    )
+    if cursor:
+        score, job_id = decode_cursor(cursor)
+        query = query.filter(
+            (JobRecommendation.score < score)
+            | ((JobRecommendation.score == score) & (JobRecommendation.job_id < job_id))
+        )
+
+    rows = query.order_by(JobRecommendation.score.desc(), JobRecommendation.job_id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1][0]
+        next_cursor = encode_cursor(last.score, last.job_id)
+    return rows, next_cursor
@@ -0,0 +1,234 @@
+# backend/app/rescoring.py
+# Bulk re-scoring of every application of a job (e.g. after HR edits required skills).
+#
+# Works from the extracted text already sitting in the artifact cache (looked up by
+# the resume/video hashes stored on each Application), in id-ordered batches, and
+# writes each batch back with one bulk UPDATE. pdfminer / speech recognition only
+# run for applications whose text is not cached any more.
+
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app import db, artifact_cache
+from app.analytics import SENTIMENT_COLUMNS, apply_deltas, sentiment_bucket
+from app.scoring import upload_path_from_url
+from app.skills import job_skill_names
+from app.task_queue import STALE_AFTER, TASK_PENDING, enqueue, heartbeat, task_handler
+
+RESCORE_TASK = "rescore_job"
+DEFAULT_BATCH_SIZE = 200
+# The task's lock is refreshed at least this often (every batch commit, and mid-batch when
+# re-extraction is slow) - well inside task_queue.STALE_AFTER
+HEARTBEAT_SECONDS = min(60, STALE_AFTER.total_seconds() / 3)
+
+# Applications the scoring worker still owns - it will read the new skills itself
+IN_FLIGHT_STATUSES = ("pending", "processing", "retrying")
+
+
+def start_rescore(job_id, reason="manual", queue=True):
+    """Creates a RescoreRun and (by default) queues it for the worker. Caller commits."""
+    from app.models import RescoreRun
+
+    run = RescoreRun(job_id=job_id, status="queued", reason=reason)
+    db.session.add(run)
+    db.session.flush()
+    if queue:
+        enqueue(RESCORE_TASK, {"run_id": run.id}, ref_id=run.id, max_attempts=2)
+    return run
+
+
+def remove_job(job_id):
+    """
+    Deletes a job's runs and their queued tasks (before the job itself). A run a worker is
+    executing right now notices at its next batch and stops.
+    """
+    from app.models import BackgroundTask, RescoreRun
+
+    run_ids = select(RescoreRun.id).where(RescoreRun.job_id == job_id)
+    BackgroundTask.query.filter(
+        BackgroundTask.kind == RESCORE_TASK,
+        BackgroundTask.ref_id.in_(run_ids),
+        BackgroundTask.status == TASK_PENDING,
+    ).delete(synchronize_session=False)
+    RescoreRun.query.filter_by(job_id=job_id).delete(synchronize_session=False)
+
+
+def _sentiment_from_graph(graph_data):
+    """(bonus, feedback) saved by the last scoring run, so TextBlob doesn't run again."""
+    if isinstance(graph_data, dict) and "sentiment_bonus" in graph_data:
+        return graph_data["sentiment_bonus"], graph_data.get("sentiment", "Neutral Tone")
+    return None
+
+
+def rescore_job(run_id, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """
+    Re-scores every finished application of the run's job.
+    `progress(processed, total)` is called after every batch.
+    """
+    from app.ai_engine import (
+        PDF_EXTRACTOR_VERSION, get_resume_text, get_video_transcript,
+        score_texts, video_transcript_version,
+    )
+    from app.models import Application, Job, RescoreRun
+
+    run = db.session.get(RescoreRun, run_id)
+    if not run or run.status in ("done", "superseded"):
+        return
+    job = db.session.get(Job, run.job_id)
+    if not job:
+        run.status = "failed"
+        run.error = "Job no longer exists"
+        run.finished_at = datetime.utcnow()
+        db.session.commit()
+        return
+
+    skills = job_skill_names([job])[job.id]
+    base_query = Application.query.filter(
+        Application.job_id == job.id,
+        Application.scoring_status.notin_(IN_FLIGHT_STATUSES)
+    )
+
+    run.status = "running"
+    run.started_at = datetime.utcnow()
+    run.total = base_query.count()
+    run.processed = 0
+    heartbeat(RESCORE_TASK, run.id)
+    db.session.commit()
+    last_heartbeat = time.monotonic()
+    print(f"🔁 Re-scoring {run.total} applications for job {job.id} (run {run.id})")
+
+    video_version = video_transcript_version()
+    last_id = 0
+
+    while True:
+        # A newer run for the same job makes this one pointless; no run at all = job deleted
+        newest = db.session.query(RescoreRun.id).filter(
+            RescoreRun.job_id == job.id,
+            RescoreRun.id >= run.id,
+            RescoreRun.status.in_(("queued", "running"))
+        ).order_by(RescoreRun.id.desc()).first()
+        if newest is None:
+            db.session.rollback()
+            print(f"⏭️ Re-score run {run_id} stopped: the job was deleted")
+            return
+        if newest.id != run.id:
+            run.status = "superseded"
+            run.finished_at = datetime.utcnow()
+            db.session.commit()
+            print(f"⏭️ Re-score run {run.id} superseded by run {newest.id}")
+            return
+
+        rows = db.session.query(
+            Application.id, Application.resume_url, Application.video_url,
+            Application.resume_hash, Application.video_hash,
+            Application.graph_data,
+            Application.score, Application.sentiment
+        ).filter(
+            Application.job_id == job.id,
+            Application.scoring_status.notin_(IN_FLIGHT_STATUSES),
+            Application.id > last_id
+        ).order_by(Application.id).limit(batch_size).all()
+
+        if not rows:
+            break
+
+        # One query per batch for all cached texts
+        resume_texts = artifact_cache.lookup_many([r.resume_hash for r in rows], "resume", PDF_EXTRACTOR_VERSION)
+        video_texts = artifact_cache.lookup_many([r.video_hash for r in rows], "video", video_version)
+
+        updates = []
+        rollup_deltas = defaultdict(int)
+        for row in rows:
+            if time.monotonic() - last_heartbeat > HEARTBEAT_SECONDS:
+                heartbeat(RESCORE_TASK, run.id)  # commits run.reextracted so far too
+                db.session.commit()
+                last_heartbeat = time.monotonic()
+            artifacts = {}
+
+            resume_text = resume_texts.get(row.resume_hash)
+            if resume_text is None:
+                resume_text = get_resume_text(upload_path_from_url(row.resume_url), artifacts)
+                run.reextracted += 1
+
+            video_text = video_texts.get(row.video_hash) if row.video_hash else None
+            if video_text is None:
+                video_text = get_video_transcript(upload_path_from_url(row.video_url), artifacts) if row.video_url else ""
+
+            score, feedback, graph_data, _ = score_texts(
+                resume_text, video_text, skills,
+                job_id=job.id,
+                sentiment=_sentiment_from_graph(row.graph_data),
+                verbose=False
+            )
+            sentiment = sentiment_bucket(graph_data)
+            rollup_deltas["score_sum"] += score - (row.score or 0)
+            if sentiment != row.sentiment:
+                rollup_deltas[SENTIMENT_COLUMNS.get(row.sentiment)] -= 1
+                rollup_deltas[SENTIMENT_COLUMNS.get(sentiment)] += 1
+
+            updates.append({
+                "id": row.id,
+                "score": score,
+                "feedback": feedback,
+                "graph_data": graph_data,
+                "sentiment": sentiment,
+                "scoring_status": "done",
+                "scoring_error": None,
+                "resume_hash": artifacts.get("resume_hash", row.resume_hash),
+                "video_hash": artifacts.get("video_hash", row.video_hash),
+            })
+
+        # Bulk UPDATE ... WHERE id = :id (executemany) instead of one flush per row
+        db.session.bulk_update_mappings(Application, updates)
+        apply_deltas(job.id, rollup_deltas)  # one rollup UPDATE per batch, same transaction
+        run.processed += len(rows)
+        heartbeat(RESCORE_TASK, run.id)
+        db.session.commit()
+        last_heartbeat = time.monotonic()
+
+        last_id = rows[-1].id
+        if progress:
+            progress(run.processed, run.total)
+
+    run.status = "done"
+    run.finished_at = datetime.utcnow()
+    db.session.commit()
+    print(f"✅ Re-score run {run.id} finished: {run.processed} applications ({run.reextracted} re-extracted)")
+
+
+def _on_rescore_failure(payload, error, final):
+    from app.models import RescoreRun
+
+    run = db.session.get(RescoreRun, payload.get("run_id"))
+    if run:
+        run.status = "failed" if final else "queued"
+        run.error = error[:2000]
+        if final:
+            run.finished_at = datetime.utcnow()
+
+
+@task_handler(RESCORE_TASK, process_pool=True, on_failure=_on_rescore_failure)
+def run_rescore_task(payload):
+    rescore_job(payload.get("run_id"))
+
+
+def serialize_run(run):
+    if not run:
+        return None
+    return {
+        "id": run.id,
+        "job_id": run.job_id,
+        "status": run.status,
+        "reason": run.reason,
+        "total": run.total,
+        "processed": run.processed,
+        "progress": round(run.processed * 100 / run.total, 1) if run.total else (100.0 if run.status == "done" else 0.0),
+        "reextracted": run.reextracted,
+        "error": run.error,
+        "created_at": run.created_at.isoformat() if run.created_at else None,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+        "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+    }
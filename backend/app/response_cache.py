@@ -0,0 +1,176 @@
+# backend/app/response_cache.py
+# In-process cache of rendered GET responses for the hottest read endpoints
+# (GET /api/jobs, GET /api/jobs/<id>) plus HTTP validators.
+#
+# - keyed by path + sorted query string; LRU, bounded by RESPONSE_CACHE_MAX_BYTES of
+#   cached bodies (0 disables the cache, validators are still sent)
+# - every entry carries a tag ("jobs"); create / update / delete job call
+#   invalidate("jobs") after their commit. A response rendered while an invalidation
+#   happened is not stored (per-tag generation check), so a stale body can't sneak back in
+# - invalidation is per process: other gunicorn workers / hosts serve the old body for
+#   at most RESPONSE_CACHE_TTL_SECONDS
+# - strong ETag = SHA-1 of the body; Last-Modified = what the view set (job.updated_at)
+#   or when the entry was rendered. Werkzeug answers If-None-Match / If-Modified-Since
+#   with a bodiless 304
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import current_app, request
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 30
+ENTRY_OVERHEAD_BYTES = 256  # key, headers and bookkeeping of one entry (rough)
+
+
+class _Entry:
+    __slots__ = ("body", "mimetype", "etag", "last_modified", "tag", "expires", "size")
+
+    def __init__(self, body, mimetype, last_modified, tag, expires, size):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.last_modified = last_modified
+        self.tag = tag
+        self.expires = expires
+        self.size = size
+
+
+_entries = OrderedDict()
+_generations = {}
+_bytes = 0
+_stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expired": 0, "invalidations": 0}
+_lock = threading.Lock()
+
+
+def _max_bytes():
+    return int(current_app.config.get("RESPONSE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+
+def _ttl_seconds():
+    return float(current_app.config.get("RESPONSE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+
+
+def cache_key():
+    """"/api/jobs?q=py&limit=20" and "/api/jobs?limit=20&q=py" share an entry."""
+    args = sorted(request.args.items(multi=True))
+    return f"{request.path}?{urlencode(args)}"
+
+
+def _drop(key):
+    global _bytes
+    entry = _entries.pop(key, None)
+    if entry is not None:
+        _bytes -= entry.size
+    return entry
+
+
+def _get(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry.expires <= time.monotonic():
+            _drop(key)
+            _stats["expired"] += 1
+            entry = None
+        if entry is None:
+            _stats["misses"] += 1
+            return None
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return entry
+
+
+def _store(key, tag, generation, entry):
+    global _bytes
+    max_bytes = _max_bytes()
+    with _lock:
+        # Invalidated while this response was being rendered -> it may be stale, don't keep it
+        if _generations.get(tag, 0) != generation or entry.size > max_bytes:
+            return
+        _drop(key)
+        _entries[key] = entry
+        _bytes += entry.size
+        _stats["stores"] += 1
+        while _bytes > max_bytes and _entries:
+            _drop(next(iter(_entries)))
+            _stats["evictions"] += 1
+
+
+def invalidate(tag):
+    """Drops every cached response of `tag` (call after the write committed)."""
+    with _lock:
+        _generations[tag] = _generations.get(tag, 0) + 1
+        for key in [key for key, entry in _entries.items() if entry.tag == tag]:
+            _drop(key)
+        _stats["invalidations"] += 1
+
+
+def clear():
+    with _lock:
+        for key in list(_entries):
+            _drop(key)
+
+
+def stats():
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else None,
+            "entries": len(_entries),
+            "bytes": _bytes,
+            "max_bytes": _max_bytes(),
+            "ttl_seconds": _ttl_seconds(),
+        }
+
+
+# ---------------------------------------------------------
+# 🎁 VIEW DECORATOR
+# ---------------------------------------------------------
+def cached_response(tag, cache_control="public, no-cache"):
+    """
+    Serves the view's 200 responses from the cache and adds ETag / Last-Modified /
+    Cache-Control; errors are never cached. "no-cache" = browsers and proxies may keep
+    the body but revalidate every time, which costs a 304 and no query here.
+    Put it below the auth decorators so the auth check still runs on every hit.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = cache_key()
+            entry = _get(key) if _max_bytes() > 0 else None
+            state = "HIT"
+
+            if entry is None:
+                state = "MISS"
+                with _lock:
+                    generation = _generations.get(tag, 0)
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+                body = response.get_data()
+                entry = _Entry(
+                    body=body,
+                    mimetype=response.mimetype,
+                    last_modified=response.last_modified or datetime.utcnow().replace(microsecond=0),
+                    tag=tag,
+                    expires=time.monotonic() + _ttl_seconds(),
+                    size=len(body) + len(key) + ENTRY_OVERHEAD_BYTES,
+                )
+                if _max_bytes() > 0:
+                    _store(key, tag, generation, entry)
+
+            response = current_app.response_class(entry.body, status=200, mimetype=entry.mimetype)
+            response.set_etag(entry.etag)
+            response.last_modified = entry.last_modified
+            response.headers["Cache-Control"] = cache_control
+            response.headers["X-Cache"] = state
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
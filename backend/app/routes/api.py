@@ -1,25 +1,33 @@
 # backend/app/routes/api.py
 print("🔥 api.py has been loaded by Flask")
 
-# Add this at the top with your other imports
-from pdfminer.high_level import extract_text
-from app.ai_engine import calculate_ai_score, extract_text_from_pdf, extract_name_from_text
-from flask_mail import Message
-from app import mail
-from flask import Blueprint, request, jsonify, current_app
+from app.ai_engine import get_jd_text
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
-from app.models import User, Job, Candidate, Application, CandidatePreference
+from app.models import User, Job, Candidate, Application, CandidatePreference, BackgroundTask, RescoreRun, JobRecommendation
+from app.scoring import enqueue_scoring, SCORING_TASK
+from app.rescoring import start_rescore, serialize_run, remove_job as remove_job_rescores
+from app.candidate_search import enqueue_indexing, search as search_candidates_index
+from app import analytics, bulk_status, email_outbox, job_search, proctoring, response_cache
+from app.skills import (
+    set_job_skills, set_candidate_skills, remove_job as remove_job_skills,
+    job_skill_names, candidate_skill_names, find_skill, candidates_with_skill
+)
+from app.job_listing import (
+    list_jobs_page, VIEWS as JOB_VIEWS, DEFAULT_PAGE_SIZE as JOBS_PAGE_SIZE, MAX_PAGE_SIZE as JOBS_MAX_PAGE_SIZE
+)
+from app.recommendations import (
+    enqueue_job_recommendations, enqueue_candidate_recommendations, feed as recommendation_feed
+)
 from flask_jwt_extended import verify_jwt_in_request
 from flask_cors import cross_origin
-import smtplib
-import ssl
-from email.message import EmailMessage
 import os
 import uuid
 import json
 from werkzeug.utils import secure_filename
-from sqlalchemy import text
+from sqlalchemy import text, func
+from sqlalchemy.exc import IntegrityError
 from flask_jwt_extended import (
     jwt_required,
     get_jwt,
@@ -27,11 +35,14 @@ from flask_jwt_extended import (
     create_access_token
 )
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 api_bp = Blueprint("api", __name__)
 ACCESS_EXPIRES = timedelta(hours=4)
 
+# Hiring pipeline: every application starts "Applied", HR moves it to one of the others
+PIPELINE_STATUSES = ("Applied", "Shortlisted", "Hired", "Rejected")
+
 
 # -------------------------------------------------------
 # ROLE CHECK DECORATOR
@@ -84,7 +95,13 @@ def register():
     hashed = generate_password_hash(password)
     user = User(email=email, password_hash=hashed, role=role)
     db.session.add(user)
-    db.session.commit()
+    try:
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        if not User.query.filter_by(email=email).first():
+            raise
+        return jsonify({"error": "Email already exists"}), 400  # Same email registered in parallel
 
     if role == "candidate":
         new_candidate = Candidate(
@@ -111,21 +128,13 @@ def get_current_candidate():
     if not candidate:
         return jsonify({"error": "Profile not found"}), 404
 
-    # Safe Skills Loader
-    skills_data = candidate.skills
-    if isinstance(skills_data, str):
-        try:
-            skills_data = json.loads(skills_data)
-        except:
-            skills_data = [skills_data] if skills_data else []
-
     return jsonify({
         "id": candidate.id,
         "name": candidate.name,
         "email": user.email,
         "phone": candidate.phone,
         "location": candidate.location,
-        "skills": skills_data,
+        "skills": candidate_skill_names([candidate])[candidate.id],
         "experience": candidate.experience,
         "education": getattr(candidate, 'education', ""),
         "resume": candidate.resume_url
@@ -200,6 +209,7 @@ def update_candidate_profile():
                     candidate.skills = json.dumps([s.strip() for s in raw_skills.split(",")])
                 else:
                     candidate.skills = json.dumps([raw_skills.strip()])
+            set_candidate_skills(candidate.id, candidate.skills)
 
         # 4. FIX RESUME (File OR Link)
         file = request.files.get("resume")
@@ -217,6 +227,7 @@ def update_candidate_profile():
             candidate.resume_url = data["resume_url"]
             print(f"   ✅ Resume URL Preserved: {candidate.resume_url}")
 
+        enqueue_indexing(candidate.id)  # Keep the HR talent search up to date
         db.session.commit()
         return jsonify({"message": "Profile updated", "name": candidate.name}), 200
 
@@ -247,16 +258,9 @@ def parse_jd():
         temp_path = os.path.join(current_app.config["UPLOAD_FOLDER"], f"temp_{uuid.uuid4().hex}_{filename}")
         file.save(temp_path)
 
-        # 🟢 BYPASS THE HELPER: Use pdfminer directly to get RAW text
-        # This ensures no spaces are stripped by your other functions
-        raw_text = extract_text(temp_path)
-
-        # 🟢 FORCE SPACING: Convert newlines to spaces
-        # This turns "Developer\nJob" -> "Developer Job"
-        clean_text = raw_text.replace('\n', ' ').replace('\r', ' ')
-
-        # Remove multiple spaces
-        final_text = " ".join(clean_text.split())
+        # 🟢 Raw JD text (spacing fixed, case kept) - served from the artifact cache
+        # when this exact PDF was parsed before
+        final_text = get_jd_text(temp_path)
 
         # Cleanup
         if temp_path and os.path.exists(temp_path):
@@ -329,7 +333,12 @@ def create_job():
 
         job = Job(**job_kwargs)
         db.session.add(job)
+        db.session.flush()
+        set_job_skills(job.id, job.required_skills)
+        job_search.index_job(job.id)
+        enqueue_job_recommendations(job.id)  # Match + alert interested candidates in the background
         db.session.commit()
+        response_cache.invalidate("jobs")
         return jsonify({"message": "Job Created", "job_id": job.id}), 201
 
     except Exception as e:
@@ -358,8 +367,12 @@ def get_jobs():
     # Fetch jobs
     jobs = Job.query.filter_by(created_by=current_user).order_by(Job.created_at.desc()).all()
 
+    # One grouped query for the whole pipeline breakdown (no per-job lazy load of applications)
+    counts = _pipeline_counts(Job.created_by == current_user)
+
     job_list = []
     for j in jobs:
+        status_counts = counts.get(j.id, _empty_pipeline())
         job_list.append({
             "id": j.id,
             "title": j.title,
@@ -373,23 +386,47 @@ def get_jobs():
             "jd_upload": j.jd_upload,
             "created_by": j.created_by,
             "created_at": j.created_at.strftime("%Y-%m-%d %H:%M:%S") if j.created_at else None,
-            "application_count": len(j.applications) if j.applications else 0
+            "application_count": status_counts["total"],
+            "status_counts": status_counts
         })
 
     return jsonify({"jobs": job_list}), 200
 
 
+def _empty_pipeline():
+    counts = {status: 0 for status in PIPELINE_STATUSES}
+    counts["total"] = 0
+    return counts
+
+
+def _pipeline_counts(*job_filters):
+    """{job_id: {"Applied": n, "Shortlisted": n, "Hired": n, "Rejected": n, "total": n}} in one query."""
+    rows = db.session.query(Application.job_id, Application.status, func.count(Application.id)) \
+        .join(Job, Job.id == Application.job_id) \
+        .filter(*job_filters) \
+        .group_by(Application.job_id, Application.status) \
+        .all()
+
+    counts = {}
+    for job_id, status, count in rows:
+        job_counts = counts.setdefault(job_id, _empty_pipeline())
+        job_counts[status or "Applied"] = job_counts.get(status or "Applied", 0) + count
+        job_counts["total"] += count
+    return counts
+
+
 # -------------------------------------------------------
 # GET SINGLE JOB (SAFE READ)
 # -------------------------------------------------------
 @api_bp.route("/jobs/<int:job_id>", methods=["GET"])
 @jwt_required()
+@response_cache.cached_response("jobs", cache_control="private, no-cache")
 def get_job(job_id):
     job = Job.query.get(job_id)
     if not job:
         return jsonify({"error": "Job not found"}), 404
 
-    return jsonify({
+    response = jsonify({
         "job": {
             "id": job.id,
             "title": job.title,
@@ -402,9 +439,12 @@ def get_job(job_id):
             "salary_range": getattr(job, "salary_range", None),
             "jd_upload": job.jd_upload,
             "created_by": job.created_by,
-            "created_at": job.created_at.isoformat() if job.created_at else None
+            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "updated_at": job.updated_at.isoformat() if job.updated_at else None
         }
-    }), 200
+    })
+    response.last_modified = job.updated_at or job.created_at
+    return response
 
 
 # -------------------------------------------------------
@@ -452,21 +492,64 @@ def update_job(job_id):
 
     # 3. Update Skills
     skills = data.get("required_skills") or data.get("requiredSkills")
+    old_skills = job_skill_names([job])[job.id]
 
     if skills is not None:
         if isinstance(skills, list):
             job.required_skills = json.dumps(skills)
         else:
             job.required_skills = skills
+        set_job_skills(job.id, job.required_skills)
+
+    # 🟢 Skills changed -> every existing score is stale, re-score them in the background
+    # (compared as canonical skills: "React" -> "ReactJS" is not a change)
+    rescore_run = None
+    if job_skill_names([job])[job.id] != old_skills:
+        rescore_run = start_rescore(job.id, reason="skills_changed")
 
+    job_search.index_job(job.id)
+    enqueue_job_recommendations(job.id)
     db.session.commit()
+    response_cache.invalidate("jobs")
     return jsonify({
         "message": "Job updated successfully",
         "salary_range": getattr(job, "salary_range", None),
-        "required_skills": job.required_skills
+        "required_skills": job.required_skills,
+        "rescore": serialize_run(rescore_run)
     }), 200
 
 
+# -------------------------------------------------------
+# BULK RE-SCORE (HR) - recompute every application of a job
+# -------------------------------------------------------
+@api_bp.route("/hr/jobs/<int:job_id>/rescore", methods=["POST"])
+@cross_origin()
+@role_required("hr")
+def rescore_job_applications(job_id):
+    job = Job.query.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    active = RescoreRun.query.filter(
+        RescoreRun.job_id == job_id,
+        RescoreRun.status.in_(("queued", "running"))
+    ).order_by(RescoreRun.id.desc()).first()
+    if active:
+        return jsonify({"message": "Re-score already in progress", "rescore": serialize_run(active)}), 409
+
+    run = start_rescore(job_id, reason="manual")
+    db.session.commit()
+    return jsonify({"message": "Re-score queued", "rescore": serialize_run(run)}), 202
+
+
+@api_bp.route("/hr/jobs/<int:job_id>/rescore", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def get_rescore_progress(job_id):
+    run = RescoreRun.query.filter_by(job_id=job_id).order_by(RescoreRun.id.desc()).first()
+    return jsonify({"rescore": serialize_run(run)}), 200
+
+
 # -------------------------------------------------------
 # DELETE JOB (HR ONLY)
 # -------------------------------------------------------
@@ -480,11 +563,17 @@ def delete_job(job_id):
 
     try:
         # 🟢 FIX: Manually delete applications first (Cascade Delete)
+        proctoring.remove_job(job.id)
         Application.query.filter_by(job_id=job.id).delete()
+        JobRecommendation.query.filter_by(job_id=job.id).delete()
+        analytics.remove_job(job.id)
+        remove_job_skills(job.id)
+        remove_job_rescores(job.id)
 
         # Now delete the job
         db.session.delete(job)
         db.session.commit()
+        response_cache.invalidate("jobs")
         return jsonify({"message": "Job and associated applications deleted successfully"}), 200
 
     except Exception as e:
@@ -516,10 +605,111 @@ def create_candidate():
     )
 
     db.session.add(candidate)
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        # Created by a parallel request in between (ux_candidate_user_id)?
+        existing = Candidate.query.filter_by(user_id=user_id).first()
+        if not existing:
+            raise
+        return jsonify({"message": "Candidate profile already exists", "id": existing.id}), 200
+    set_candidate_skills(candidate.id, candidate.skills)
+    enqueue_indexing(candidate.id)
     db.session.commit()
     return jsonify({"message": "Candidate profile created", "candidate_id": candidate.id}), 201
 
 
+# -------------------------------------------------------
+# HR TALENT SEARCH (BM25 over every candidate's resume + profile)
+# -------------------------------------------------------
+@api_bp.route("/hr/candidates/search", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def search_candidates():
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"error": "Query parameter 'q' is required"}), 400
+
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 20, type=int)
+    match = request.args.get("match")  # "all" / "any" (default: "all" if the query contains AND)
+    if match not in (None, "all", "any"):
+        return jsonify({"error": "match must be 'all' or 'any'"}), 400
+
+    found = search_candidates_index(query, page=page, per_page=per_page, match=match)
+
+    # One query for the profiles of this page only
+    ids = [hit["candidate_id"] for hit in found["results"]]
+    profiles = {c.id: c for c in Candidate.query.filter(Candidate.id.in_(ids)).all()} if ids else {}
+    skill_names = candidate_skill_names(profiles.values())
+
+    results = []
+    for hit in found["results"]:
+        candidate = profiles.get(hit["candidate_id"])
+        if not candidate:
+            continue
+        results.append({
+            "candidate_id": candidate.id,
+            "name": candidate.name,
+            "email": candidate.email,
+            "location": candidate.location,
+            "experience": candidate.experience,
+            "skills": skill_names[candidate.id],
+            "resume_url": candidate.resume_url,
+            "score": hit["score"],
+            "matched_terms": hit["matched_terms"],
+        })
+
+    return jsonify({
+        "query": query,
+        "terms": found["terms"],
+        "page": found["page"],
+        "per_page": found["per_page"],
+        "total": found["total"],
+        "total_is_estimate": found["total_is_estimate"],  # a very common term was only read top-down
+        "exact": found["exact"],
+        "results": results,
+    }), 200
+
+
+# -------------------------------------------------------
+# HR: CANDIDATES WITH A SKILL (candidate_skill join, keyset on candidate id)
+#   ?skill=react&limit=50&cursor=...
+# -------------------------------------------------------
+@api_bp.route("/hr/candidates", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def list_candidates_with_skill():
+    name = request.args.get("skill", "").strip()
+    if not name:
+        return jsonify({"error": "Query parameter 'skill' is required"}), 400
+
+    limit = max(1, min(request.args.get("limit", 50, type=int), 200))
+    skill = find_skill(name)
+    if not skill:
+        return jsonify({"skill": name, "candidates": [], "next_cursor": None}), 200
+
+    try:
+        ids, next_cursor = candidates_with_skill(skill.id, limit=limit, cursor=request.args.get("cursor"))
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    profiles = {c.id: c for c in Candidate.query.filter(Candidate.id.in_(ids)).all()} if ids else {}
+    skill_names = candidate_skill_names(profiles.values())
+    candidates = [{
+        "candidate_id": c.id,
+        "name": c.name,
+        "email": c.email,
+        "location": c.location,
+        "experience": c.experience,
+        "skills": skill_names[c.id],
+        "resume_url": c.resume_url,
+    } for c in (profiles.get(cid) for cid in ids) if c]
+
+    return jsonify({"skill": skill.name, "candidates": candidates, "next_cursor": next_cursor}), 200
+
+
 # -------------------------------------------------------
 # APPLY JOB
 # -------------------------------------------------------
@@ -533,6 +723,7 @@ def apply_job(job_id):
     if not candidate:
         return jsonify({"error": "Candidate not found"}), 404
 
+    # Fast path only - ux_application_job_candidate is what actually prevents double applies
     existing = Application.query.filter_by(job_id=job_id, candidate_id=candidate.id).first()
     if existing:
         return jsonify({"message": "Already applied"}), 409
@@ -558,42 +749,12 @@ def apply_job(job_id):
         video.save(video_path)
         video_url = f"/api/upload/files/{unique_video_name}"
 
-        # --- AI SCORING (FIXED) ---
-        job = Job.query.get(job_id)
-        ai_score = 0
-        ai_feedback = "AI scoring failed or skipped."
-        ai_graph = None
-        extracted_name = "New Candidate"
-
-        if job and job.required_skills and resume_path:
-            try:
-                # 🟢 1. CLEAN THE SKILLS (Convert String -> List)
-                skills_for_ai = []
-
-                raw_skills = job.required_skills
-
-                # Check if it's JSON format (e.g., '["Java", "Python"]')
-                try:
-                    skills_for_ai = json.loads(raw_skills)
-                except:
-                    # If not JSON, assume comma-separated (e.g., "Java, Python")
-                    if isinstance(raw_skills, str):
-                        skills_for_ai = [s.strip() for s in raw_skills.split(",") if s.strip()]
-
-                # 🟢 2. PASS THE LIST TO AI ENGINE
-                # (Now the AI receives ["LAN configuration", "Laptop setup"] correctly)
-                ai_score, ai_feedback, ai_graph, extracted_name = calculate_ai_score(
-                    resume_path,
-                    video_path,
-                    skills_for_ai
-                )
-            except Exception as e:
-                print(f"🔥 AI ENGINE CRASHED: {e}")
-
+    # 🟢 AI scoring is NOT done here any more: the application is saved as "pending"
+    # and the background worker (app/task_queue.py) scores it. Poll /applications/<id>/scoring.
     form_name = request.form.get("full_name")
     final_name = form_name
     if not final_name or final_name == "New Candidate" or final_name == "null":
-        final_name = extracted_name
+        final_name = "New Candidate"  # Worker replaces this with the name found in the resume
 
     application = Application(
         job_id=job_id,
@@ -605,14 +766,128 @@ def apply_job(job_id):
         resume_url=resume_url,
         video_url=video_url,
         status="Applied",
-        score=ai_score,
-        feedback=ai_feedback,
-        graph_data=ai_graph
+        score=0,
+        feedback="⏳ AI scoring in progress...",
+        graph_data=None
     )
 
     db.session.add(application)
+    try:
+        db.session.flush()  # Need the id for the task payload
+    except IntegrityError:
+        db.session.rollback()
+        for path in (resume_path, video_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+        # Lost a race with a parallel submit of the same application?
+        if Application.query.filter_by(job_id=job_id, candidate_id=candidate.id).first():
+            return jsonify({"message": "Already applied"}), 409
+        raise
+    analytics.record_application(application)
+    enqueue_scoring(application)
+    db.session.commit()
+
+    return jsonify({
+        "message": "Applied successfully",
+        "application_id": application.id,
+        "scoring_status": application.scoring_status,
+        "status_url": f"/api/applications/{application.id}/scoring"
+    }), 201
+
+
+# -------------------------------------------------------
+# AI SCORING STATUS (poll after applying)
+# -------------------------------------------------------
+@api_bp.route("/applications/<int:app_id>/scoring", methods=["GET"])
+@jwt_required()
+def get_scoring_status(app_id):
+    app_record = Application.query.get(app_id)
+    if not app_record:
+        return jsonify({"error": "Application not found"}), 404
+
+    # Candidates can only see their own applications
+    claims = get_jwt()
+    is_hr = claims.get("role") == "hr"
+    if not is_hr:
+        candidate = Candidate.query.filter_by(user_id=get_jwt_identity()).first()
+        if not candidate or candidate.id != app_record.candidate_id:
+            return jsonify({"error": "Forbidden"}), 403
+
+    task = BackgroundTask.query.filter(
+        BackgroundTask.kind == SCORING_TASK,
+        BackgroundTask.ref_id == app_id
+    ).order_by(BackgroundTask.id.desc()).first()
+
+    result = {
+        "application_id": app_record.id,
+        "scoring_status": app_record.scoring_status,
+        "attempts": task.attempts if task else 0,
+        "max_attempts": task.max_attempts if task else 0,
+        "next_retry_at": task.run_after.isoformat() if task and app_record.scoring_status == "retrying" else None,
+    }
+    if is_hr and app_record.scoring_error:
+        result["error"] = app_record.scoring_error
+
+    if app_record.scoring_status == "done":
+        result.update({
+            "score": app_record.score,
+            "feedback": app_record.feedback,
+            "graph_data": app_record.graph_data,
+        })
+        if is_hr:
+            result["metrics"] = app_record.scoring_metrics
+
+    return jsonify(result), 200
+
+
+# -------------------------------------------------------
+# SCORING PIPELINE METRICS (per-stage latency histograms)
+# -------------------------------------------------------
+@api_bp.route("/hr/metrics/scoring", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def get_scoring_metrics():
+    from app.scoring_metrics import summarize_histograms
+    return jsonify({"stages": summarize_histograms()}), 200
+
+
+# -------------------------------------------------------
+# RESPONSE CACHE STATS (hit / miss counters of this process)
+# -------------------------------------------------------
+@api_bp.route("/hr/metrics/cache", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def get_cache_metrics():
+    return jsonify(response_cache.stats()), 200
+
+
+# -------------------------------------------------------
+# EMAIL OUTBOX STATS (queued / sent / failed notifications)
+# -------------------------------------------------------
+@api_bp.route("/hr/metrics/outbox", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def get_outbox_metrics():
+    return jsonify(email_outbox.stats()), 200
+
+
+# -------------------------------------------------------
+# RE-RUN AI SCORING (HR) - e.g. after a "failed" status
+# -------------------------------------------------------
+@api_bp.route("/hr/applications/<int:app_id>/rescore", methods=["POST"])
+@cross_origin()
+@role_required("hr")
+def retry_scoring(app_id):
+    app_record = Application.query.get(app_id)
+    if not app_record:
+        return jsonify({"error": "Application not found"}), 404
+
+    if app_record.scoring_status in ("pending", "processing", "retrying"):
+        return jsonify({"message": "Scoring already queued", "scoring_status": app_record.scoring_status}), 409
+
+    enqueue_scoring(app_record)
     db.session.commit()
-    return jsonify({"message": "Applied successfully"}), 201
+    return jsonify({"message": "Scoring queued", "scoring_status": app_record.scoring_status}), 202
 
 
 # ------------------------------
@@ -652,20 +927,23 @@ def create_or_update_preferences():
 
     pref = CandidatePreference.query.filter_by(user_id=user_id).first()
     if not pref:
-        pref = CandidatePreference(
-            user_id=user_id,
-            preferred_role=preferred_role,
-            preferred_location=preferred_location,
-            experience_level=experience_level,
-            expected_salary=expected_salary
-        )
+        pref = CandidatePreference(user_id=user_id)
         db.session.add(pref)
-    else:
-        pref.preferred_role = preferred_role
-        pref.preferred_location = preferred_location
-        pref.experience_level = experience_level
-        pref.expected_salary = expected_salary
-
+        try:
+            db.session.flush()
+        except IntegrityError:
+            # A parallel save created the row first (ux_candidate_preferences_user_id) -> update that one
+            db.session.rollback()
+            pref = CandidatePreference.query.filter_by(user_id=user_id).first()
+            if not pref:
+                raise
+
+    pref.preferred_role = preferred_role
+    pref.preferred_location = preferred_location
+    pref.experience_level = experience_level
+    pref.expected_salary = expected_salary
+
+    _refresh_recommendations_for_user(user_id)
     db.session.commit()
     return jsonify({"message": "Preferences saved", "preferences_id": pref.id}), 201
 
@@ -684,29 +962,153 @@ def patch_preferences():
         if field in data:
             setattr(pref, field, data[field])
 
+    _refresh_recommendations_for_user(user_id)
     db.session.commit()
     return jsonify({"message": "Preferences updated"}), 200
 
 
+def _refresh_recommendations_for_user(user_id):
+    candidate = Candidate.query.filter_by(user_id=user_id).first()
+    if candidate:
+        enqueue_candidate_recommendations(candidate.id)
+
+
+# -------------------------------------------------------
+# RECOMMENDED JOBS FEED (precomputed, keyset paginated)
+# -------------------------------------------------------
+@api_bp.route("/candidate/recommendations", methods=["GET"])
+@jwt_required()
+def get_recommendations():
+    candidate = Candidate.query.filter_by(user_id=get_jwt_identity()).first()
+    if not candidate:
+        return jsonify({"recommendations": [], "next_cursor": None}), 200
+
+    limit = max(1, min(request.args.get("limit", 20, type=int), 100))
+    try:
+        rows, next_cursor = recommendation_feed(candidate.id, limit=limit, cursor=request.args.get("cursor"))
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    return jsonify({
+        "recommendations": [_serialize_recommendation(rec, job) for rec, job in rows],
+        "next_cursor": next_cursor
+    }), 200
+
+
+@api_bp.route("/candidate/job-alerts", methods=["GET"])
+@jwt_required()
+def get_job_alerts():
+    candidate = Candidate.query.filter_by(user_id=get_jwt_identity()).first()
+    if not candidate:
+        return jsonify({"alerts": []}), 200
+
+    rows = db.session.query(JobRecommendation, Job).join(Job, Job.id == JobRecommendation.job_id).filter(
+        JobRecommendation.candidate_id == candidate.id,
+        JobRecommendation.alerted_at.isnot(None),
+        JobRecommendation.seen_at.is_(None),
+        Job.is_active.is_(True)
+    ).order_by(JobRecommendation.alerted_at.desc()).limit(50).all()
+
+    return jsonify({"alerts": [_serialize_recommendation(rec, job) for rec, job in rows]}), 200
+
+
+@api_bp.route("/candidate/job-alerts/seen", methods=["POST"])
+@jwt_required()
+def mark_job_alerts_seen():
+    candidate = Candidate.query.filter_by(user_id=get_jwt_identity()).first()
+    if not candidate:
+        return jsonify({"error": "Candidate not found"}), 404
+
+    job_ids = (request.get_json(silent=True) or {}).get("job_ids")  # None = all alerts
+    query = JobRecommendation.query.filter(
+        JobRecommendation.candidate_id == candidate.id,
+        JobRecommendation.alerted_at.isnot(None),
+        JobRecommendation.seen_at.is_(None)
+    )
+    if job_ids:
+        query = query.filter(JobRecommendation.job_id.in_(job_ids))
+
+    updated = query.update({JobRecommendation.seen_at: datetime.utcnow()}, synchronize_session=False)
+    db.session.commit()
+    return jsonify({"message": "Alerts marked as seen", "updated": updated}), 200
+
+
+def _serialize_recommendation(rec, job):
+    return {
+        "job_id": job.id,
+        "title": job.title,
+        "location": job.location,
+        "experience_required": job.experience_required,
+        "salary_range": getattr(job, "salary_range", None),
+        "required_skills": job.required_skills,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "match_score": rec.score,
+        "reasons": rec.reasons or [],
+        "alerted_at": rec.alerted_at.isoformat() if rec.alerted_at else None,
+    }
+
+
+# -------------------------------------------------------
+# PUBLIC JOB LISTING (server-side filters + keyset pagination)
+#   ?q=python&location=pune&skill=react&is_active=true&created_by=3&limit=20&cursor=...&view=summary|full
+# -------------------------------------------------------
 @api_bp.route("/jobs", methods=["GET"])
+@response_cache.cached_response("jobs")
 def list_jobs():
-    jobs = Job.query.order_by(Job.created_at.desc()).all()
-    result = []
-    for j in jobs:
-        result.append({
-            "id": j.id,
-            "title": j.title,
-            "description": j.description,
-            "required_skills": j.required_skills,
-            "location": j.location,
-            "experience_required": j.experience_required,
-            # 🟢 SAFE READ
-            "salary_range": getattr(j, "salary_range", None),
-            "jd_upload": j.jd_upload,
-            "created_by": j.created_by,
-            "created_at": j.created_at.isoformat() if j.created_at else None,
-        })
-    return jsonify({"jobs": result}), 200
+    view = request.args.get("view", "summary")
+    if view not in JOB_VIEWS:
+        return jsonify({"error": "view must be 'summary' or 'full'"}), 400
+
+    is_active = request.args.get("is_active")
+    if is_active not in (None, "", "true", "false"):
+        return jsonify({"error": "is_active must be 'true' or 'false'"}), 400
+
+    limit = max(1, min(request.args.get("limit", JOBS_PAGE_SIZE, type=int), JOBS_MAX_PAGE_SIZE))
+    try:
+        jobs, next_cursor = list_jobs_page(
+            q=request.args.get("q", "").strip(),
+            location=request.args.get("location", "").strip(),
+            is_active={"true": True, "false": False}.get(is_active),
+            created_by=request.args.get("created_by", type=int),
+            skill=request.args.get("skill", "").strip(),
+            limit=limit,
+            cursor=request.args.get("cursor"),
+            view=view,
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    return jsonify({"jobs": jobs, "next_cursor": next_cursor, "limit": limit}), 200
+
+
+# -------------------------------------------------------
+# JOB SEARCH (full-text, relevance ranked, prefix matched - see app/job_search.py)
+#   ?q=react nati&location=pune&is_active=true&limit=20&cursor=...
+# -------------------------------------------------------
+@api_bp.route("/jobs/search", methods=["GET"])
+@response_cache.cached_response("jobs")
+def search_jobs():
+    q = request.args.get("q", "").strip()
+    if not q:
+        return jsonify({"error": "Query parameter 'q' is required"}), 400
+
+    is_active = request.args.get("is_active")
+    if is_active not in (None, "", "true", "false"):
+        return jsonify({"error": "is_active must be 'true' or 'false'"}), 400
+
+    limit = max(1, min(request.args.get("limit", JOBS_PAGE_SIZE, type=int), JOBS_MAX_PAGE_SIZE))
+    try:
+        jobs, next_cursor = job_search.search_jobs(
+            q,
+            location=request.args.get("location", "").strip(),
+            is_active={"true": True, "false": False}.get(is_active),
+            limit=limit,
+            cursor=request.args.get("cursor"),
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    return jsonify({"query": q, "jobs": jobs, "next_cursor": next_cursor, "limit": limit}), 200
 
 
 @api_bp.route("/candidate/applications", methods=["GET"])
@@ -728,7 +1130,8 @@ def get_candidate_applications():
                 a.meeting_link, 
                 a.score,       
                 a.feedback,  
-                a.graph_data
+                a.graph_data,
+                a.scoring_status
             FROM application a
             JOIN job j ON j.id = a.job_id
             WHERE a.candidate_id = :cid
@@ -744,24 +1147,24 @@ def get_candidate_applications():
 @jwt_required()
 @role_required("hr")
 def update_application_status(app_id):
-    # 👇👇👇 RAW CREDENTIALS (NO FLASK CONFIG) 👇👇👇
-    SENDER_EMAIL = "paint.it.onn@gmail.com"
-    SENDER_PASSWORD = "mpiq cggy rlxc hfkr"  # Your 16-digit App Password
-    # 👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆👆
-
     data = request.get_json()
     new_status = data.get("status")
 
-    if new_status not in ["Shortlisted", "Rejected", "Hired"]:
+    if new_status not in PIPELINE_STATUSES[1:]:
         return jsonify({"error": "Invalid status"}), 400
 
     app_record = Application.query.get_or_404(app_id)
+    analytics.record_status_change(app_record.job_id, app_record.status, new_status)
     app_record.status = new_status
 
     # Generate Link
     if new_status == "Shortlisted" and not app_record.meeting_link:
-        unique_room = f"Interview-{app_id}-{uuid.uuid4().hex[:6]}"
-        app_record.meeting_link = f"https://meet.jit.si/{unique_room}"
+        app_record.meeting_link = bulk_status.meeting_link(app_id)
+
+    # 📬 Queued in the same transaction - the worker sends it (app/email_outbox.py)
+    email = email_outbox.application_status_email(app_record.full_name, new_status, app_record.meeting_link)
+    if email:
+        email_outbox.queue_email(app_record.email, *email, application_id=app_record.id)
 
     try:
         db.session.commit()
@@ -769,177 +1172,205 @@ def update_application_status(app_id):
         db.session.rollback()
         return jsonify({"error": "Database error", "details": str(e)}), 500
 
-    # --- EMAIL LOGIC (RAW PYTHON) ---
-    subject = f"Update: You are {new_status}!"
-    body = ""
+    return jsonify({
+        "message": f"Status updated to {new_status}",
+        "meeting_link": app_record.meeting_link
+    }), 200
 
-    if new_status == "Shortlisted":
-        body = f"Hello {app_record.full_name},\n\nYou have been Shortlisted! Join here:\n{app_record.meeting_link}\n\n- RecruitPro HR"
-    elif new_status == "Hired":
-        body = f"Hello {app_record.full_name},\n\nCongratulations! You are Hired.\n\n- RecruitPro HR"
-    elif new_status == "Rejected":
-        body = f"Hello {app_record.full_name},\n\nThank you for applying.\n\n- RecruitPro HR"
 
-    # 🟢 DIRECT GMAIL CONNECTION (Bypasses Flask)
-    try:
-        msg = EmailMessage()
-        msg.set_content(body)
-        msg["Subject"] = subject
-        msg["From"] = SENDER_EMAIL
-        msg["To"] = app_record.email
+# -------------------------------------------------------
+# 📦 BULK STATUS CHANGE (by ids or by a filter on one job)
+# -------------------------------------------------------
+@api_bp.route("/hr/applications/bulk-status", methods=["POST"])
+@cross_origin()
+@role_required("hr")
+def bulk_update_application_status():
+    data = request.get_json(silent=True) or {}
+    new_status = data.get("status")
+    if new_status not in PIPELINE_STATUSES[1:]:
+        return jsonify({"error": "Invalid status"}), 400
 
-        # Connect to Gmail Port 587 (TLS)
-        context = ssl.create_default_context()
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls(context=context)  # Secure the connection
-            server.login(SENDER_EMAIL, SENDER_PASSWORD)
-            server.send_message(msg)
+    ids, criteria = data.get("application_ids"), data.get("filter")
+    if (ids is None) == (criteria is None):
+        return jsonify({"error": "Send either 'application_ids' or 'filter'"}), 400
 
-        print(f"✅ RAW SMTP SUCCESS: Email sent to {app_record.email}")
+    try:
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+                raise ValueError("'application_ids' must be a list of integers")
+            if len(ids) > bulk_status.MAX_APPLICATIONS:
+                raise ValueError(f"At most {bulk_status.MAX_APPLICATIONS} applications per call")
+        else:
+            if not isinstance(criteria, dict) or not isinstance(criteria.get("job_id"), int):
+                raise ValueError("'filter.job_id' is required")
+            statuses = criteria.get("statuses")
+            if statuses is not None and (not isinstance(statuses, list) or any(s not in PIPELINE_STATUSES for s in statuses)):
+                raise ValueError(f"'filter.statuses' must be a list of: {', '.join(PIPELINE_STATUSES)}")
+            min_score, max_score = criteria.get("min_score"), criteria.get("max_score")
+            if any(v is not None and (not isinstance(v, (int, float)) or isinstance(v, bool)) for v in (min_score, max_score)):
+                raise ValueError("'filter.min_score' / 'filter.max_score' must be numbers")
+            ids = bulk_status.matching_ids(criteria["job_id"], statuses, min_score, max_score)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    try:
+        results, emails_queued = bulk_status.bulk_update_status(ids, new_status)
+        db.session.commit()
     except Exception as e:
-        print(f"❌ RAW SMTP FAILED: {e}")
-        # We catch the error so the app doesn't crash
+        db.session.rollback()
+        print(f"🔥 Bulk Status Error: {e}")
+        return jsonify({"error": "Database error", "details": str(e)}), 500
 
+    counts = {}
+    for outcome in results.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+    print(f"📦 Bulk status -> {new_status}: {counts}")
     return jsonify({
-        "message": f"Status updated to {new_status}",
-        "meeting_link": app_record.meeting_link
+        "status": new_status,
+        "matched": len(results),
+        "updated": counts.get(bulk_status.OUTCOME_UPDATED, 0),
+        "unchanged": counts.get(bulk_status.OUTCOME_UNCHANGED, 0),
+        "not_found": counts.get(bulk_status.OUTCOME_NOT_FOUND, 0),
+        "emails_queued": emails_queued,
+        "results": {str(app_id): outcome for app_id, outcome in results.items()},
     }), 200
+
+
 # -------------------------------------------------------
-# 🚨 AUTOMATED PROCTORING ENDPOINT (Updates DB Real-Time)
+# 🚨 AUTOMATED PROCTORING ENDPOINTS (batched events from the interview room)
 # -------------------------------------------------------
-@api_bp.route("/applications/<int:app_id>/flag", methods=["POST"])
+@api_bp.route("/applications/<int:app_id>/proctoring-events", methods=["POST"])
 @jwt_required()
-def flag_application(app_id):
+def record_proctoring_events(app_id):
+    data = request.get_json(silent=True) or {}
     try:
-        data = request.get_json()
-        violation_type = data.get("type")  # tab_switch, multiple_faces, etc.
-        reason = data.get("reason", "Suspicious Activity")
-
-        app_record = Application.query.get_or_404(app_id)
+        events = proctoring.parse_events(data.get("events"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        # 1. Initialize defaults if they are None (Safety Check)
-        if app_record.trust_score is None: app_record.trust_score = 100
-        if app_record.tab_switches is None: app_record.tab_switches = 0
-
-        # 2. APPLY PENALTIES BASED ON VIOLATION TYPE
-        if violation_type == "tab_switch":
-            app_record.tab_switches += 1
-            app_record.trust_score = max(0, app_record.trust_score - 5)  # -5% per switch
-
-        elif violation_type == "multiple_faces":
-            app_record.faces_detected = "Multiple Faces"
-            app_record.trust_score = max(0, app_record.trust_score - 5)  # -20% for cheating
+    try:
+        result = proctoring.ingest(app_id, events)
+        if result is None:
+            return jsonify({"error": "Application not found"}), 404
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"🔥 Proctoring Error: {e}")
+        return jsonify({"error": str(e)}), 500
 
-        elif violation_type == "no_face":
-            app_record.faces_detected = "No Face Detected"
-            app_record.trust_score = max(0, app_record.trust_score - 10)  # -10% for leaving seat
+    if result["recorded"]:
+        print(f"📉 Trust Score of App {app_id}: {result['new_trust_score']}% "
+              f"({result['recorded']} new, {result['coalesced']} coalesced)")
+    return jsonify(result), 200
 
-        elif violation_type == "multiple_voices":
-            app_record.voices_detected = "Multiple Voices"
-            app_record.trust_score = max(0, app_record.trust_score - 5)  # -10% for talking
 
-        # 3. Log into Feedback for History
-        existing_log = app_record.feedback or ""
-        # Only log if it's a significant event to avoid spamming the text field
-        app_record.feedback = f"{existing_log}\n⚠️ {reason}".strip()
+# One event per call (older clients) - same ingestion as the batch endpoint
+@api_bp.route("/applications/<int:app_id>/flag", methods=["POST"])
+@jwt_required()
+def flag_application(app_id):
+    data = request.get_json(silent=True) or {}
+    try:
+        events = proctoring.parse_events([{"type": data.get("type"), "reason": data.get("reason")}])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    try:
+        result = proctoring.ingest(app_id, events)
+        if result is None:
+            return jsonify({"error": "Application not found"}), 404
         db.session.commit()
-
-        print(f"📉 Score Updated for App {app_id}: {app_record.trust_score}% ({violation_type})")
-        return jsonify({
-            "message": "Flag recorded",
-            "new_trust_score": app_record.trust_score
-        }), 200
-
     except Exception as e:
         db.session.rollback()
         print(f"🔥 Flag Error: {e}")
         return jsonify({"error": str(e)}), 500
 
+    return jsonify({
+        "message": "Flag recorded",
+        "new_trust_score": result["new_trust_score"]
+    }), 200
+
+
+@api_bp.route("/hr/applications/<int:app_id>/proctoring", methods=["GET"])
+@cross_origin()
+@role_required("hr")
+def get_proctoring_summary(app_id):
+    app_record = db.session.get(Application, app_id)
+    if not app_record:
+        return jsonify({"error": "Application not found"}), 404
+
+    return jsonify({
+        "application_id": app_id,
+        "trust_score": app_record.trust_score,
+        **proctoring.summary(app_id)
+    }), 200
+
 
 # -------------------------------------------------------
 # ✅ THE FIX: DOUBLE ROUTE (Accepts both URL styles)
 # -------------------------------------------------------
 # -------------------------------------------------------
-# ✅ GET APPLICANTS (NOW WITH SENTIMENT DATA)
+# ✅ GET APPLICANTS (sorted, filtered, keyset-paginated; NDJSON export)
+#   ?sort=ai_score|trust_score|created_at&order=desc|asc&status=Applied,Shortlisted
+#   &min_score=60&max_score=100&fields=id,ai_score,user&limit=50&cursor=...
+#   &format=ndjson  -> every matching applicant, one JSON object per line (streamed)
 # -------------------------------------------------------
 @api_bp.route("/hr/jobs/<int:job_id>/applicants", methods=["GET"])
 @api_bp.route("/jobs/<int:job_id>/applicants", methods=["GET"])
 @cross_origin()
+@role_required("hr")
 def get_job_applicants(job_id):
+    from app.applicant_listing import (
+        DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ORDERS, SORTS, export_applicants, list_applicants_page, parse_fields
+    )
+
+    sort = request.args.get("sort", "ai_score")
+    if sort not in SORTS:
+        return jsonify({"error": f"sort must be one of {', '.join(SORTS)}"}), 400
+    order = request.args.get("order", "desc")
+    if order not in ORDERS:
+        return jsonify({"error": "order must be 'desc' or 'asc'"}), 400
+
+    statuses = [s.strip() for s in request.args.get("status", "").split(",") if s.strip()]
+    if any(s not in PIPELINE_STATUSES for s in statuses):
+        return jsonify({"error": f"status must be among {', '.join(PIPELINE_STATUSES)}"}), 400
+
     try:
-        print(f"🔎 Fetching applicants for Job ID: {job_id}")
-
-        results = db.session.query(Application, Candidate, User) \
-            .outerjoin(Candidate, Application.candidate_id == Candidate.id) \
-            .outerjoin(User, Candidate.user_id == User.id) \
-            .filter(Application.job_id == job_id).all()
-
-        applicants_list = []
-        for app, cand, user in results:
-            candidate_name = app.full_name or (cand.name if cand else "Unknown")
-            candidate_email = app.email or (user.email if user else "No Email")
-
-            # 1. Safe Skills Parsing
-            cand_skills = []
-            if cand and cand.skills:
-                try:
-                    if isinstance(cand.skills, list):
-                        cand_skills = cand.skills
-                    elif isinstance(cand.skills, str):
-                        cand_skills = json.loads(cand.skills)
-                except:
-                    cand_skills = [str(cand.skills)]
-
-            # 🟢 2. EXTRACT VIDEO SENTIMENT (New Logic)
-            video_sentiment = "Not Analyzed"
-            if app.graph_data:
-                try:
-                    # Handle both dict (if DB driver converts it) and string JSON
-                    gd = app.graph_data if isinstance(app.graph_data, dict) else json.loads(app.graph_data)
-                    video_sentiment = gd.get("sentiment", "Not Analyzed")
-
-                    # Clean up the string (e.g., remove "Tone" or extra text if needed)
-                    if "Positive" in video_sentiment:
-                        video_sentiment = "Positive"
-                    elif "Negative" in video_sentiment:
-                        video_sentiment = "Negative"
-                    elif "Neutral" in video_sentiment:
-                        video_sentiment = "Neutral"
-                    elif "Nervous" in video_sentiment:
-                        video_sentiment = "Nervous"
-                except Exception as e:
-                    print(f"⚠️ Error parsing graph_data for App {app.id}: {e}")
-
-            applicants_list.append({
-                "id": app.id,
-                "ai_score": app.score or 0,
-                "ai_feedback": app.feedback or "No feedback yet.",
-                "trust_score": app.trust_score,
-                "video_sentiment": video_sentiment,  # 🟢 NEW FIELD SENT TO FRONTEND
-                "tab_switches": app.tab_switches,
-                "faces_detected": app.faces_detected,
-                "voices_detected": app.voices_detected,
-                "status": app.status,
-                "resume_url": app.resume_url,
-                "user": {
-                    "name": candidate_name,
-                    "email": candidate_email,
-                    "phone": cand.phone if cand else "N/A",
-                    "location": cand.location if cand else "N/A",
-                    "experience": cand.experience if cand else "No experience listed.",
-                    "education": getattr(cand, 'education', "No education listed."),
-                    "skills": cand_skills
-                }
-            })
+        fields = parse_fields(request.args.get("fields"))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    filters = {
+        "sort": sort,
+        "order": order,
+        "statuses": statuses,
+        "min_score": request.args.get("min_score", type=int),
+        "max_score": request.args.get("max_score", type=int),
+        "fields": fields,
+    }
+
+    if request.args.get("format") == "ndjson":
+        print(f"📤 Exporting applicants of Job ID: {job_id}")
+        response = current_app.response_class(
+            stream_with_context(export_applicants(job_id, **filters)), mimetype="application/x-ndjson"
+        )
+        response.headers["Content-Disposition"] = f"attachment; filename=applicants_job_{job_id}.ndjson"
+        return response
 
-        print(f"✅ Found {len(applicants_list)} applicants.")
-        return jsonify({"applicants": applicants_list}), 200
+    limit = max(1, min(request.args.get("limit", DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE))
+    try:
+        applicants, next_cursor = list_applicants_page(
+            job_id, limit=limit, cursor=request.args.get("cursor"), **filters
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
 
-    except Exception as e:
-        print(f"🔥 ERROR in /applicants route: {str(e)}")
-        return jsonify({"error": str(e)}), 500
+    return jsonify({
+        "applicants": applicants,
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "sort": sort,
+        "order": order,
+    }), 200
 
 # -------------------------------------------------------
 # 🤖 RECRUITER CO-PILOT (AI CHATBOT) - UPGRADED & SAFE
@@ -1009,72 +1440,59 @@ def chat_bot():
 def get_analytics():
     try:
         job_id = request.args.get('job_id')
+        job_id = int(job_id) if job_id and job_id != "all" else None
+    except ValueError:
+        return jsonify({"error": "job_id must be a number or 'all'"}), 400
 
-        query = Application.query
-        if job_id and job_id != "all":
-            query = query.filter_by(job_id=job_id)
-
-        apps = query.all()
-        total = len(apps)
+    try:
+        # 1. Totals: one rollup row (or one SUM over them) - no per-application work
+        totals = analytics.summary(job_id)
+        total = totals["application_count"]
 
         if total == 0:
             return jsonify({
                 "total": 0, "avg_score": 0, "avg_trust": 0,
                 "sentiment": [], "funnel": [],
-                "matrix": []  # 🟢 Empty Matrix
+                "matrix": [], "matrix_next_cursor": None  # 🟢 Empty Matrix
             })
 
-        # 1. Averages
-        total_ai = sum(app.score for app in apps if app.score is not None)
-        total_trust = sum(app.trust_score for app in apps if app.trust_score is not None)
-
         # 2. Sentiment Data
-        sent_counts = {"Positive": 0, "Neutral": 0, "Negative": 0}
-        for app in apps:
-            if app.graph_data:
-                gd = app.graph_data if isinstance(app.graph_data, dict) else json.loads(app.graph_data)
-                s_text = gd.get("sentiment", "Neutral")
-                if "Positive" in s_text:
-                    sent_counts["Positive"] += 1
-                elif "Negative" in s_text:
-                    sent_counts["Negative"] += 1
-                else:
-                    sent_counts["Neutral"] += 1
-
         sentiment_data = [
-            {"name": "Positive", "value": sent_counts["Positive"], "fill": "#10b981"},
-            {"name": "Neutral", "value": sent_counts["Neutral"], "fill": "#64748b"},
-            {"name": "Negative", "value": sent_counts["Negative"], "fill": "#ef4444"}
+            {"name": "Positive", "value": totals["sentiment_positive"], "fill": "#10b981"},
+            {"name": "Neutral", "value": totals["sentiment_neutral"], "fill": "#64748b"},
+            {"name": "Negative", "value": totals["sentiment_negative"], "fill": "#ef4444"},
+            {"name": "No Audio", "value": totals["sentiment_no_audio"], "fill": "#cbd5e1"}
         ]
 
         # 3. Funnel Data
         funnel_data = [
             {"name": "Applied", "value": total, "fill": "#3b82f6"},
-            {"name": "Shortlisted", "value": len([a for a in apps if a.status == "Shortlisted"]), "fill": "#f59e0b"},
-            {"name": "Hired", "value": len([a for a in apps if a.status == "Hired"]), "fill": "#10b981"},
-            {"name": "Rejected", "value": len([a for a in apps if a.status == "Rejected"]), "fill": "#ef4444"}
+            {"name": "Shortlisted", "value": totals["shortlisted_count"], "fill": "#f59e0b"},
+            {"name": "Hired", "value": totals["hired_count"], "fill": "#10b981"},
+            {"name": "Rejected", "value": totals["rejected_count"], "fill": "#ef4444"}
         ]
 
-        # 🟢 4. TALENT MATRIX DATA (Scatter Plot Points)
-        # We map every candidate to an X (Trust) and Y (Skill) coordinate
-        matrix_data = []
-        for app in apps:
-            matrix_data.append({
-                "name": app.full_name.split()[0] if app.full_name else "Unknown",  # Just first name for graph
-                "x": app.trust_score or 0,  # X Axis: Trust
-                "y": app.score or 0,  # Y Axis: AI Skill Score
-                "status": app.status
-            })
+        # 🟢 4. TALENT MATRIX DATA (Scatter Plot Points) - one page, newest first
+        matrix_limit = max(1, min(
+            request.args.get("matrix_limit", analytics.MATRIX_PAGE_SIZE, type=int), analytics.MAX_MATRIX_PAGE_SIZE
+        ))
+        try:
+            matrix_data, matrix_next = analytics.matrix_page(
+                job_id, limit=matrix_limit, cursor=request.args.get("matrix_cursor")
+            )
+        except ValueError:
+            return jsonify({"error": "Invalid matrix_cursor"}), 400
 
         return jsonify({
             "total": total,
-            "avg_score": round(total_ai / total, 1) if total > 0 else 0,
-            "avg_trust": round(total_trust / total, 1) if total > 0 else 0,
+            "avg_score": round(totals["score_sum"] / total, 1),
+            "avg_trust": round(totals["trust_sum"] / total, 1),
             "sentiment": sentiment_data,
             "funnel": funnel_data,
-            "matrix": matrix_data  # 🟢 Sending the dots
+            "matrix": matrix_data,  # 🟢 Sending the dots
+            "matrix_next_cursor": matrix_next
         }), 200
 
     except Exception as e:
         print(f"Analytics Error: {e}")
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
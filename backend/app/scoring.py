@@ -0,0 +1,121 @@
+# backend/app/scoring.py
+# Background AI scoring for applications (runs in the task worker, not in the request).
+
+import json
+import os
+from datetime import datetime
+
+from flask import current_app
+
+from app import db
+from app.task_queue import enqueue, task_handler
+
+SCORING_TASK = "score_application"
+PLACEHOLDER_NAMES = (None, "", "New Candidate", "null")
+
+
+def upload_path_from_url(file_url):
+    """'/api/upload/files/<name>' -> absolute path inside UPLOAD_FOLDER (None if missing)."""
+    if not file_url:
+        return None
+    filename = os.path.basename(file_url)
+    return os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
+
+
+def parse_skill_list(raw_skills):
+    """Job/candidate skills are stored as a JSON array or a comma separated string."""
+    if not raw_skills:
+        return []
+    if isinstance(raw_skills, list):
+        return [str(s).strip() for s in raw_skills if str(s).strip()]
+    try:
+        loaded = json.loads(raw_skills)
+        if isinstance(loaded, list):
+            return [str(s).strip() for s in loaded if str(s).strip()]
+    except (ValueError, TypeError):
+        pass
+    return [s.strip() for s in str(raw_skills).split(",") if s.strip()]
+
+
+def enqueue_scoring(application):
+    """Marks the application as pending and queues it (caller commits)."""
+    application.scoring_status = "pending"
+    application.scoring_error = None
+    return enqueue(SCORING_TASK, {"application_id": application.id}, ref_id=application.id)
+
+
+def _on_scoring_failure(payload, error, final):
+    from app.models import Application
+
+    application = db.session.get(Application, payload.get("application_id"))
+    if not application:
+        return
+    application.scoring_status = "failed" if final else "retrying"
+    application.scoring_error = error[:2000]
+    if final:
+        application.feedback = "AI scoring failed. HR can re-run scoring for this application."
+
+
+@task_handler(SCORING_TASK, process_pool=True, on_failure=_on_scoring_failure)
+def score_application(payload):
+    from app.ai_engine import calculate_ai_score
+    from app.analytics import record_scoring, sentiment_bucket
+    from app.models import Application, Job
+    from app.scoring_metrics import ScoringMetrics, record_histograms
+    from app.skills import job_skill_names
+
+    application = db.session.get(Application, payload.get("application_id"))
+    if not application:
+        print(f"⚠️ Application {payload} vanished before scoring")
+        return
+
+    job = db.session.get(Job, application.job_id)
+    application.scoring_status = "processing"
+    db.session.commit()
+
+    skills = job_skill_names([job])[job.id] if job else []
+    if not skills:
+        record_scoring(application.job_id, application.score, 0, application.sentiment, application.sentiment)
+        application.score = 0
+        application.feedback = "AI scoring skipped (job has no required skills)."
+        application.scoring_status = "done"
+        db.session.commit()
+        return
+
+    metrics = ScoringMetrics()
+    if application.created_at:
+        # Apply -> a worker picked it up (how far behind the worker pool is)
+        metrics.add_time("queue_wait", max((datetime.utcnow() - application.created_at).total_seconds(), 0))
+
+    artifacts = {}
+    score, feedback, graph_data, extracted_name = calculate_ai_score(
+        upload_path_from_url(application.resume_url),
+        upload_path_from_url(application.video_url),
+        skills,
+        job_id=job.id,
+        artifacts=artifacts,
+        metrics=metrics
+    )
+
+    # HR analytics rollup moves in the same transaction as the score
+    sentiment = sentiment_bucket(graph_data)
+    record_scoring(application.job_id, application.score, score, application.sentiment, sentiment)
+
+    application.score = score
+    application.feedback = feedback
+    application.graph_data = graph_data
+    application.sentiment = sentiment
+    application.resume_hash = artifacts.get("resume_hash")
+    application.video_hash = artifacts.get("video_hash")
+    if application.full_name in PLACEHOLDER_NAMES and extracted_name:
+        application.full_name = extracted_name
+    application.scoring_status = "done"
+    application.scoring_error = None
+    application.scoring_metrics = metrics.to_dict()
+    record_histograms(application.scoring_metrics)
+
+    # Resume text is in the artifact cache now -> cheap to (re)index the candidate for HR search
+    from app.candidate_search import enqueue_indexing
+    enqueue_indexing(application.candidate_id)
+    db.session.commit()
+    print(f"✅ Scored application {application.id}: {score}%")
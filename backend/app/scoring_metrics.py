@@ -0,0 +1,135 @@
+# backend/app/scoring_metrics.py
+# Per-stage instrumentation of the AI scoring pipeline.
+#
+# Every scoring run fills a ScoringMetrics: wall time per stage (queue wait, PDF
+# extraction, ffmpeg decode, speech-to-text, sentiment, matching), input sizes
+# (pages, characters, audio seconds) and artifact cache hit/miss flags.
+# The dict is saved on the Application (scoring_metrics column) and folded into
+# fixed-bucket histograms (scoring_stage_histogram / scoring_stage_stat) with
+# atomic increments, so the HR metrics endpoint never scans applications.
+
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import update
+
+from app import db
+from app.counters import increment_row
+
+# Upper bounds (ms) of the histogram buckets; the last bucket catches everything above
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000, 300000)
+INF_BUCKET = 2 ** 31 - 1
+
+
+class ScoringMetrics:
+    """Collects timings (ms), sizes and cache flags for one scoring run."""
+
+    def __init__(self):
+        self.stages_ms = {}
+        self.sizes = {}
+        self.cache = {}
+        self._started = time.perf_counter()
+
+    def add_time(self, stage, seconds):
+        self.stages_ms[stage] = round(self.stages_ms.get(stage, 0.0) + seconds * 1000, 1)
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def record_extraction(self, kind, cache_state, chars=0, **stats):
+        """Cache flag + sizes of one extracted artifact ("resume" / "video")."""
+        if cache_state:
+            self.cache[kind] = cache_state
+        self.sizes[f"{kind}_chars"] = chars
+        if stats.get("pages") is not None:
+            self.sizes["resume_pages"] = stats["pages"]
+        if "audio_seconds" in stats:
+            self.sizes["audio_seconds"] = stats["audio_seconds"]
+            self.sizes["audio_chunks"] = stats.get("chunks", 0)
+            self.sizes["failed_chunks"] = stats.get("failed_chunks", 0)
+            # Split of the video stage: time blocked on ffmpeg vs on the recognizer
+            self.stages_ms["video_decode"] = stats.get("decode_ms", 0.0)
+            self.stages_ms["speech_to_text"] = stats.get("stt_wait_ms", 0.0)
+
+    def to_dict(self):
+        stages = dict(self.stages_ms)
+        stages["total"] = round((time.perf_counter() - self._started) * 1000, 1)
+        return {"stages_ms": stages, "sizes": dict(self.sizes), "cache": dict(self.cache)}
+
+
+# ---------------------------------------------------------
+# 📊 HISTOGRAMS
+# ---------------------------------------------------------
+def bucket_for(ms):
+    for bound in BUCKETS_MS:
+        if ms <= bound:
+            return bound
+    return INF_BUCKET
+
+
+def record_histograms(metrics_dict):
+    """Folds one run's timings into the aggregate tables (caller commits)."""
+    from app.models import ScoringStageHistogram, ScoringStageStat
+
+    cache = metrics_dict.get("cache", {})
+    cache_stage = {"resume_extract": cache.get("resume"), "video_extract": cache.get("video")}
+
+    for stage, ms in metrics_dict.get("stages_ms", {}).items():
+        increment_row(ScoringStageHistogram, {"stage": stage, "le_ms": bucket_for(ms)}, {"count": 1})
+        increment_row(ScoringStageStat, {"stage": stage}, {
+            "count": 1,
+            "total_ms": ms,
+            "cache_hits": 1 if cache_stage.get(stage) == "hit" else 0,
+            "cache_misses": 1 if cache_stage.get(stage) == "miss" else 0,
+        })
+
+        # Running max can't be an increment - conditional UPDATE keeps it race free
+        db.session.execute(
+            update(ScoringStageStat)
+            .where(ScoringStageStat.stage == stage, ScoringStageStat.max_ms < ms)
+            .values(max_ms=ms)
+        )
+
+
+def _percentile_from_buckets(buckets, count, pct):
+    """Upper bound of the bucket holding the pct-th percentile (None for the open bucket)."""
+    target = count * pct / 100
+    seen = 0
+    for le_ms, bucket_count in buckets:
+        seen += bucket_count
+        if seen >= target:
+            return None if le_ms == INF_BUCKET else le_ms
+    return None
+
+
+def summarize_histograms():
+    """Per-stage count / mean / max / approx p50-p95-p99 / cache hit rate + the raw buckets."""
+    from app.models import ScoringStageHistogram, ScoringStageStat
+
+    buckets = {}
+    for row in ScoringStageHistogram.query.order_by(ScoringStageHistogram.stage, ScoringStageHistogram.le_ms):
+        buckets.setdefault(row.stage, []).append((row.le_ms, row.count))
+
+    summary = {}
+    for stat in ScoringStageStat.query.order_by(ScoringStageStat.stage).all():
+        stage_buckets = buckets.get(stat.stage, [])
+        lookups = stat.cache_hits + stat.cache_misses
+        summary[stat.stage] = {
+            "count": stat.count,
+            "mean_ms": round(stat.total_ms / stat.count, 1) if stat.count else 0.0,
+            "max_ms": stat.max_ms,
+            "p50_ms": _percentile_from_buckets(stage_buckets, stat.count, 50),
+            "p95_ms": _percentile_from_buckets(stage_buckets, stat.count, 95),
+            "p99_ms": _percentile_from_buckets(stage_buckets, stat.count, 99),
+            "cache_hit_rate": round(stat.cache_hits / lookups, 3) if lookups else None,
+            "buckets": [
+                {"le_ms": "+Inf" if le_ms == INF_BUCKET else le_ms, "count": count}
+                for le_ms, count in stage_buckets
+            ],
+        }
+    return summary
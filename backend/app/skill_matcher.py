@@ -0,0 +1,165 @@
+# backend/app/skill_matcher.py
+# Compiled multi-pattern skill matcher used by the AI engine.
+#
+# Instead of scanning the whole resume once per skill (and once more per
+# synonym), every skill + synonym is compiled into a single Aho-Corasick
+# automaton. One pass over the text then tells us which skills are present.
+
+import hashlib
+import threading
+from collections import OrderedDict, deque
+
+# How many compiled matchers we keep around (one per job + skills version)
+MATCHER_CACHE_SIZE = 256
+
+
+def _is_word_char(ch):
+    return ch.isalnum()
+
+
+def normalize_pattern(pattern):
+    """Lowercase + collapse whitespace so patterns line up with extracted text."""
+    return " ".join(str(pattern).lower().split())
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over skill names and their synonyms.
+    `skill_patterns` maps each required skill -> list of strings that count as a hit.
+    """
+
+    def __init__(self, skill_patterns):
+        self.skills = list(skill_patterns.keys())
+
+        # Trie stored as parallel lists: goto edges, failure link, outputs
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for skill_idx, skill in enumerate(self.skills):
+            for pattern in skill_patterns[skill]:
+                pattern = normalize_pattern(pattern)
+                if pattern:
+                    self._add(pattern, skill_idx)
+
+        self._build_failure_links()
+
+    def _add(self, pattern, skill_idx):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+
+        # Word-boundary flags: only enforce a boundary on sides that are alphanumeric,
+        # so "c++", "c#" and ".net" still match next to punctuation.
+        need_left = _is_word_char(pattern[0])
+        need_right = _is_word_char(pattern[-1])
+        self._out[node].append((skill_idx, len(pattern), need_left, need_right))
+
+    def _build_failure_links(self):
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit outputs of the suffix state
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text):
+        """Returns the set of skills found in `text` (single pass, word-boundary aware)."""
+        found = set()
+        if not text or not self.skills:
+            return found
+
+        goto, fail, out = self._goto, self._fail, self._out
+        text_len = len(text)
+        remaining = len(self.skills)
+        node = 0
+
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            if not out[node]:
+                continue
+
+            for skill_idx, length, need_left, need_right in out[node]:
+                if skill_idx in found:
+                    continue
+                start = i - length + 1
+                if need_left and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if need_right and i + 1 < text_len and _is_word_char(text[i + 1]):
+                    continue
+                found.add(skill_idx)
+                remaining -= 1
+
+            # Every skill already matched -> no need to read the rest of the resume
+            if remaining == 0:
+                break
+
+        return {self.skills[idx] for idx in found}
+
+
+# ---------------------------------------------------------
+# 🗂️ MATCHER CACHE (one compiled automaton per job + skills version)
+# ---------------------------------------------------------
+_matcher_cache = OrderedDict()
+_matcher_lock = threading.Lock()
+
+
+def skills_version(skills, synonyms):
+    """Stable fingerprint of the skill list + synonym table a matcher was built from."""
+    digest = hashlib.sha1()
+    for skill in skills:
+        digest.update(skill.encode("utf-8"))
+        digest.update(b"\x00")
+        for syn in synonyms.get(skill, []):
+            digest.update(syn.encode("utf-8"))
+            digest.update(b"\x01")
+    return digest.hexdigest()
+
+
+def get_skill_matcher(job_id, skills, synonyms):
+    """
+    Returns a compiled SkillMatcher for this job, building it only when the job's
+    skills (or the synonym table) changed since the last application.
+    """
+    skills = [normalize_pattern(s) for s in skills]
+    skills = [s for s in skills if s]
+    key = (job_id, skills_version(skills, synonyms))
+
+    with _matcher_lock:
+        matcher = _matcher_cache.get(key)
+        if matcher is not None:
+            _matcher_cache.move_to_end(key)
+            return matcher
+
+    patterns = OrderedDict()
+    for skill in skills:
+        patterns[skill] = [skill] + list(synonyms.get(skill, []))
+    matcher = SkillMatcher(patterns)
+
+    with _matcher_lock:
+        _matcher_cache[key] = matcher
+        _matcher_cache.move_to_end(key)
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+
+    return matcher
@@ -0,0 +1,179 @@
+# backend/app/skill_ontology.py
+# Data-driven skill ontology (replaces the hardcoded SYNONYM_DB in ai_engine.py).
+#
+# - skills live in app/data/skill_ontology.json (or SKILL_ONTOLOGY_PATH): canonical id,
+#   display name, aliases and an optional parent ("django" -> "python")
+# - loaded into flat dicts: normalized alias -> canonical index, so resolving a token
+#   (or a 2-4 word phrase) is one dict lookup, however many skills the ontology has
+# - the file is re-read when its mtime changes (checked at most every ONTOLOGY_RELOAD_SECONDS),
+#   so workers pick up edits without a restart
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from app.fuzzy_index import tokenize
+
+DEFAULT_ONTOLOGY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_ontology.json")
+ONTOLOGY_RELOAD_SECONDS = float(os.getenv("ONTOLOGY_RELOAD_SECONDS", 30))
+
+
+def normalize_alias(text):
+    """"React.JS " -> "react.js", "Spring-Boot" -> "spring-boot" (same tokenizer as the resume side)."""
+    return " ".join(tokenize(str(text or "")))
+
+
+def alias_variants(alias, rules):
+    """Spellings that should resolve like `alias`: node.js / nodejs / node js, react-native / react native."""
+    variants = {alias}
+    if rules.get("js_suffix_variants", True):
+        if alias.endswith(".js"):
+            base = alias[:-3]
+            variants |= {base + "js", base + " js"}
+        elif alias.endswith("js") and len(alias) > 4 and not alias.endswith(" js"):
+            base = alias[:-2]
+            variants |= {base + ".js", base + " js"}
+    if rules.get("hyphen_variants", True):
+        for variant in list(variants):
+            if "-" in variant:
+                variants |= {variant.replace("-", " "), variant.replace("-", "")}
+    return {normalize_alias(v) for v in variants if normalize_alias(v)}
+
+
+class SkillOntology:
+    """
+    Compiled ontology. Skills are referred to by an int index internally:
+      ids[i] / names[i]  -> canonical id / display name
+      alias_index        -> {normalized alias: i}
+      ancestors[i]       -> tuple of parent indexes up to the root
+    """
+
+    def __init__(self, data, version=None):
+        rules = data.get("normalization", {})
+        skills = data.get("skills", [])
+
+        self.version = version or str(data.get("version", "0"))
+        self.ids = [s["id"] for s in skills]
+        self.names = [s.get("name", s["id"]) for s in skills]
+        position = {skill_id: i for i, skill_id in enumerate(self.ids)}
+
+        self.alias_index = {}
+        for i, skill in enumerate(skills):
+            for alias in [skill["id"], skill.get("name", "")] + list(skill.get("aliases", [])):
+                for variant in alias_variants(normalize_alias(alias), rules):
+                    # First definition wins - an alias must not silently move between skills
+                    self.alias_index.setdefault(variant, i)
+
+        parents = [position.get(s.get("parent")) for s in skills]
+        self.ancestors = []
+        for i in range(len(skills)):
+            chain = []
+            parent = parents[i]
+            while parent is not None and parent not in chain and parent != i:  # cycle-safe
+                chain.append(parent)
+                parent = parents[parent]
+            self.ancestors.append(tuple(chain))
+
+        self.max_words = max((alias.count(" ") + 1 for alias in self.alias_index), default=1)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def resolve(self, skill):
+        """Canonical index of a skill string ("ReactJS" -> index of "react"), or None."""
+        normalized = normalize_alias(skill)
+        index = self.alias_index.get(normalized)
+        if index is None:
+            for variant in alias_variants(normalized, {}):
+                index = self.alias_index.get(variant)
+                if index is not None:
+                    break
+        return index
+
+    def canonical_id(self, skill):
+        index = self.resolve(skill)
+        return self.ids[index] if index is not None else None
+
+    def skill_indexes_in(self, text):
+        """
+        Every ontology skill mentioned in `text` plus all their ancestors
+        (knowing Django counts as knowing Python). One dict lookup per token
+        and phrase length - independent of the ontology size.
+        """
+        tokens = tokenize(text or "")
+        found = set()
+        alias_index = self.alias_index
+        for start in range(len(tokens)):
+            for length in range(1, self.max_words + 1):
+                if start + length > len(tokens):
+                    break
+                index = alias_index.get(" ".join(tokens[start:start + length]))
+                if index is not None and index not in found:
+                    found.add(index)
+                    found.update(self.ancestors[index])
+        return found
+
+    def match_required(self, required_skills, found_indexes):
+        """
+        Splits required skills into (matched, unknown) given skill_indexes_in() output.
+        `unknown` = skills the ontology doesn't know; callers match those literally.
+        """
+        matched, unknown = [], []
+        for skill in required_skills:
+            index = self.resolve(skill)
+            if index is None:
+                unknown.append(skill)
+            elif index in found_indexes:
+                matched.append(skill)
+        return matched, unknown
+
+
+# ---------------------------------------------------------
+# 🔄 LOADING + HOT RELOAD
+# ---------------------------------------------------------
+_ontology = None
+_loaded_mtime = None
+_last_check = 0.0
+_lock = threading.Lock()
+
+
+def ontology_path():
+    return os.getenv("SKILL_ONTOLOGY_PATH", DEFAULT_ONTOLOGY_PATH)
+
+
+def load_ontology(path):
+    with open(path, "rb") as fh:
+        raw = fh.read()
+    data = json.loads(raw)
+    # File version + content hash: editing aliases without bumping "version" still invalidates caches
+    version = f"{data.get('version', '0')}:{hashlib.sha1(raw).hexdigest()[:12]}"
+    return SkillOntology(data, version=version)
+
+
+def get_ontology():
+    """The current ontology, re-read from disk when the file changed."""
+    global _ontology, _loaded_mtime, _last_check
+
+    now = time.monotonic()
+    if _ontology is not None and now - _last_check < ONTOLOGY_RELOAD_SECONDS:
+        return _ontology
+
+    with _lock:
+        if _ontology is not None and now - _last_check < ONTOLOGY_RELOAD_SECONDS:
+            return _ontology
+        _last_check = now
+        path = ontology_path()
+        try:
+            mtime = os.path.getmtime(path)
+            if _ontology is None or mtime != _loaded_mtime:
+                _ontology = load_ontology(path)
+                _loaded_mtime = mtime
+                print(f"🧠 Skill ontology loaded: {len(_ontology)} skills (version {_ontology.version})")
+        except Exception as e:
+            # A broken edit must not take scoring down - keep serving the last good copy
+            print(f"⚠️ Could not load skill ontology from {path}: {e}")
+            if _ontology is None:
+                _ontology = SkillOntology({"skills": []}, version="empty")
+        return _ontology
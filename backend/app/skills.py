@@ -0,0 +1,209 @@
+# backend/app/skills.py
+# Normalized skill storage: skill + job_skill / candidate_skill join tables.
+#
+# Job.required_skills and Candidate.skills stay as they were (JSON array or comma
+# separated text, still returned by the API), but every write through the create /
+# update endpoints also replaces the join rows, so
+#   "candidates with skill X" -> candidate_skill range on (skill_id, candidate_id)
+#   "jobs needing skill Y"    -> job_skill range on (skill_id, job_id)
+# are index reads instead of loading and parsing every row in Python.
+# Rows written before the tables existed are filled by backfill_skills.py; until then
+# the readers below fall back to parsing the legacy column.
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.scoring import parse_skill_list
+from app.skill_ontology import get_ontology, normalize_alias
+
+MAX_SKILL_LENGTH = 120
+BACKFILL_BATCH_SIZE = 500
+
+
+def skill_identity(name):
+    """"ReactJS" -> ("react", "React") via the ontology; unknown skills keep their own spelling."""
+    ontology = get_ontology()
+    index = ontology.resolve(name)
+    if index is not None:
+        return ontology.ids[index], ontology.names[index]
+    key = normalize_alias(name)
+    if not key or len(key) > MAX_SKILL_LENGTH:
+        return None
+    return key, str(name).strip()[:MAX_SKILL_LENGTH]
+
+
+# ---------------------------------------------------------
+# ✍️ WRITING (caller commits)
+# ---------------------------------------------------------
+def _skill_keys(names):
+    """{key: display name} of `names` in order, duplicates ("React", "react.js") collapsed."""
+    wanted = {}
+    for name in names:
+        identity = skill_identity(name)
+        if identity:
+            wanted.setdefault(*identity)
+    return wanted
+
+
+def _skill_ids_by_key(wanted):
+    """{key: skill id} for a _skill_keys() dict, inserting the skills nobody listed before."""
+    from app.models import Skill
+
+    if not wanted:
+        return {}
+    ids = dict(db.session.execute(select(Skill.key, Skill.id).where(Skill.key.in_(wanted))).all())
+    missing = [key for key in wanted if key not in ids]
+    for key in missing:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(Skill).values(key=key, name=wanted[key]))
+        except IntegrityError:
+            pass  # Created by a parallel request - picked up below
+    if missing:
+        ids.update(db.session.execute(select(Skill.key, Skill.id).where(Skill.key.in_(missing))).all())
+    return ids
+
+
+def get_or_create_skills(names):
+    """Skill ids for `names` in order, one id per distinct skill."""
+    wanted = _skill_keys(names)
+    ids = _skill_ids_by_key(wanted)
+    return [ids[key] for key in wanted]
+
+
+def _replace_rows(model, owner_column, owner_ids, skill_ids_by_owner):
+    if not owner_ids:
+        return
+    db.session.query(model).filter(getattr(model, owner_column).in_(owner_ids)) \
+        .delete(synchronize_session=False)
+    rows = [
+        {owner_column: owner_id, "skill_id": skill_id, "position": position}
+        for owner_id, skill_ids in skill_ids_by_owner.items()
+        for position, skill_id in enumerate(skill_ids)
+    ]
+    if rows:
+        db.session.execute(insert(model), rows)
+
+
+def set_job_skills(job_id, raw_skills):
+    """Replaces a job's job_skill rows from its required_skills value (list / JSON / CSV)."""
+    from app.models import JobSkill
+    _replace_rows(JobSkill, "job_id", [job_id], {job_id: get_or_create_skills(parse_skill_list(raw_skills))})
+
+
+def set_candidate_skills(candidate_id, raw_skills):
+    from app.models import CandidateSkill
+    _replace_rows(CandidateSkill, "candidate_id", [candidate_id],
+                  {candidate_id: get_or_create_skills(parse_skill_list(raw_skills))})
+
+
+def remove_job(job_id):
+    from app.models import JobSkill
+    JobSkill.query.filter_by(job_id=job_id).delete()
+
+
+# ---------------------------------------------------------
+# 📖 READING
+# ---------------------------------------------------------
+def _names_by_owner(model, owner_column, owner_ids):
+    from app.models import Skill
+
+    owner = getattr(model, owner_column)
+    names = {}
+    if not owner_ids:
+        return names
+    rows = db.session.execute(
+        select(owner, Skill.name).join(Skill, Skill.id == model.skill_id)
+        .where(owner.in_(owner_ids)).order_by(owner, model.position)
+    ).all()
+    for owner_id, name in rows:
+        names.setdefault(owner_id, []).append(name)
+    return names
+
+
+def job_skill_names(jobs):
+    """{job.id: [skill names]} for a batch of jobs in one query (legacy column if not backfilled)."""
+    from app.models import JobSkill
+
+    names = _names_by_owner(JobSkill, "job_id", [job.id for job in jobs])
+    return {job.id: names.get(job.id) or parse_skill_list(job.required_skills) for job in jobs}
+
+
+def candidate_skill_names(candidates):
+    from app.models import CandidateSkill
+
+    names = _names_by_owner(CandidateSkill, "candidate_id", [c.id for c in candidates])
+    return {c.id: names.get(c.id) or parse_skill_list(c.skills) for c in candidates}
+
+
+def find_skill(name):
+    """The Skill row `name` resolves to, or None if nobody ever listed it."""
+    from app.models import Skill
+
+    identity = skill_identity(name)
+    return Skill.query.filter_by(key=identity[0]).first() if identity else None
+
+
+def candidates_with_skill(skill_id, limit=50, cursor=None):
+    """
+    Candidate ids having the skill, highest id (newest profile) first, keyset-paginated on id.
+    Returns (candidate_ids, next_cursor). Raises ValueError on a malformed cursor.
+    """
+    from app.models import CandidateSkill
+
+    query = select(CandidateSkill.candidate_id).where(CandidateSkill.skill_id == skill_id)
+    if cursor:
+        query = query.where(CandidateSkill.candidate_id < int(cursor))
+    ids = db.session.execute(query.order_by(CandidateSkill.candidate_id.desc()).limit(limit + 1)).scalars().all()
+
+    next_cursor = None
+    if len(ids) > limit:
+        ids = ids[:limit]
+        next_cursor = str(ids[-1])
+    return ids, next_cursor
+
+
+def jobs_needing_skill(skill_id):
+    """Subquery of job ids listing the skill - for Job.id.in_(...) filters."""
+    from app.models import JobSkill
+    return select(JobSkill.job_id).where(JobSkill.skill_id == skill_id)
+
+
+# ---------------------------------------------------------
+# 🔁 BACKFILL FROM THE LEGACY COLUMNS
+# ---------------------------------------------------------
+def _backfill(model, column, join_model, owner_column, batch_size, progress):
+    last_id, done = 0, 0
+    while True:
+        rows = db.session.query(model.id, column).filter(model.id > last_id) \
+            .order_by(model.id).limit(batch_size).all()
+        if not rows:
+            break
+
+        keys = {row.id: list(_skill_keys(parse_skill_list(row[1]))) for row in rows}
+        # One skill lookup / insert round for the whole batch
+        ids = _skill_ids_by_key(_skill_keys(
+            name for row in rows for name in parse_skill_list(row[1])
+        ))
+        skill_ids = {owner_id: [ids[key] for key in owner_keys] for owner_id, owner_keys in keys.items()}
+
+        _replace_rows(join_model, owner_column, list(skill_ids), skill_ids)
+        db.session.commit()
+
+        done += len(rows)
+        last_id = rows[-1].id
+        if progress:
+            progress(done)
+    return done
+
+
+def backfill(batch_size=BACKFILL_BATCH_SIZE, progress=None):
+    """Rebuilds job_skill / candidate_skill from the text columns in id batches. Returns (jobs, candidates)."""
+    from app.models import Candidate, CandidateSkill, Job, JobSkill
+
+    jobs = _backfill(Job, Job.required_skills, JobSkill, "job_id", batch_size,
+                     progress and (lambda n: progress("jobs", n)))
+    candidates = _backfill(Candidate, Candidate.skills, CandidateSkill, "candidate_id", batch_size,
+                           progress and (lambda n: progress("candidates", n)))
+    return jobs, candidates
@@ -0,0 +1,304 @@
+# backend/app/task_queue.py
+# Tiny DB-backed task queue + worker.
+#
+# - enqueue() adds a BackgroundTask row in the caller's transaction
+# - the worker claims rows with an atomic UPDATE (safe with several workers)
+# - heavy handlers (pdfminer / speech / TextBlob) run in a process pool so they
+#   are not serialized by the GIL; light handlers run inline in the worker loop
+# - failures are retried with exponential backoff, then marked "failed"
+
+import multiprocessing
+import os
+import threading
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update
+
+from app import db
+
+TASK_PENDING = "pending"
+TASK_RUNNING = "running"
+TASK_DONE = "done"
+TASK_FAILED = "failed"
+
+RETRY_BASE_SECONDS = 30
+STALE_AFTER = timedelta(minutes=15)  # "running" this long = worker died, hand it out again
+
+# kind -> {"fn": handler(payload), "process_pool": bool, "on_failure": fn(payload, error, final) | None}
+_handlers = {}
+
+
+def task_handler(kind, process_pool=False, on_failure=None):
+    """Registers `fn(payload)` as the handler for tasks of this kind."""
+    def wrapper(fn):
+        _handlers[kind] = {"fn": fn, "process_pool": process_pool, "on_failure": on_failure}
+        return fn
+    return wrapper
+
+
+def _load_handlers():
+    # Handler modules register themselves on import
+    import app.scoring  # noqa: F401
+    import app.rescoring  # noqa: F401
+    import app.candidate_search  # noqa: F401
+    import app.recommendations  # noqa: F401
+    import app.email_outbox  # noqa: F401
+
+
+def enqueue(kind, payload=None, ref_id=None, max_attempts=3):
+    """Adds a task to the current session. The caller commits (same transaction as its data)."""
+    from app.models import BackgroundTask
+
+    task = BackgroundTask(
+        kind=kind,
+        ref_id=ref_id,
+        payload=payload or {},
+        status=TASK_PENDING,
+        max_attempts=max_attempts,
+        run_after=datetime.utcnow(),
+    )
+    db.session.add(task)
+    return task
+
+
+def enqueue_once(kind, payload=None, ref_id=None, max_attempts=3):
+    """Like enqueue(), but skips it when the same kind/ref_id is already waiting (caller commits)."""
+    from app.models import BackgroundTask
+
+    already_queued = db.session.execute(
+        select(BackgroundTask.id).where(
+            BackgroundTask.kind == kind,
+            BackgroundTask.ref_id == ref_id,
+            BackgroundTask.status == TASK_PENDING,
+        ).limit(1)
+    ).scalar()
+    if already_queued:
+        return None
+    return enqueue(kind, payload, ref_id=ref_id, max_attempts=max_attempts)
+
+
+def heartbeat(kind, ref_id):
+    """
+    Refreshes locked_at of the running kind/ref_id task (caller commits). Long handlers
+    call it between batches so the task doesn't look stale and get handed out twice.
+    """
+    from app.models import BackgroundTask
+
+    db.session.execute(
+        update(BackgroundTask)
+        .where(BackgroundTask.kind == kind, BackgroundTask.ref_id == ref_id,
+               BackgroundTask.status == TASK_RUNNING)
+        .values(locked_at=datetime.utcnow())
+    )
+
+
+# -------------------------------------------------------
+# CLAIMING
+# -------------------------------------------------------
+def _requeue_stale_tasks():
+    from app.models import BackgroundTask
+
+    cutoff = datetime.utcnow() - STALE_AFTER
+    result = db.session.execute(
+        update(BackgroundTask)
+        .where(BackgroundTask.status == TASK_RUNNING, BackgroundTask.locked_at < cutoff)
+        .values(status=TASK_PENDING, locked_at=None)
+    )
+    if result.rowcount:
+        print(f"♻️ Re-queued {result.rowcount} stale task(s)")
+
+
+def claim_tasks(limit):
+    """Atomically moves up to `limit` due tasks to "running". Returns [(id, kind)]."""
+    from app.models import BackgroundTask
+
+    _requeue_stale_tasks()
+    now = datetime.utcnow()
+
+    candidates = db.session.execute(
+        select(BackgroundTask.id, BackgroundTask.kind)
+        .where(BackgroundTask.status == TASK_PENDING, BackgroundTask.run_after <= now)
+        .order_by(BackgroundTask.run_after)  # oldest due first, straight off ix_background_task_status_run_after
+        .limit(limit)
+    ).all()
+
+    claimed = []
+    for task_id, kind in candidates:
+        # Only one worker can win this UPDATE (status check in the WHERE clause)
+        result = db.session.execute(
+            update(BackgroundTask)
+            .where(BackgroundTask.id == task_id, BackgroundTask.status == TASK_PENDING)
+            .values(status=TASK_RUNNING, locked_at=now, attempts=BackgroundTask.attempts + 1)
+        )
+        if result.rowcount == 1:
+            claimed.append((task_id, kind))
+
+    db.session.commit()
+    return claimed
+
+
+# -------------------------------------------------------
+# EXECUTION
+# -------------------------------------------------------
+def execute_task(task_id):
+    """Runs one claimed task and records the outcome (done / retry / failed)."""
+    from app.models import BackgroundTask
+
+    _load_handlers()
+    task = db.session.get(BackgroundTask, task_id)
+    if not task:
+        return
+
+    handler = _handlers.get(task.kind)
+    payload = task.payload or {}
+
+    try:
+        if not handler:
+            raise RuntimeError(f"No handler registered for task kind '{task.kind}'")
+        handler["fn"](payload)
+
+        task = db.session.get(BackgroundTask, task_id)
+        task.status = TASK_DONE
+        task.last_error = None
+        task.finished_at = datetime.utcnow()
+        db.session.commit()
+
+    except Exception as e:
+        db.session.rollback()
+        error = f"{type(e).__name__}: {e}"
+        print(f"🔥 Task {task_id} ({payload}) failed: {error}")
+        traceback.print_exc()
+        _record_failure(task_id, error)
+
+
+def _record_failure(task_id, error):
+    """Retry with backoff (or "failed" once attempts run out) + the handler's on_failure hook."""
+    from app.models import BackgroundTask
+
+    task = db.session.get(BackgroundTask, task_id)
+    if not task or task.status != TASK_RUNNING:
+        return  # finished (or was re-queued) in the meantime
+    handler = _handlers.get(task.kind)
+    payload = task.payload or {}
+
+    task.last_error = error[:2000]
+    task.locked_at = None
+    if task.attempts >= task.max_attempts:
+        task.status = TASK_FAILED
+        task.finished_at = datetime.utcnow()
+    else:
+        # Exponential backoff: 30s, 60s, 120s, ...
+        delay = RETRY_BASE_SECONDS * (2 ** max(0, task.attempts - 1))
+        task.status = TASK_PENDING
+        task.run_after = datetime.utcnow() + timedelta(seconds=delay)
+    final = task.status == TASK_FAILED
+    db.session.commit()
+
+    if handler and handler["on_failure"]:
+        try:
+            handler["on_failure"](payload, error, final)
+            db.session.commit()
+        except Exception as hook_error:
+            db.session.rollback()
+            print(f"⚠️ on_failure hook for task {task_id} crashed: {hook_error}")
+
+
+# Process-pool side: every child builds its own app (own DB engine / connections)
+_child_app = None
+
+
+def _init_child():
+    global _child_app
+    from app import create_app
+    from app.ai_engine import warm_up
+    _child_app = create_app()
+    warm_up()  # Pay pdfminer / TextBlob import cost once per process, not on the first task
+
+
+def _child_execute(task_id):
+    with _child_app.app_context():
+        try:
+            execute_task(task_id)
+        finally:
+            db.session.remove()
+
+
+# -------------------------------------------------------
+# WORKER LOOP
+# -------------------------------------------------------
+def _new_pool(processes):
+    # "spawn" so children never inherit the parent's open DB connections
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_child,
+    )
+
+
+def run_worker(app, processes=None, poll_interval=2.0, stop_event=None):
+    """
+    Claims and runs tasks until `stop_event` is set (or forever).
+    Pool handlers are fanned out over `processes` child processes.
+    """
+    processes = processes or int(os.getenv("WORKER_PROCESSES", os.cpu_count() or 2))
+    stop_event = stop_event or threading.Event()
+    _load_handlers()
+
+    print(f"👷 Worker started ({processes} scoring processes)")
+    pool = _new_pool(processes)
+    in_flight = {}
+
+    try:
+        with app.app_context():
+            while not stop_event.is_set():
+                # 1. Reap finished pool work
+                for future in [f for f in in_flight if f.done()]:
+                    task_id = in_flight.pop(future)
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        # Every task still in the pool died with it - back in the queue now
+                        # (with the usual retry accounting), not after STALE_AFTER
+                        lost = [task_id, *in_flight.values()]
+                        print(f"⚠️ Scoring process died - restarting pool ({len(lost)} task(s) were in it)")
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        pool = _new_pool(processes)
+                        in_flight.clear()
+                        for lost_id in lost:
+                            _record_failure(lost_id, f"BrokenProcessPool: {error}")
+                        break
+                    if error:
+                        print(f"⚠️ Task {task_id} crashed in child: {error}")
+
+                # 2. Claim as much as the pool can take right now
+                free = processes - len(in_flight)
+                claimed = claim_tasks(free) if free > 0 else []
+
+                for task_id, kind in claimed:
+                    handler = _handlers.get(kind)
+                    if handler and handler["process_pool"]:
+                        in_flight[pool.submit(_child_execute, task_id)] = task_id
+                    else:
+                        execute_task(task_id)
+
+                db.session.remove()
+                if not claimed:
+                    stop_event.wait(poll_interval)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        print("👷 Worker stopped")
+
+
+def start_worker_thread(app, processes=None):
+    """Runs the worker inside the web process (handy for local dev with run.py)."""
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=run_worker,
+        kwargs={"app": app, "processes": processes, "stop_event": stop_event},
+        name="task-worker",
+        daemon=True,
+    )
+    thread.start()
+    return stop_event
@@ -0,0 +1,207 @@
+# backend/app/transcription.py
+# Speech-to-text for interview videos.
+#
+# Backends (TRANSCRIPTION_BACKEND env):
+#   "google"  - Google Web Speech API via speech_recognition (needs internet, default)
+#   "offline" - CMU Sphinx via speech_recognition + pocketsphinx (air-gapped installs)
+#   "stub"    - deterministic fake transcript for tests / benchmarks
+#
+# Audio is cut into overlapping chunks, chunks are transcribed concurrently and the
+# texts are stitched back together. A chunk that fails is logged and left empty -
+# it does not throw away the rest of the transcript (stats["failed_chunks"] says so, and
+# ai_engine keeps such a partial transcript out of the artifact cache).
+
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+
+from app.audio_stream import BYTES_PER_SECOND, SAMPLE_RATE, SAMPLE_WIDTH, iter_pcm_chunks
+
+CHUNK_SECONDS = int(os.getenv("AUDIO_CHUNK_SECONDS", 30))
+OVERLAP_SECONDS = float(os.getenv("AUDIO_OVERLAP_SECONDS", 2))
+TRANSCRIPTION_WORKERS = int(os.getenv("TRANSCRIPTION_WORKERS", os.cpu_count() or 2))
+MAX_STITCH_WORDS = 12  # longest word overlap we look for between two chunks
+
+
+# ---------------------------------------------------------
+# 🔌 BACKENDS
+# ---------------------------------------------------------
+class TranscriptionBackend:
+    """Turns one chunk of 16 kHz mono PCM into text. Returns "" when there is no speech."""
+    name = "base"
+    # "thread" for network-bound backends, "process" for CPU-bound local models
+    parallelism = "thread"
+
+    def transcribe(self, pcm, offset_seconds=0.0):
+        raise NotImplementedError
+
+
+class GoogleBackend(TranscriptionBackend):
+    name = "google"
+    parallelism = "thread"
+
+    def transcribe(self, pcm, offset_seconds=0.0):
+        import speech_recognition as sr
+
+        recognizer = sr.Recognizer()
+        try:
+            return recognizer.recognize_google(sr.AudioData(pcm, SAMPLE_RATE, SAMPLE_WIDTH))
+        except sr.UnknownValueError:
+            return ""
+
+
+class OfflineBackend(TranscriptionBackend):
+    """CMU Sphinx - runs fully locally (pip install pocketsphinx)."""
+    name = "offline"
+    parallelism = "process"
+
+    def transcribe(self, pcm, offset_seconds=0.0):
+        import speech_recognition as sr
+
+        recognizer = sr.Recognizer()
+        try:
+            return recognizer.recognize_sphinx(sr.AudioData(pcm, SAMPLE_RATE, SAMPLE_WIDTH))
+        except sr.UnknownValueError:
+            return ""
+
+
+class StubBackend(TranscriptionBackend):
+    """
+    Deterministic fake: one word per second of audio ("t0 t1 t2 ..."), based on the
+    chunk's position in the recording. Overlapping chunks repeat the same words,
+    so the stitching logic is exercised exactly like with a real recognizer.
+    """
+    name = "stub"
+    parallelism = "thread"
+
+    def transcribe(self, pcm, offset_seconds=0.0):
+        duration = len(pcm) / BYTES_PER_SECOND
+        first = int(math.ceil(offset_seconds))
+        last = int(math.ceil(offset_seconds + duration))
+        return " ".join(f"t{second}" for second in range(first, last))
+
+
+BACKENDS = {
+    GoogleBackend.name: GoogleBackend,
+    OfflineBackend.name: OfflineBackend,
+    StubBackend.name: StubBackend,
+}
+
+_backend_instances = {}
+
+
+def get_backend(name=None):
+    name = name or os.getenv("TRANSCRIPTION_BACKEND", GoogleBackend.name)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown transcription backend '{name}' (choose from {', '.join(BACKENDS)})")
+    if name not in _backend_instances:
+        _backend_instances[name] = BACKENDS[name]()
+    return _backend_instances[name]
+
+
+def _transcribe_chunk(backend_name, pcm, offset_seconds):
+    # Module level so process pools can pickle it; the child looks the backend up by name
+    return get_backend(backend_name).transcribe(pcm, offset_seconds)
+
+
+# ---------------------------------------------------------
+# 🧵 STITCHING
+# ---------------------------------------------------------
+def stitch_transcripts(parts, max_overlap=MAX_STITCH_WORDS):
+    """
+    Joins chunk transcripts, dropping words repeated because of the audio overlap
+    (longest suffix of the text so far that equals a prefix of the next chunk).
+    """
+    words = []
+    for part in parts:
+        new_words = part.split()
+        if not new_words:
+            continue
+
+        limit = min(max_overlap, len(words), len(new_words))
+        overlap = 0
+        for size in range(limit, 0, -1):
+            if [w.lower() for w in words[-size:]] == [w.lower() for w in new_words[:size]]:
+                overlap = size
+                break
+        words.extend(new_words[overlap:])
+    return " ".join(words)
+
+
+def _new_executor(backend, workers):
+    if backend.parallelism == "process":
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def transcribe_media(media_path, backend=None, chunk_seconds=CHUNK_SECONDS,
+                     overlap_seconds=OVERLAP_SECONDS, workers=TRANSCRIPTION_WORKERS, stats=None):
+    """
+    Full transcript of an audio/video file.
+    At most `workers * 2` chunks are decoded-but-not-transcribed at any time,
+    so memory stays bounded for long recordings.
+    If `stats` is a dict it gets: audio_seconds, chunks, failed_chunks,
+    decode_ms (time blocked on ffmpeg) and stt_wait_ms (time blocked on the recognizer).
+    """
+    stats = stats if stats is not None else {}
+    backend = backend or get_backend()
+    workers = max(1, workers)
+    window = workers * 2
+
+    results = {}
+    failed = 0
+    pending = {}
+    audio_bytes = 0
+    decode_seconds = 0.0
+    wait_seconds = 0.0
+
+    def collect(block_until):
+        nonlocal failed, wait_seconds
+        while len(pending) > block_until:
+            index, future = next(iter(pending.items()))
+            del pending[index]
+            try:
+                started = time.perf_counter()
+                try:
+                    results[index] = future.result() or ""
+                finally:
+                    wait_seconds += time.perf_counter() - started
+            except Exception as e:
+                failed += 1
+                results[index] = ""
+                print(f"⚠️ Transcription chunk {index} failed ({backend.name}): {e}")
+
+    executor = _new_executor(backend, workers)
+    try:
+        with closing(iter_pcm_chunks(media_path, chunk_seconds, overlap_seconds)) as chunks:
+            index = 0
+            while True:
+                started = time.perf_counter()
+                pcm = next(chunks, None)
+                decode_seconds += time.perf_counter() - started
+                if pcm is None:
+                    break
+                audio_bytes += len(pcm) - (int(overlap_seconds * BYTES_PER_SECOND) if index else 0)
+                offset = index * chunk_seconds - (overlap_seconds if index else 0)
+                pending[index] = executor.submit(_transcribe_chunk, backend.name, pcm, offset)
+                collect(window - 1)
+                index += 1
+        collect(0)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    stats.update({
+        "audio_seconds": round(max(audio_bytes, 0) / BYTES_PER_SECOND, 2),
+        "chunks": len(results),
+        "failed_chunks": failed,
+        "decode_ms": round(decode_seconds * 1000, 1),
+        "stt_wait_ms": round(wait_seconds * 1000, 1),
+    })
+
+    if failed:
+        print(f"⚠️ {failed}/{len(results)} transcription chunks failed - transcript is partial")
+
+    return stitch_transcripts(results[i] for i in sorted(results))
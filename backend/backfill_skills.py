@@ -0,0 +1,23 @@
+# backend/backfill_skills.py
+# Fills the normalized skill tables (skill, job_skill, candidate_skill) from the legacy
+# Job.required_skills / Candidate.skills text columns.
+#   python backfill_skills.py [batch_size]
+# Run once after migrate_db.py. Safe to re-run: each batch replaces the join rows of its
+# jobs / candidates. New writes keep the tables current on their own.
+# ---------------------------------------------------------
+
+import sys
+import time
+from app import create_app
+from app.skills import BACKFILL_BATCH_SIZE, backfill
+
+app = create_app()
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else BACKFILL_BATCH_SIZE
+
+    with app.app_context():
+        started = time.time()
+        print(f"🔨 Backfilling skills in batches of {batch_size}...")
+        jobs, candidates = backfill(batch_size, progress=lambda kind, done: print(f"   📈 {done} {kind}"))
+        print(f"✅ Skills backfilled for {jobs} jobs and {candidates} candidates in {time.time() - started:.1f}s")
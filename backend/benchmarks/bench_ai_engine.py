@@ -0,0 +1,300 @@
+# backend/benchmarks/bench_ai_engine.py
+# Benchmark harness for the AI scoring engine (run from backend/):
+#
+#   python -m benchmarks.bench_ai_engine                       -> run everything, print a table
+#   python -m benchmarks.bench_ai_engine --quick --only pdf_extract,skill_match
+#   python -m benchmarks.bench_ai_engine --save-baseline       -> store results in benchmarks/baseline.json
+#   python -m benchmarks.bench_ai_engine --compare             -> diff against the saved baseline
+#   python -m benchmarks.bench_ai_engine --compare --fail-on-regression   (exit 1 on regressions, for CI)
+#
+# Every harness runs in its own fresh (spawned) process, so import cost is excluded by a
+# warm-up call and peak RSS is that harness's own high-water mark. Video transcription
+# uses the deterministic "stub" STT backend unless --transcription-backend says otherwise.
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from benchmarks.corpus import BENCH_DIR, DEFAULT_SPEC, QUICK_SPEC, build_corpus
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 10.0  # % change that counts as a regression
+
+# metric -> True if higher is better
+METRICS = {
+    "throughput_per_s": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "peak_rss_mb": False,
+}
+
+
+# ---------------------------------------------------------
+# 🧪 HARNESSES (each returns a list of zero-arg callables = one timed op each)
+# ---------------------------------------------------------
+def _pdf_extract(manifest):
+    from app.ai_engine import extract_text_from_pdf
+    return [lambda p=r["path"]: extract_text_from_pdf(p) for r in manifest["resumes"]]
+
+
+def _jd_extract(manifest):
+    from app.ai_engine import extract_jd_text
+    return [lambda p=j["path"]: extract_jd_text(p) for j in manifest["jds"]]
+
+
+def _video_transcribe(manifest):
+    from app.ai_engine import extract_text_from_video
+    return [lambda p=v["path"]: extract_text_from_video(p) for v in manifest["videos"]]
+
+
+def _resume_texts(manifest):
+    from app.ai_engine import extract_text_from_pdf
+    return [extract_text_from_pdf(r["path"]) for r in manifest["resumes"]]  # setup, not timed
+
+
+def _skill_match(manifest):
+    from app.ai_engine import score_texts
+
+    texts = _resume_texts(manifest)
+    ops = []
+    for job_id, jd in enumerate(manifest["jds"], start=1):
+        for text in texts:
+            ops.append(lambda t=text, s=jd["skills"], j=job_id: score_texts(
+                t, "", s, job_id=j, sentiment=(0, "n/a"), verbose=False
+            ))
+    return ops
+
+
+def _sentiment(manifest):
+    from app.ai_engine import analyze_sentiment
+    # Interview-transcript sized snippets (a few hundred words)
+    return [lambda t=text[:3000]: analyze_sentiment(t) for text in _resume_texts(manifest)]
+
+
+def _end_to_end(manifest):
+    from app.ai_engine import calculate_ai_score
+
+    videos = [v["path"] for v in manifest["videos"]] or [None]
+    ops = []
+    for i, resume in enumerate(manifest["resumes"]):
+        jd = manifest["jds"][i % len(manifest["jds"])]
+        ops.append(lambda r=resume["path"], v=videos[i % len(videos)], s=jd["skills"], j=i % len(manifest["jds"]) + 1:
+                   calculate_ai_score(r, v, s, job_id=j))
+    return ops
+
+
+HARNESSES = {
+    "pdf_extract": _pdf_extract,
+    "jd_extract": _jd_extract,
+    "video_transcribe": _video_transcribe,
+    "skill_match": _skill_match,
+    "sentiment": _sentiment,
+    "end_to_end": _end_to_end,
+}
+
+
+# ---------------------------------------------------------
+# 📏 MEASURING
+# ---------------------------------------------------------
+def _percentile(sorted_values, pct):
+    """Linear interpolation between closest ranks (same as numpy's default)."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    low = int(position)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def summarize(samples, wall_seconds):
+    ordered = sorted(samples)
+    return {
+        "n": len(samples),
+        "throughput_per_s": round(len(samples) / wall_seconds, 3) if wall_seconds else 0.0,
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+    }
+
+
+def run_harness(name, manifest, repeat, env):
+    """Runs in a fresh child process: warm up once, then time every op `repeat` times."""
+    os.environ.update(env)
+    ops = HARNESSES[name](manifest)
+    if not ops:
+        return {"skipped": "no inputs"}
+
+    quiet = io.StringIO()
+    with contextlib.redirect_stdout(quiet):  # the engine prints a lot per call
+        ops[0]()  # warm-up: lazy imports, TextBlob lexicon, matcher cache
+
+        samples = []
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for op in ops:
+                t0 = time.perf_counter()
+                op()
+                samples.append(time.perf_counter() - t0)
+        wall = time.perf_counter() - started
+
+    result = summarize(samples, wall)
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def run_all(names, manifest, repeat, env):
+    results = {}
+    spawn = multiprocessing.get_context("spawn")
+    for name in names:
+        print(f"⏱️  {name} ...", flush=True)
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+            try:
+                results[name] = pool.submit(run_harness, name, manifest, repeat, env).result()
+            except Exception as e:
+                print(f"   ❌ {name} failed: {e}")
+                results[name] = {"error": str(e)}
+    return results
+
+
+# ---------------------------------------------------------
+# 📊 REPORTING / BASELINES
+# ---------------------------------------------------------
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=BENCH_DIR, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info(spec, repeat, env):
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "spec": spec,
+        "repeat": repeat,
+        "env": env,
+    }
+
+
+def print_table(results):
+    header = f"{'harness':<18}{'n':>6}{'ops/s':>11}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'peak MB':>10}"
+    print("\n" + header)
+    print("-" * len(header))
+    for name, r in results.items():
+        if "n" not in r:
+            print(f"{name:<18}  {r.get('error') or r.get('skipped')}")
+            continue
+        print(f"{name:<18}{r['n']:>6}{r['throughput_per_s']:>11.2f}{r['p50_ms']:>11.2f}"
+              f"{r['p95_ms']:>11.2f}{r['p99_ms']:>11.2f}{(r['peak_rss_mb'] or 0):>10.1f}")
+
+
+def compare(results, baseline, threshold):
+    """Prints per-metric deltas vs the baseline. Returns the list of regressions."""
+    regressions = []
+    base_results = baseline.get("results", {})
+    print(f"\n📊 Compared with baseline from {baseline.get('meta', {}).get('timestamp')} "
+          f"(commit {baseline.get('meta', {}).get('git_commit')}), threshold {threshold:.0f}%")
+
+    for name, r in results.items():
+        base = base_results.get(name)
+        if not base or "n" not in base or "n" not in r:
+            print(f"   {name}: no comparable baseline")
+            continue
+        parts = []
+        for metric, higher_is_better in METRICS.items():
+            old, new = base.get(metric), r.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            worse = -change if higher_is_better else change
+            mark = "⚠️" if worse > threshold else ("🚀" if worse < -threshold else "  ")
+            if worse > threshold:
+                regressions.append(f"{name}.{metric} {change:+.1f}%")
+            parts.append(f"{mark}{metric} {change:+.1f}%")
+        print(f"   {name:<18}" + "  ".join(parts))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the AI scoring engine")
+    parser.add_argument("--only", help="comma separated harnesses: " + ",".join(HARNESSES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over the corpus per harness")
+    parser.add_argument("--quick", action="store_true", help="smaller corpus, 1 pass (smoke run)")
+    parser.add_argument("--regenerate", action="store_true", help="rebuild the synthetic corpus")
+    parser.add_argument("--transcription-backend", default="stub")
+    parser.add_argument("--save-baseline", nargs="?", const=DEFAULT_BASELINE, metavar="PATH")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, metavar="PATH")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="regression threshold in %%")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--json", metavar="PATH", help="also write raw results here")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else list(HARNESSES)
+    unknown = [n for n in names if n not in HARNESSES]
+    if unknown:
+        parser.error(f"unknown harness(es): {', '.join(unknown)}")
+
+    spec = QUICK_SPEC if args.quick else DEFAULT_SPEC
+    repeat = 1 if args.quick else args.repeat
+    env = {"TRANSCRIPTION_BACKEND": args.transcription_backend}
+
+    manifest = build_corpus(spec, force=args.regenerate)
+    results = run_all(names, manifest, repeat, env)
+    report = {"meta": environment_info(spec, repeat, env), "results": results}
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\n💾 Baseline saved to {args.save_baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"\n❌ No baseline at {args.compare} (run with --save-baseline first)")
+            return 2
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if baseline.get("meta", {}).get("spec") != spec:
+            print("⚠️ Baseline was recorded on a different corpus spec - numbers are not comparable")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n⚠️ Regressions: " + ", ".join(regressions))
+            if args.fail_on_regression:
+                return 1
+        else:
+            print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
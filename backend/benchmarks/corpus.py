@@ -0,0 +1,225 @@
+# backend/benchmarks/corpus.py
+# Synthetic, reproducible benchmark corpus: resume PDFs, JD PDFs and short interview clips.
+#
+# Everything is derived from a seed, so two runs (or two machines) get byte-identical
+# inputs. PDFs are written by hand (no reportlab needed); clips are made with the same
+# ffmpeg binary the engine uses. Generated files are cached in benchmarks/.corpus/<seed>/.
+
+import hashlib
+import json
+import os
+import random
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_ROOT = os.path.join(BENCH_DIR, ".corpus")
+ONTOLOGY_FILE = os.path.join(BENCH_DIR, "..", "app", "data", "skill_ontology.json")
+
+DEFAULT_SPEC = {
+    "seed": 42,
+    "resume_pages": [1, 2, 5, 20],  # one size class per entry
+    "resumes_per_size": 5,
+    "jds": 5,
+    "video_seconds": [5, 20],
+    "videos_per_length": 2,
+}
+QUICK_SPEC = dict(DEFAULT_SPEC, resume_pages=[1, 5], resumes_per_size=2, jds=2, video_seconds=[5], videos_per_length=1)
+
+LINES_PER_PAGE = 56
+
+FIRST_NAMES = ["Aarav", "Priya", "Rahul", "Ananya", "Vikram", "Sneha", "Arjun", "Meera", "Karan", "Isha"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Gupta", "Nair", "Singh", "Kulkarni", "Das", "Mehta"]
+CITIES = ["Pune", "Bengaluru", "Mumbai", "Hyderabad", "Chennai", "Delhi", "Remote"]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Zoho", "Freshworks", "Flipkart", "Razorpay", "Swiggy", "Acme Corp"]
+TITLES = ["Software Engineer", "Backend Developer", "Frontend Developer", "Data Engineer",
+          "Full Stack Developer", "ML Engineer", "DevOps Engineer", "QA Engineer"]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Optimized", "Maintained", "Automated", "Implemented"]
+OBJECTS = ["a payments service", "the reporting pipeline", "an internal dashboard", "the search API",
+           "a recommendation engine", "CI pipelines", "the onboarding flow", "batch ETL jobs"]
+OUTCOMES = ["cutting latency by 40%", "serving 2M requests a day", "for 12 enterprise clients",
+            "reducing cloud cost by 25%", "with 99.9% uptime", "used by 300 analysts"]
+
+
+def load_skill_names():
+    with open(ONTOLOGY_FILE, encoding="utf-8") as fh:
+        skills = json.load(fh)["skills"]
+    names = []
+    for skill in skills:
+        names.append(skill.get("name", skill["id"]))
+        names.extend(skill.get("aliases", [])[:2])
+    return names
+
+
+# ---------------------------------------------------------
+# 📄 MINIMAL PDF WRITER
+# ---------------------------------------------------------
+def _pdf_escape(text):
+    text = text.encode("latin-1", "replace").decode("latin-1")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path, pages):
+    """Writes `pages` (list of lists of text lines) as a Helvetica text PDF pdfminer can read."""
+    objects = []  # object bodies; object number = index + 1
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog_id = add(None)  # filled in once the page tree exists
+    pages_id = add(None)
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for lines in pages:
+        stream = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+        for line in lines:
+            stream.append(f"({_pdf_escape(line)}) Tj T*")
+        stream.append("ET")
+        content = "\n".join(stream).encode("latin-1")
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages_id, font_id, content_id)
+        ))
+
+    kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+    objects[catalog_id - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref_at = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog_id, xref_at)
+
+    with open(path, "wb") as fh:
+        fh.write(out)
+
+
+# ---------------------------------------------------------
+# 🧑‍💼 RESUMES / JDS
+# ---------------------------------------------------------
+def _paginate(lines):
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+
+
+def resume_lines(rnd, skill_names, pages):
+    name = f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}"
+    skills = rnd.sample(skill_names, min(len(skill_names), 8 + 2 * pages))
+
+    lines = [
+        name,
+        f"{name.split()[0].lower()}@example.com | +91 98{rnd.randint(10000000, 99999999)} | {rnd.choice(CITIES)}",
+        "",
+        "SUMMARY",
+        f"{rnd.choice(TITLES)} with {rnd.randint(1, 12)} years of experience in {', '.join(skills[:3])}.",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+        "",
+        "EXPERIENCE",
+    ]
+    target = pages * LINES_PER_PAGE - 10  # leave room for the last job block + education
+    while len(lines) < target:
+        lines.append(f"{rnd.choice(TITLES)} - {rnd.choice(COMPANIES)} ({rnd.randint(2010, 2025)})")
+        for _ in range(rnd.randint(3, 6)):
+            lines.append(
+                f"- {rnd.choice(VERBS)} {rnd.choice(OBJECTS)} using {rnd.choice(skills)} "
+                f"and {rnd.choice(skills)}, {rnd.choice(OUTCOMES)}."
+            )
+        lines.append("")
+
+    lines += ["EDUCATION", f"B.Tech in Computer Science, {rnd.choice(CITIES)} University ({rnd.randint(2005, 2022)})"]
+    return _paginate(lines[:pages * LINES_PER_PAGE])
+
+
+def jd_content(rnd, skill_names):
+    title = rnd.choice(TITLES)
+    skills = rnd.sample(skill_names, rnd.randint(5, 12))
+    lines = [
+        f"Job Title: {title}",
+        f"Location: {rnd.choice(CITIES)}",
+        f"Experience: {rnd.randint(1, 5)}-{rnd.randint(6, 10)} years",
+        "",
+        "Responsibilities",
+    ]
+    lines += [f"- {rnd.choice(VERBS)} {rnd.choice(OBJECTS)} {rnd.choice(OUTCOMES)}." for _ in range(8)]
+    lines += ["", "Required Skills"] + [f"- {skill}" for skill in skills]
+    return _paginate(lines), skills
+
+
+# ---------------------------------------------------------
+# 🎬 CLIPS
+# ---------------------------------------------------------
+def write_clip(path, seconds, frequency):
+    """Tiny mp4: a tone + black video (enough to exercise demux, resampling and chunking)."""
+    from app.audio_stream import ffmpeg_binary
+
+    subprocess.run([
+        ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-y",
+        "-f", "lavfi", "-i", f"sine=frequency={frequency}:duration={seconds}",
+        "-f", "lavfi", "-i", f"color=c=black:s=160x120:r=10:d={seconds}",
+        "-shortest", "-c:v", "libx264", "-preset", "ultrafast", "-c:a", "aac",
+        path,
+    ], check=True)
+
+
+# ---------------------------------------------------------
+# 📦 CORPUS
+# ---------------------------------------------------------
+def build_corpus(spec=None, force=False):
+    """
+    Generates (or reuses) the corpus for `spec` and returns its manifest:
+    {"spec", "resumes": [{"path", "pages"}], "jds": [{"path", "skills"}], "videos": [{"path", "seconds"}]}
+    """
+    spec = spec or DEFAULT_SPEC
+    spec_key = json.dumps(spec, sort_keys=True)
+    corpus_dir = os.path.join(CORPUS_ROOT, f"seed{spec['seed']}-{hashlib.sha1(spec_key.encode()).hexdigest()[:8]}")
+    manifest_path = os.path.join(corpus_dir, "manifest.json")
+
+    if not force and os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        if manifest.get("spec") == spec and all(
+            os.path.exists(item["path"]) for key in ("resumes", "jds", "videos") for item in manifest[key]
+        ):
+            return manifest
+
+    os.makedirs(corpus_dir, exist_ok=True)
+    rnd = random.Random(spec["seed"])
+    skill_names = load_skill_names()
+    manifest = {"spec": spec, "resumes": [], "jds": [], "videos": []}
+
+    for pages in spec["resume_pages"]:
+        for i in range(spec["resumes_per_size"]):
+            path = os.path.join(corpus_dir, f"resume_{pages}p_{i}.pdf")
+            write_pdf(path, resume_lines(rnd, skill_names, pages))
+            manifest["resumes"].append({"path": path, "pages": pages})
+
+    for i in range(spec["jds"]):
+        path = os.path.join(corpus_dir, f"jd_{i}.pdf")
+        pages, skills = jd_content(rnd, skill_names)
+        write_pdf(path, pages)
+        manifest["jds"].append({"path": path, "skills": skills})
+
+    for seconds in spec["video_seconds"]:
+        for i in range(spec["videos_per_length"]):
+            path = os.path.join(corpus_dir, f"clip_{seconds}s_{i}.mp4")
+            try:
+                write_clip(path, seconds, 220 + 110 * i)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"⚠️ Could not generate {path} (ffmpeg missing?): {e}")
+                continue
+            manifest["videos"].append({"path": path, "seconds": seconds})
+
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+    print(f"📦 Benchmark corpus ready in {corpus_dir}")
+    return manifest
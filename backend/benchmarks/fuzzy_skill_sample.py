@@ -0,0 +1,121 @@
+# backend/benchmarks/fuzzy_skill_sample.py
+# Precision / recall of the fuzzy skill fallback on a small hand-labeled sample (run from backend/):
+#
+#   python -m benchmarks.fuzzy_skill_sample            -> summary table
+#   python -m benchmarks.fuzzy_skill_sample --verbose  -> plus every case a matcher gets wrong
+#
+# Only the fallback is measured: each case is a skill the exact / ontology matching would
+# NOT find in the text (typo, plural, look-alike word). Matchers compared:
+#   baseline     fuzz.partial_token_set_ratio(skill, text) > 90 (before app/fuzzy_index.py)
+#   ratio>=90    DocumentIndex with fuzz.ratio >= 90 for every word length (first version)
+#   current      DocumentIndex with the length-dependent rules of is_typo_of()
+
+import argparse
+from unittest import mock
+
+from app import fuzzy_index
+from app.fuzzy_index import DocumentIndex, FUZZY_THRESHOLD
+
+# (resume snippet, required skill, should match)
+SAMPLE = [
+    # One typo / swapped letters - a person would count these
+    ("3 years of backend work in pythen and flask", "python", True),
+    ("built rest apis with djnago and celery", "django", True),
+    ("frontend in raect with redux", "react", True),
+    ("services written in rsut and go", "rust", True),
+    ("spring boot microservices in jvaa 17", "java", True),
+    ("deployed on kubernetse clusters", "kubernetes", True),
+    ("strong postgersql and redis skills", "postgresql", True),
+    ("migrated the ui to typescirpt", "typescript", True),
+    ("ci/cd with jenkisn pipelines", "jenkins", True),
+    ("containerised everything with dokcer", "docker", True),
+    ("dashboards in tableu for sales", "tableau", True),
+    ("data pipelines with pyspark and airflwo", "airflow", True),
+    ("models trained with tensorflwo and keras", "tensorflow", True),
+    ("automation with ansibel playbooks", "ansible", True),
+    ("cloud: terrafrom, aws", "terraform", True),
+    ("mobile apps in kotiln", "kotlin", True),
+    ("experience with elasticsearh clusters", "elasticsearch", True),
+    ("knowledge of graphql and mongodbb", "mongodb", True),
+    # Plurals / word forms
+    ("designed several microservice apis", "microservices", True),
+    ("wrote unit tests and integration tests", "unit test", True),
+    ("machine-learning models in production", "machine learning", True),
+    # Look-alike words that are NOT the skill
+    ("worked at scale for 2m users", "scala", False),
+    ("increased reach of campaigns", "react", False),
+    ("wrote node scripts", "code", False),
+    ("earned the trust of clients", "rust", False),
+    ("team lead for 5 people", "jest", False),
+    ("handled swift delivery of parcels", "sift", False),
+    ("managed the company's learning program", "machine learning", False),
+    ("fluent in english and hindi", "angular", False),
+    ("excellent communication skills", "unity", False),
+    ("presented at the python meetup on data science", "data engineering", False),
+    ("shipped features in ruby", "rugby", False),
+    ("used jira and confluence", "java", False),
+    ("member of the chess club", "chef", False),
+    ("sales and marketing background", "spark", False),
+    ("working on problem solving", "prolog", False),
+    ("strong excel reporting", "express", False),
+    ("documentation in markdown", "mark", False),
+    ("performance testing with locust", "lotus", False),
+    ("knowledge of networking basics", "netlify", False),
+]
+
+
+def baseline(text, skill):
+    from thefuzz import fuzz
+    return fuzz.partial_token_set_ratio(skill, text) > 90
+
+
+def _index_match(text, skill):
+    return skill in DocumentIndex(text).find_fuzzy([skill], FUZZY_THRESHOLD)
+
+
+def ratio_only(text, skill):
+    from thefuzz import fuzz
+    # SHORT_WORD_LEN = 0: 4-5 letter words go through the trigram prefilter like they used to
+    with mock.patch.object(fuzzy_index, "SHORT_WORD_LEN", 0), \
+            mock.patch.object(fuzzy_index, "is_typo_of",
+                              lambda word, token, threshold: fuzz.ratio(word, token) >= threshold):
+        return _index_match(text, skill)
+
+
+MATCHERS = {"baseline": baseline, "ratio>=90": ratio_only, "current": _index_match}
+
+
+def evaluate(matcher):
+    tp = fp = fn = 0
+    wrong = []
+    for text, skill, expected in SAMPLE:
+        found = matcher(text, skill)
+        tp += found and expected
+        fp += found and not expected
+        fn += expected and not found
+        if found != expected:
+            wrong.append((skill, text, "false match" if found else "missed"))
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    return {"tp": tp, "fp": fp, "fn": fn, "precision": precision, "recall": recall, "wrong": wrong}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy skill fallback on a labeled sample")
+    parser.add_argument("--verbose", action="store_true", help="list the cases each matcher gets wrong")
+    args = parser.parse_args()
+
+    positives = sum(1 for case in SAMPLE if case[2])
+    print(f"{len(SAMPLE)} cases ({positives} should match, {len(SAMPLE) - positives} should not)\n")
+    print(f"{'matcher':<12}{'TP':>5}{'FP':>5}{'FN':>5}{'precision':>12}{'recall':>9}")
+    for name, matcher in MATCHERS.items():
+        result = evaluate(matcher)
+        print(f"{name:<12}{result['tp']:>5}{result['fp']:>5}{result['fn']:>5}"
+              f"{result['precision']:>12.2f}{result['recall']:>9.2f}")
+        if args.verbose:
+            for skill, text, kind in result["wrong"]:
+                print(f"    {kind:<12}{skill!r} in {text!r}")
+
+
+if __name__ == "__main__":
+    main()
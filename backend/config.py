@@ -20,8 +20,9 @@ class Config:
     MAIL_USE_TLS = True
     MAIL_USE_SSL = False
 
-    # 👇 PASTE YOUR CREDENTIALS HERE DIRECTLY
-    MAIL_USERNAME = "recruitpro.demo.2026@gmail.com"  # <--- Your Bot Email
-    MAIL_PASSWORD = "abcd efgh ijkl mnop"  # <--- Your 16-digit App Password
+    # Credentials come from the environment (.env): MAIL_USERNAME / MAIL_PASSWORD
+    # (EMAIL_USER / EMAIL_PASS still work). app/__init__.py has the final say on MAIL_*.
+    MAIL_USERNAME = os.environ.get('MAIL_USERNAME') or os.environ.get('EMAIL_USER')
+    MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD') or os.environ.get('EMAIL_PASS')
 
-    MAIL_DEFAULT_SENDER = MAIL_USERNAME
\ No newline at end of file
+    MAIL_DEFAULT_SENDER = MAIL_USERNAME
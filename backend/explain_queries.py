@@ -0,0 +1,188 @@
+# backend/explain_queries.py
+# Prints the query plan of every endpoint's main query and flags full table scans / sorts.
+#   python explain_queries.py            -> report
+#   python explain_queries.py --strict   -> exit 1 if any query scans or sorts (for CI)
+# Works on SQLite (EXPLAIN QUERY PLAN) and Postgres (EXPLAIN with enable_seqscan off, so a
+# small dev table still shows whether an index path exists). Run migrate_db.py first.
+# ---------------------------------------------------------
+
+import re
+import sys
+from datetime import datetime
+
+from sqlalchemy import func, select, text
+
+from app import create_app, db
+from app.models import (
+    Application, BackgroundTask, Candidate, CandidatePreference, CandidateSkill, EmailOutbox, Job, JobAnalyticsRollup,
+    JobRecommendation, JobSkill, ProctoringEvent, Skill, User
+)
+
+app = create_app()
+
+SAMPLE_ID = 1
+SAMPLE_TIME = datetime(2030, 1, 1)
+
+# Sorts that only ever see the rows of one selective index range (reported, not flagged):
+# ?skill= reads the jobs listing that skill via ix_job_skill_skill_job, then orders them
+BOUNDED_SORTS = {"GET /api/jobs?skill= (keyset page)"}
+
+
+def main_queries():
+    """(endpoint, statement) pairs mirroring what each route actually runs."""
+    return [
+        ("GET /api/jobs (keyset page)", select(Job.id, Job.title).where(
+            (Job.created_at < SAMPLE_TIME) | ((Job.created_at == SAMPLE_TIME) & (Job.id < SAMPLE_ID))
+        ).order_by(Job.created_at.desc(), Job.id.desc()).limit(21)),
+
+        ("GET /api/jobs?skill= (keyset page)", select(Job.id, Job.title).where(
+            Job.id.in_(select(JobSkill.job_id).where(JobSkill.skill_id == SAMPLE_ID))
+        ).order_by(Job.created_at.desc(), Job.id.desc()).limit(21)),
+
+        ("GET /api/hr/jobs", select(Job).where(Job.created_by == SAMPLE_ID).order_by(Job.created_at.desc())),
+
+        ("GET /api/hr/jobs (pipeline counts)", select(Application.job_id, Application.status, func.count(Application.id))
+            .join(Job, Job.id == Application.job_id).where(Job.created_by == SAMPLE_ID)
+            .group_by(Application.job_id, Application.status)),
+
+        ("login / register (user by email)", select(User).where(User.email == "hr@example.com")),
+
+        ("candidate endpoints (profile by user_id)", select(Candidate).where(Candidate.user_id == SAMPLE_ID)),
+
+        ("GET/POST /api/candidate/preferences", select(CandidatePreference).where(CandidatePreference.user_id == SAMPLE_ID)),
+
+        ("POST /api/jobs/<id>/apply (duplicate check)", select(Application.id).where(
+            Application.job_id == SAMPLE_ID, Application.candidate_id == SAMPLE_ID)),
+
+        ("GET /api/candidate/applications", text("""
+            SELECT a.id, j.title, a.status FROM application a
+            JOIN job j ON j.id = a.job_id
+            WHERE a.candidate_id = :cid
+            ORDER BY a.created_at DESC
+        """).bindparams(cid=SAMPLE_ID)),
+
+        ("GET /api/hr/jobs/<id>/applicants (page rows)", select(Application.id, Candidate.name, User.email)
+            .outerjoin(Candidate, Application.candidate_id == Candidate.id)
+            .outerjoin(User, Candidate.user_id == User.id)
+            .where(Application.job_id == SAMPLE_ID)
+            .order_by(Application.score.desc(), Application.id.desc()).limit(51)),
+
+        ("GET /api/hr/candidates?skill= (skill lookup)", select(Skill).where(Skill.key == "react")),
+
+        ("GET /api/hr/candidates?skill= (page)", select(CandidateSkill.candidate_id).where(
+            CandidateSkill.skill_id == SAMPLE_ID, CandidateSkill.candidate_id < 1000
+        ).order_by(CandidateSkill.candidate_id.desc()).limit(51)),
+
+        ("skills of a page of candidates", select(CandidateSkill.candidate_id, Skill.name)
+            .join(Skill, Skill.id == CandidateSkill.skill_id)
+            .where(CandidateSkill.candidate_id.in_([1, 2, 3]))
+            .order_by(CandidateSkill.candidate_id, CandidateSkill.position)),
+
+        ("GET /api/hr/jobs/<id>/applicants (by score, keyset page)", select(Application.id, Application.score)
+            .where(Application.job_id == SAMPLE_ID,
+                   Application.score <= 80, (Application.score < 80) | (Application.id < 1000))
+            .order_by(Application.score.desc(), Application.id.desc()).limit(51)),
+
+        ("GET /api/hr/jobs/<id>/applicants (by date, Shortlisted)", select(Application.id)
+            .where(Application.job_id == SAMPLE_ID, Application.status.in_(["Shortlisted"]))
+            .order_by(Application.created_at.desc(), Application.id.desc()).limit(51)),
+
+        ("POST /api/hr/applications/bulk-status (filter)", select(Application.id)
+            .where(Application.job_id == SAMPLE_ID, Application.status.in_(["Applied"]), Application.score <= 39)),
+
+        ("GET /api/hr/analytics (one job)", select(JobAnalyticsRollup).where(JobAnalyticsRollup.job_id == SAMPLE_ID)),
+
+        ("GET /api/hr/analytics (matrix page)", select(Application.id, Application.trust_score, Application.score)
+            .where(Application.job_id == SAMPLE_ID, Application.id < 1000)
+            .order_by(Application.id.desc()).limit(501)),
+
+        ("GET /api/applications/<id>/scoring (task)", select(BackgroundTask).where(
+            BackgroundTask.kind == "score_application", BackgroundTask.ref_id == SAMPLE_ID
+        ).order_by(BackgroundTask.id.desc()).limit(1)),
+
+        ("worker: claim due tasks", select(BackgroundTask.id, BackgroundTask.kind).where(
+            BackgroundTask.status == "pending", BackgroundTask.run_after <= SAMPLE_TIME
+        ).order_by(BackgroundTask.run_after).limit(8)),
+
+        ("POST /api/applications/<id>/proctoring-events (newest per type)", select(ProctoringEvent.id)
+            .where(ProctoringEvent.id.in_(
+                select(func.max(ProctoringEvent.id)).where(ProctoringEvent.application_id == SAMPLE_ID)
+                .group_by(ProctoringEvent.type)))),
+
+        ("GET /api/hr/applications/<id>/proctoring (per type)", select(
+            ProctoringEvent.type, func.count(), func.sum(ProctoringEvent.penalty))
+            .where(ProctoringEvent.application_id == SAMPLE_ID).group_by(ProctoringEvent.type)),
+
+        ("worker: claim due emails", select(EmailOutbox.id).where(
+            EmailOutbox.status == "pending", EmailOutbox.send_after <= SAMPLE_TIME
+        ).order_by(EmailOutbox.send_after).limit(50)),
+
+        ("GET /api/candidate/recommendations", select(JobRecommendation, Job)
+            .join(Job, Job.id == JobRecommendation.job_id)
+            .where(JobRecommendation.candidate_id == SAMPLE_ID, Job.is_active.is_(True))
+            .order_by(JobRecommendation.score.desc(), JobRecommendation.job_id.desc()).limit(21)),
+    ]
+
+
+# ---------------------------------------------------------
+# 🔍 EXPLAIN PER DIALECT
+# ---------------------------------------------------------
+def explain(conn, statement):
+    compiled = statement.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + compiled.string, params).all()
+        return [row[-1] for row in rows]
+    rows = conn.exec_driver_sql("EXPLAIN " + compiled.string, params).all()
+    return [" | ".join(str(v) for v in row) for row in rows]
+
+
+def problems(dialect, plan):
+    found = []
+    for line in plan:
+        if dialect == "sqlite":
+            scan = re.match(r"SCAN (\w+)(.*)", line.strip())
+            if scan and "INDEX" not in scan.group(2) and scan.group(1) != "CONSTANT":
+                found.append(f"full scan of {scan.group(1)}")
+            # GROUP BY b-trees hold one row per group (jobs x statuses) - only ORDER BY sorts matter
+            if "TEMP B-TREE FOR ORDER BY" in line:
+                found.append("sort without an index")
+        elif dialect == "postgresql":
+            scan = re.search(r"Seq Scan on (\w+)", line)
+            if scan:
+                found.append(f"full scan of {scan.group(1)}")
+            if re.search(r"(^|\s)Sort\b", line):
+                found.append("sort without an index")
+        elif dialect in ("mysql", "mariadb") and "| ALL |" in f"| {line} |":
+            found.append("full scan")
+    return found
+
+
+if __name__ == "__main__":
+    strict = "--strict" in sys.argv
+    flagged = 0
+
+    with app.app_context():
+        with db.engine.connect() as conn:
+            dialect = conn.dialect.name
+            if dialect == "postgresql":
+                conn.exec_driver_sql("SET enable_seqscan = off")
+
+            print(f"🔎 Query plans ({dialect})\n")
+            for endpoint, statement in main_queries():
+                plan = explain(conn, statement)
+                issues = problems(dialect, plan)
+                if endpoint in BOUNDED_SORTS:
+                    issues = [issue for issue in issues if issue != "sort without an index"]
+                flagged += bool(issues)
+                print(f"{'⚠️ ' if issues else '✅'} {endpoint}" + (f"  -> {', '.join(issues)}" if issues else ""))
+                for line in plan:
+                    print(f"      {line}")
+            conn.rollback()
+
+    print(f"\n{'⚠️' if flagged else '✅'} {flagged} of {len(main_queries())} queries need attention")
+    sys.exit(1 if strict and flagged else 0)
@@ -0,0 +1,11 @@
+# backend/init_db.py
+# Creates every table from app/models.py (safe to re-run: existing tables are left alone).
+#   python init_db.py
+# ---------------------------------------------------------
+
+from app import create_app, init_db
+
+app = create_app()
+
+if __name__ == "__main__":
+    init_db(app)
@@ -0,0 +1,21 @@
+# backend/migrate_db.py
+# Brings an existing database up to the current models: creates missing tables, adds
+# missing columns / indexes / unique constraints (see app/migrations.py). Safe to re-run.
+#   python migrate_db.py            -> apply pending migrations
+#   python migrate_db.py --dry-run  -> list what would run
+# Replaces fix_db_schema.py. After the first run on an old database, run
+# rebuild_analytics.py, rebuild_search_index.py and backfill_skills.py once.
+# ---------------------------------------------------------
+
+import sys
+from app import create_app
+from app.migrations import MigrationError, run_migrations
+
+app = create_app()
+
+if __name__ == "__main__":
+    try:
+        run_migrations(app, dry_run="--dry-run" in sys.argv)
+    except MigrationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
@@ -0,0 +1,25 @@
+# backend/rebuild_analytics.py
+# Recomputes the HR analytics rollups (job_analytics_rollup) from the applications.
+#   python rebuild_analytics.py
+# Apply / status changes / proctoring flags / scoring keep the rollups current on their
+# own; run this once after the first deploy (after migrate_db.py), or whenever the
+# numbers look off. Increments that land while it runs can be lost - run it when quiet.
+# ---------------------------------------------------------
+
+import time
+from app import create_app
+from app.analytics import backfill_sentiment, rebuild_rollups
+
+app = create_app()
+
+if __name__ == "__main__":
+    with app.app_context():
+        started = time.time()
+
+        print("🔨 Backfilling application sentiment from graph_data...")
+        filled = backfill_sentiment(progress=lambda done: print(f"   📈 {done} applications"))
+        print(f"   ✅ {filled} applications bucketed")
+
+        print("🔨 Rebuilding job rollups...")
+        jobs = rebuild_rollups()
+        print(f"✅ Analytics rollups rebuilt for {jobs} jobs in {time.time() - started:.1f}s")
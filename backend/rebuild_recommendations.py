@@ -0,0 +1,27 @@
+# backend/rebuild_recommendations.py
+# Recomputes the precomputed job recommendations for every candidate.
+#   python rebuild_recommendations.py
+# Normal operation keeps them current on its own (job create/update, preference / profile
+# changes); run this once after the first deploy. Run rebuild_search_index.py first so
+# resume text is available for matching.
+# ---------------------------------------------------------
+
+import time
+from app import create_app, db
+from app.models import Candidate
+from app.recommendations import recommend_for_candidate
+
+app = create_app()
+
+if __name__ == "__main__":
+    with app.app_context():
+        started = time.time()
+        candidate_ids = [row[0] for row in db.session.query(Candidate.id).order_by(Candidate.id).all()]
+
+        for done, candidate_id in enumerate(candidate_ids, start=1):
+            recommend_for_candidate(candidate_id)
+            db.session.expunge_all()
+            if done % 100 == 0 or done == len(candidate_ids):
+                print(f"   📈 {done}/{len(candidate_ids)} candidates")
+
+        print(f"✅ Recommendations rebuilt in {time.time() - started:.1f}s")
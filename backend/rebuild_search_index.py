@@ -0,0 +1,26 @@
+# backend/rebuild_search_index.py
+# Rebuilds the HR candidate search index (BM25) from scratch.
+#   python rebuild_search_index.py [batch_size]
+# Normal operation keeps the index current on its own (apply / profile update);
+# run this after the first deploy or if the index looks out of sync.
+# ---------------------------------------------------------
+
+import sys
+import time
+from app import create_app
+from app.candidate_search import rebuild_index, DEFAULT_BATCH_SIZE
+
+app = create_app()
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BATCH_SIZE
+
+    with app.app_context():
+        started = time.time()
+
+        def show_progress(done, total):
+            rate = done / max(time.time() - started, 0.001)
+            print(f"   📈 {done}/{total} candidates ({rate:.0f}/s)")
+
+        indexed = rebuild_index(batch_size=batch_size, progress=show_progress)
+        print(f"✅ Search index rebuilt: {indexed} candidates in {time.time() - started:.1f}s")
@@ -0,0 +1,32 @@
+# backend/rescore_job.py
+# Re-scores every application of a job from cached resume/video text.
+#   python rescore_job.py <job_id> [batch_size]
+# ---------------------------------------------------------
+
+import sys
+import time
+from app import create_app, db
+from app.rescoring import start_rescore, rescore_job, DEFAULT_BATCH_SIZE
+
+app = create_app()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python rescore_job.py <job_id> [batch_size]")
+        sys.exit(1)
+
+    job_id = int(sys.argv[1])
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BATCH_SIZE
+
+    with app.app_context():
+        run = start_rescore(job_id, reason="cli", queue=False)
+        db.session.commit()
+
+        started = time.time()
+
+        def show_progress(done, total):
+            rate = done / max(time.time() - started, 0.001)
+            print(f"   📈 {done}/{total} applications ({rate:.0f}/s)")
+
+        # Runs right here instead of going through the worker queue
+        rescore_job(run.id, batch_size=batch_size, progress=show_progress)
@@ -2,11 +2,21 @@
 # When we run "python run.py", this file:
 #   1. Imports the Flask app created in app/__init__.py
 #   2. Starts the backend server on http://localhost:5000
+#   3. (Dev) Starts the AI scoring worker in the same process.
+#      Set EMBEDDED_WORKER=0 when running "python worker.py" separately.
+#
+# First time: run "python init_db.py" to create the tables; after model changes on an
+# existing database run "python migrate_db.py".
 # ---------------------------------------------------------
 
+import os
 from app import create_app
+from app.task_queue import start_worker_thread
 
 app = create_app()
 
 if __name__ == "__main__":
+    # Flask's reloader runs this file twice - only start the worker in the real server process
+    if os.getenv("EMBEDDED_WORKER", "1") != "0" and os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_worker_thread(app)
     app.run(debug=True, host="0.0.0.0", port=5000)
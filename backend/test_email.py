@@ -1,9 +1,13 @@
+import os
 import smtplib
 from email.message import EmailMessage
 
-# 👇 REPLACE WITH YOUR DETAILS
-EMAIL_ADDRESS = "paint.it.onn@gmail.com"
-APP_PASSWORD = "mpiq cggy rlxc hfkr"  # No spaces needed, but spaces are fine
+from dotenv import load_dotenv
+
+# 👇 Same credentials the app uses (.env): MAIL_USERNAME / MAIL_PASSWORD (or EMAIL_USER / EMAIL_PASS)
+load_dotenv()
+EMAIL_ADDRESS = os.getenv("MAIL_USERNAME") or os.getenv("EMAIL_USER")
+APP_PASSWORD = os.getenv("MAIL_PASSWORD") or os.getenv("EMAIL_PASS")  # No spaces needed, but spaces are fine
 
 msg = EmailMessage()
 msg['Subject'] = "Test Email from RecruitPro"
@@ -0,0 +1,36 @@
+# backend/tests/conftest.py
+# Run from backend/: python -m pytest -q tests
+# Every test gets a fresh SQLite database with all migrations applied.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("MAIL_BACKEND", "console")
+
+    from app import create_app, db
+    from app.migrations import run_migrations
+
+    app = create_app()
+    run_migrations(app)
+    with app.app_context():
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def hr_user(app):
+    from app import db
+    from app.models import User
+
+    user = User(email="hr@example.com", password_hash="x", role="hr")
+    db.session.add(user)
+    db.session.commit()
+    return user
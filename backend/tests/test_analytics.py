@@ -0,0 +1,40 @@
+# backend/tests/test_analytics.py
+
+from app.analytics import sentiment_bucket
+
+
+def test_sentiment_buckets():
+    assert sentiment_bucket({"sentiment": "Confident & Positive Tone (+10%)"}) == "Positive"
+    assert sentiment_bucket({"sentiment": "Nervous or Negative Tone (-5%)"}) == "Negative"
+    assert sentiment_bucket({"sentiment": "Neutral Tone"}) == "Neutral"
+    assert sentiment_bucket({"sentiment": "No audio detected."}) == "No Audio"
+    assert sentiment_bucket('{"sentiment": "No audio detected."}') == "No Audio"
+    assert sentiment_bucket(None) is None
+
+
+def test_silent_videos_counted_as_neutral_are_rebucketed(app, hr_user):
+    from app import db
+    from app.analytics import backfill_sentiment, rebuild_rollups, summary
+    from app.models import Application, Candidate, Job
+
+    job = Job(title="Backend", created_by=hr_user.id)
+    db.session.add(job)
+    db.session.flush()
+    # Both rows as the old sentiment_bucket() stored them: a silent video landed in Neutral
+    for name, feedback in (("Silent", "No audio detected."), ("Calm", "Neutral Tone")):
+        candidate = Candidate(name=name, email=f"{name}@example.com")
+        db.session.add(candidate)
+        db.session.flush()
+        db.session.add(Application(
+            job_id=job.id, candidate_id=candidate.id, full_name=name, email=f"{name}@example.com",
+            resume_url="r.pdf", graph_data={"sentiment": feedback}, sentiment="Neutral",
+        ))
+    db.session.commit()
+
+    assert backfill_sentiment(current="Neutral") == 1
+    rebuild_rollups()
+
+    totals = summary(job.id)
+    assert totals["sentiment_neutral"] == 1
+    assert totals["sentiment_no_audio"] == 1
+    assert Application.query.filter_by(full_name="Silent").one().sentiment == "No Audio"
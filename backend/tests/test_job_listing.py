@@ -0,0 +1,53 @@
+# backend/tests/test_job_listing.py
+
+from datetime import datetime
+
+from sqlalchemy import text
+
+
+def _add_jobs(hr_user, count, created_at=None):
+    from app import db
+    from app.models import Job
+
+    jobs = [Job(title=f"Job {i}", created_by=hr_user.id, created_at=created_at) for i in range(count)]
+    db.session.add_all(jobs)
+    db.session.commit()
+    return [job.id for job in jobs]
+
+
+def _all_pages(client, limit):
+    ids, cursor = [], None
+    for _ in range(20):  # a looping cursor fails the test instead of hanging it
+        url = f"/api/jobs?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        body = client.get(url).get_json()
+        ids += [job["id"] for job in body["jobs"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+    raise AssertionError(f"cursor never ended, pages so far: {ids}")
+
+
+def test_same_second_jobs_page_through(app, hr_user):
+    same_second = datetime(2026, 1, 5, 10, 0, 0)
+    ids = _add_jobs(hr_user, 5, created_at=same_second)
+
+    assert _all_pages(app.test_client(), limit=2) == sorted(ids, reverse=True)
+
+
+def test_default_created_at_pages_through(app, hr_user):
+    ids = _add_jobs(hr_user, 5)
+
+    assert _all_pages(app.test_client(), limit=2) == sorted(ids, reverse=True)
+
+
+def test_migration_normalises_current_timestamp_rows(app, hr_user):
+    from app import db
+    from app.migrations import m0008_created_at_format
+
+    ids = _add_jobs(hr_user, 5)
+    # What the old func.now() default stored on SQLite
+    db.session.execute(text("UPDATE job SET created_at = '2026-01-05 10:00:00'"))
+    m0008_created_at_format()
+    db.session.commit()
+
+    assert _all_pages(app.test_client(), limit=2) == sorted(ids, reverse=True)
@@ -0,0 +1,39 @@
+# backend/tests/test_pdf_extractor.py
+
+from app.pdf_extractor import extract_clean_text
+
+
+def _pdf_with_form_xobject(path):
+    """One page: a line of normal text plus a form XObject (LTFigure) that draws more text."""
+    page_stream = b"BT /F1 12 Tf 72 720 Td (Top level text) Tj ET\nq 1 0 0 1 72 600 cm /Fm1 Do Q\n"
+    form_stream = b"BT /F1 12 Tf 0 0 Td (Kubernetes inside form xobject) Tj ET\n"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> /XObject << /Fm1 6 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(page_stream) + page_stream + b"endstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /XObject /Subtype /Form /BBox [0 0 400 50] /Resources << /Font << /F1 5 0 R >> >> "
+        b"/Length %d >>\nstream\n" % len(form_stream) + form_stream + b"endstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return str(path)
+
+
+def test_text_inside_form_xobjects_is_extracted(tmp_path):
+    pdf = _pdf_with_form_xobject(tmp_path / "resume.pdf")
+
+    text = extract_clean_text(pdf, mode="resume")
+
+    assert "top level text" in text
+    assert "kubernetes inside form xobject" in text
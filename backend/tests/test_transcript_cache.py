@@ -0,0 +1,75 @@
+# backend/tests/test_transcript_cache.py
+
+import pytest
+
+from app import transcription
+from app.transcription import StubBackend
+
+CHUNKS = 3
+
+
+class FlakyBackend(StubBackend):
+    """Stub transcript, except that the second chunk raises (like a transient STT error)."""
+    name = "flaky"
+    fail = True
+
+    def transcribe(self, pcm, offset_seconds=0.0):
+        if self.fail and 0 < offset_seconds < transcription.CHUNK_SECONDS:  # chunk 1 only
+            raise RuntimeError("recognition request failed")
+        return super().transcribe(pcm, offset_seconds)
+
+
+@pytest.fixture
+def video(tmp_path, monkeypatch):
+    """A fake video file whose audio is CHUNKS chunks of silence (no ffmpeg needed)."""
+    def fake_chunks(path, chunk_seconds, overlap_seconds):
+        for index in range(CHUNKS):
+            seconds = chunk_seconds + (overlap_seconds if index else 0)
+            yield b"\0" * int(seconds * transcription.BYTES_PER_SECOND)
+
+    monkeypatch.setattr(transcription, "iter_pcm_chunks", fake_chunks)
+    monkeypatch.setitem(transcription.BACKENDS, FlakyBackend.name, FlakyBackend)
+    monkeypatch.setenv("TRANSCRIPTION_BACKEND", FlakyBackend.name)
+    transcription._backend_instances.pop(FlakyBackend.name, None)
+
+    path = tmp_path / "interview.mp4"
+    path.write_bytes(b"not really a video")
+    return str(path)
+
+
+def _cached_transcript(path):
+    from app import artifact_cache
+    from app.ai_engine import video_transcript_version
+
+    return artifact_cache.lookup(artifact_cache.file_sha256(path), "video", video_transcript_version())
+
+
+def test_partial_transcript_is_returned_but_not_cached(app, video):
+    from app.ai_engine import get_video_transcript
+
+    stats, info = {}, {}
+    text = get_video_transcript(video, info, stats)
+
+    assert stats["failed_chunks"] == 1
+    assert text.startswith("t0 ")  # the chunks that worked are still used
+    assert info["video_cache"] == "miss"
+    assert _cached_transcript(video) is None
+
+    # Once the recognizer works again the full transcript is extracted and cached
+    transcription.get_backend(FlakyBackend.name).fail = False
+    full = get_video_transcript(video, {}, {})
+    assert len(full.split()) > len(text.split())
+    assert _cached_transcript(video) == full
+
+
+def test_complete_transcript_is_cached(app, video):
+    from app.ai_engine import get_video_transcript
+
+    transcription.get_backend(FlakyBackend.name).fail = False
+    text = get_video_transcript(video, {}, {})
+
+    assert text
+    assert _cached_transcript(video) == text
+    info = {}
+    assert get_video_transcript(video, info, {}) == text
+    assert info["video_cache"] == "hit"
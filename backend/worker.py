@@ -0,0 +1,13 @@
+# backend/worker.py
+# Background worker: scores applications queued by /jobs/<id>/apply, sends the email outbox.
+#   python worker.py                 -> one process per CPU core
+#   WORKER_PROCESSES=4 python worker.py
+# ---------------------------------------------------------
+
+from app import create_app
+from app.task_queue import run_worker
+
+app = create_app()
+
+if __name__ == "__main__":
+    run_worker(app)
@@ -33,7 +33,7 @@ return (
 
       {/* 2. Job Info Body */}
       <div className="text-sm text-slate-600 space-y-2 flex-grow">
-        <p className="italic text-slate-400">"{job.description?.slice(0, 80)}..."</p>
+        <p className="italic text-slate-400">"{(job.description_preview ?? job.description)?.slice(0, 80)}..."</p>
         <div className="pt-2 space-y-1">
           <div><span className="mr-2">📍</span><strong>Location:</strong> {job.location || "—"}</div>
           <div><span className="mr-2">🛠️</span><strong>Skills:</strong> {job.required_skills || "—"}</div>
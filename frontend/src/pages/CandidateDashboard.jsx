@@ -39,9 +39,10 @@ export default function CandidateDashboard() {
   const [location, setLocation] = useState("");
   const [loading, setLoading] = useState(true);
 
-  // Jobs Data
+  // Jobs Data (one server page at a time, filtered server-side)
   const [jobs, setJobs] = useState([]);
-  const [filtered, setFiltered] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // Application Data
   const [appliedJobIds, setAppliedJobIds] = useState([]);
@@ -67,25 +68,56 @@ export default function CandidateDashboard() {
       setToast({ message, type });
   };
 
-  // 1️⃣ Load ALL public jobs
+  // 1️⃣ Load one page of jobs matching the search: keywords go to the full-text search
+  //     (most relevant first), otherwise the newest jobs (location filtered by the API)
+  const fetchJobs = async (cursor = null) => {
+    const params = new URLSearchParams({ is_active: "true", limit: "24" });
+    if (role.trim()) params.set("q", role.trim());
+    if (location.trim()) params.set("location", location.trim());
+    if (cursor) params.set("cursor", cursor);
+
+    const endpoint = role.trim() ? "jobs/search" : "jobs";
+    const res = await fetch(`http://localhost:5000/api/${endpoint}?${params}`, {
+       headers: { Authorization: `Bearer ${token}` }
+    });
+    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+    return res.json();
+  };
+
+  // Re-query from the first page when the search changes (debounced while typing)
   useEffect(() => {
-    const fetchJobs = async () => {
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      setLoading(true);
       try {
-        const res = await fetch("http://localhost:5000/api/jobs", {
-           headers: { Authorization: `Bearer ${token}` }
-        });
-        const data = await res.json();
+        const data = await fetchJobs();
+        if (cancelled) return;
         setJobs(data.jobs || []);
-        // Don't set filtered here immediately, allow the useEffect hook below to handle it
+        setNextCursor(data.next_cursor || null);
       } catch (err) {
         console.error("Error fetching jobs", err);
-        showToast("Could not load jobs", "error");
+        if (!cancelled) showToast("Could not load jobs", "error");
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
-    };
-    fetchJobs();
-  }, [token]);
+    }, 300);
+    return () => { cancelled = true; clearTimeout(timer); };
+  }, [token, role, location]);
+
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    try {
+      const data = await fetchJobs(nextCursor);
+      setJobs((prev) => [...prev, ...(data.jobs || [])]);
+      setNextCursor(data.next_cursor || null);
+    } catch (err) {
+      console.error("Error fetching jobs", err);
+      showToast("Could not load more jobs", "error");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   // 2️⃣ Load applied job IDs
   useEffect(() => {
@@ -127,23 +159,6 @@ export default function CandidateDashboard() {
     loadAppliedJobs();
   }, [token]);
 
-  // 3️⃣ UNIFIED FILTER LOGIC (Search Only)
-  useEffect(() => {
-      const qRole = role.toLowerCase().trim();
-      const qLoc = location.toLowerCase().trim();
-
-      const results = jobs.filter((job) => {
-        // Keyword Search
-        const title = (job.title || "").toLowerCase();
-        const skills = (job.required_skills || "").toLowerCase();
-        const loc = (job.location || "").toLowerCase();
-        return (qRole ? title.includes(qRole) || skills.includes(qRole) : true) &&
-               (qLoc ? loc.includes(qLoc) : true);
-      });
-
-      setFiltered(results);
-  }, [jobs, role, location]);
-
 
   return (
     <CandidateLayout>
@@ -205,14 +220,14 @@ export default function CandidateDashboard() {
         <div className="px-8 max-w-7xl mx-auto">
           <div className="flex items-center justify-between mb-6">
              <h2 className="text-xl font-bold text-slate-800">Latest Openings</h2>
-             <span className="text-sm font-medium text-slate-500">{filtered.length} jobs found</span>
+             <span className="text-sm font-medium text-slate-500">{jobs.length}{nextCursor ? "+" : ""} jobs found</span>
           </div>
 
           {loading ? (
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
               {[...Array(6)].map((_, i) => <SkeletonJobCard key={i} />)}
             </div>
-          ) : filtered.length === 0 ? (
+          ) : jobs.length === 0 ? (
             <div className="text-center py-20 bg-white rounded-xl border border-slate-200 shadow-sm">
               <div className="text-4xl mb-4">🔍</div>
               <p className="text-slate-800 font-bold">No jobs found.</p>
@@ -220,7 +235,7 @@ export default function CandidateDashboard() {
             </div>
           ) : (
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-              {filtered.map((job) => {
+              {jobs.map((job) => {
                 const isApplied = appliedJobIds.includes(Number(job.id));
                 const status = statusMap[job.id];
                 const appliedAt = appliedDateMap[job.id];
@@ -247,6 +262,18 @@ export default function CandidateDashboard() {
               })}
             </div>
           )}
+
+          {!loading && nextCursor && (
+            <div className="flex justify-center mt-8">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-6 py-3 bg-white border border-slate-200 rounded-lg text-sm font-bold text-slate-700 hover:bg-slate-50 shadow-sm disabled:opacity-50"
+              >
+                {loadingMore ? "Loading..." : "Load more jobs"}
+              </button>
+            </div>
+          )}
         </div>
 
         {/* MODALS */}
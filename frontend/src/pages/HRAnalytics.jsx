@@ -49,6 +49,21 @@ export default function HRAnalytics() {
       .catch(err => console.error("Analytics Error", err));
   }, [selectedJob]);
 
+  // 3. Talent matrix comes one page at a time (newest candidates first)
+  const loadMoreMatrix = () => {
+    const params = new URLSearchParams({ matrix_cursor: analytics.matrix_next_cursor });
+    if (selectedJob !== "all") params.set("job_id", selectedJob);
+
+    fetch(`http://localhost:5000/api/hr/analytics?${params}`, { headers: { Authorization: `Bearer ${token}` } })
+      .then(res => res.json())
+      .then(data => setAnalytics(prev => ({
+        ...prev,
+        matrix: [...(prev.matrix || []), ...(data.matrix || [])],
+        matrix_next_cursor: data.matrix_next_cursor || null
+      })))
+      .catch(err => console.error("Analytics Error", err));
+  };
+
   // Loading State
   if (loading || !analytics) return (
       <HRLayout>
@@ -290,6 +305,13 @@ const CustomAvatarNode = (props) => {
                 </ScatterChart>
              </ResponsiveContainer>
           </div>
+
+          {analytics.matrix_next_cursor && (
+            <div className="flex justify-between items-center mt-4 text-xs font-bold text-slate-400">
+              <span>Showing the {(analytics.matrix || []).length} most recent of {analytics.total} candidates</span>
+              <button onClick={loadMoreMatrix} className="text-blue-600 hover:text-blue-700 hover:underline">Load more →</button>
+            </div>
+          )}
         </div>
       </div>
     </HRLayout>
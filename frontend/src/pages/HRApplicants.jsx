@@ -8,12 +8,26 @@ export default function HRApplicants() {
   const [jobTitle, setJobTitle] = useState("Loading...");
   const [loading, setLoading] = useState(true);
   const [selectedCandidate, setSelectedCandidate] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [proctoringLog, setProctoringLog] = useState(null);
   const token = localStorage.getItem("token");
 
   useEffect(() => {
     fetchApplicants();
   }, [jobId]);
 
+  // 🛡️ Proctoring events of the opened candidate (summarized on the server)
+  useEffect(() => {
+    setProctoringLog(null);
+    if (!selectedCandidate) return;
+    fetch(`http://localhost:5000/api/hr/applications/${selectedCandidate.id}/proctoring`, {
+      headers: { Authorization: `Bearer ${token}` },
+    })
+      .then(res => (res.ok ? res.json() : null))
+      .then(data => setProctoringLog(data))
+      .catch(err => console.error("Error fetching proctoring log:", err));
+  }, [selectedCandidate]);
+
   // 🟢 HELPER: Normalize Data
   const enhanceCandidateData = (app) => {
     return {
@@ -28,31 +42,35 @@ export default function HRApplicants() {
     };
   };
 
-  const fetchApplicants = async () => {
+  const fetchApplicants = async (cursor = null) => {
     try {
       // 1. Get Job Details
-      const jobRes = await fetch(`http://localhost:5000/api/jobs/${jobId}`, {
-         headers: { Authorization: `Bearer ${token}` }
-      });
-      if (jobRes.ok) {
-          const jobData = await jobRes.json();
-          setJobTitle(jobData.job?.title || jobData.title || "Job Details");
+      if (!cursor) {
+        const jobRes = await fetch(`http://localhost:5000/api/jobs/${jobId}`, {
+           headers: { Authorization: `Bearer ${token}` }
+        });
+        if (jobRes.ok) {
+            const jobData = await jobRes.json();
+            setJobTitle(jobData.job?.title || jobData.title || "Job Details");
+        }
       }
 
-      // 2. Get Applicants
-      const res = await fetch(`http://localhost:5000/api/hr/jobs/${jobId}/applicants`, {
+      // 2. Get Applicants (ranked by AI score on the server, one page at a time)
+      const params = new URLSearchParams({ sort: "ai_score", order: "desc", limit: "50" });
+      if (cursor) params.set("cursor", cursor);
+      const res = await fetch(`http://localhost:5000/api/hr/jobs/${jobId}/applicants?${params}`, {
         headers: { Authorization: `Bearer ${token}` },
       });
 
       const data = await res.json();
-      let list = data.applicants || data || [];
+      let list = data.applicants || [];
       if (!Array.isArray(list)) list = [];
 
-      // 3. Process Data & Sort by AI Score
+      // 3. Process Data
       const enhancedList = list.map(enhanceCandidateData);
-      const sorted = enhancedList.sort((a, b) => b.ai_score - a.ai_score);
 
-      setApplicants(sorted);
+      setApplicants(prev => (cursor ? [...prev, ...enhancedList] : enhancedList));
+      setNextCursor(data.next_cursor || null);
       setLoading(false);
     } catch (err) {
       console.error("Error fetching applicants:", err);
@@ -83,10 +101,16 @@ export default function HRApplicants() {
     }
   };
 
-  const handleExport = () => {
-    if (applicants.length === 0) return alert("No data to export.");
+  // Exports every applicant (not just the loaded pages) from the NDJSON stream
+  const handleExport = async () => {
+    const params = new URLSearchParams({ format: "ndjson", sort: "ai_score", fields: "ai_score,trust_score,status,user" });
+    const res = await fetch(`http://localhost:5000/api/hr/jobs/${jobId}/applicants?${params}`, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
+    const all = (await res.text()).split("\n").filter(line => line).map(line => JSON.parse(line));
+    if (all.length === 0) return alert("No data to export.");
     const headers = "Rank,Name,Email,AI Score,Trust Score,Status\n";
-    const rows = applicants.map((app, index) =>
+    const rows = all.map((app, index) =>
         `${index + 1},${app.user?.name},${app.user?.email},${app.ai_score}%,${app.trust_score}%,${app.status}`
     ).join("\n");
     const csvContent = "data:text/csv;charset=utf-8," + encodeURIComponent(headers + rows);
@@ -98,6 +122,32 @@ export default function HRApplicants() {
     document.body.removeChild(link);
   };
 
+  // 📦 One call for every still-open applicant under the threshold (emails go out from the server outbox)
+  const handleBulkReject = async () => {
+    const threshold = 40;
+    if (!window.confirm(`Reject every applicant below ${threshold}% who is still in "Applied"?`)) return;
+    try {
+      const res = await fetch(`http://localhost:5000/api/hr/applications/bulk-status`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          Authorization: `Bearer ${token}`,
+        },
+        body: JSON.stringify({
+          status: "Rejected",
+          filter: { job_id: Number(jobId), statuses: ["Applied"], max_score: threshold - 1 },
+        }),
+      });
+      const data = await res.json();
+      if (!res.ok) return alert(data.error || "Bulk update failed.");
+      alert(`Rejected ${data.updated} applicant(s).`);
+      fetchApplicants();
+    } catch (err) {
+      console.error("Bulk update failed", err);
+      alert("Failed to update statuses on server.");
+    }
+  };
+
   const handleBulkEmail = () => {
     const emails = applicants.map(app => app.user?.email).filter(email => email).join(",");
     if (!emails) return alert("No valid emails found.");
@@ -140,6 +190,12 @@ export default function HRApplicants() {
           label: "Nervous Tone",
           tooltip: "AI Analysis: Detected rapid speech, stuttering, or lack of sustained eye contact."
       };
+      if (s.includes("no audio")) return {
+          style: "bg-slate-100 text-slate-500 border-slate-200",
+          icon: "🔇",
+          label: "No Audio",
+          tooltip: "AI Analysis: No speech was detected in the video, so the tone could not be analyzed."
+      };
       if (s.includes("neutral")) return {
           style: "bg-blue-50 text-blue-600 border-blue-200",
           icon: "😐",
@@ -249,11 +305,12 @@ export default function HRApplicants() {
             </div>
             <h1 className="text-4xl font-black text-slate-800 capitalize tracking-tight">{jobTitle}</h1>
             <p className="text-slate-500 font-medium mt-2">
-               Found <strong className="text-slate-900">{applicants.length} candidates</strong>. Ranked by AI relevance & Integrity.
+               Found <strong className="text-slate-900">{applicants.length}{nextCursor ? "+" : ""} candidates</strong>. Ranked by AI relevance & Integrity.
             </p>
           </div>
           <div className="flex gap-3">
              <button onClick={handleExport} className="px-4 py-2.5 bg-white border border-slate-200 text-slate-600 text-xs font-bold rounded-xl hover:bg-slate-50 transition shadow-sm flex items-center gap-2">⬇ Export CSV</button>
+             <button onClick={handleBulkReject} className="px-4 py-2.5 bg-white border border-red-200 text-red-600 text-xs font-bold rounded-xl hover:bg-red-50 transition shadow-sm flex items-center gap-2">✖ Reject &lt; 40%</button>
              <button onClick={handleBulkEmail} className="px-4 py-2.5 bg-slate-900 text-white text-xs font-bold rounded-xl hover:bg-slate-800 transition shadow-lg flex items-center gap-2">✉️ Bulk Email</button>
           </div>
         </div>
@@ -410,6 +467,14 @@ export default function HRApplicants() {
            ))}
         </div>
 
+        {nextCursor && (
+          <div className="flex justify-center mt-8">
+            <button onClick={() => fetchApplicants(nextCursor)} className="px-6 py-2.5 bg-white border border-slate-200 text-slate-600 text-xs font-bold rounded-xl hover:bg-slate-50 transition shadow-sm">
+              Load more
+            </button>
+          </div>
+        )}
+
         {/* 4. MODAL */}
         {selectedCandidate && (
             <div className="fixed inset-0 z-50 flex items-center justify-center bg-black/60 backdrop-blur-sm p-4 animate-fade-in">
@@ -461,6 +526,17 @@ export default function HRApplicants() {
                                         {selectedCandidate.faces_detected !== "Single Face" && <li>Face Detection: {selectedCandidate.faces_detected}</li>}
                                         {selectedCandidate.voices_detected !== "Single Voice" && <li>Voice Detection: {selectedCandidate.voices_detected}</li>}
                                     </ul>
+                                    {proctoringLog?.recent?.length > 0 && (
+                                        <ul className="text-[11px] text-red-500 mt-2 space-y-0.5">
+                                            {proctoringLog.recent.map((event, i) => (
+                                                <li key={i}>
+                                                    {new Date(event.occurred_at + "Z").toLocaleTimeString()} · {event.reason}
+                                                    {event.occurrences > 1 && ` (×${event.occurrences})`}
+                                                    {event.penalty > 0 && ` · -${event.penalty}%`}
+                                                </li>
+                                            ))}
+                                        </ul>
+                                    )}
                                 </div>
                             </div>
                         )}
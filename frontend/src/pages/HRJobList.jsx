@@ -3,6 +3,14 @@ import { Link } from "react-router-dom";
 import HRLayout from "../layout/HRLayout";
 import EditJobSidebar from "../components/EditJobSidebar";
 
+// Pipeline stages as returned in job.status_counts by GET /api/hr/jobs
+const PIPELINE = [
+  { status: "Applied", bar: "bg-blue-500" },
+  { status: "Shortlisted", bar: "bg-amber-400" },
+  { status: "Hired", bar: "bg-emerald-400" },
+  { status: "Rejected", bar: "bg-red-400" },
+];
+
 export default function HRJobList() {
   const [jobs, setJobs] = useState([]);
   const [filteredJobs, setFilteredJobs] = useState([]);
@@ -181,15 +189,21 @@ export default function HRJobList() {
                               </div>
                           </div>
 
-                          {/* Progress Bar */}
+                          {/* Progress Bar (share of applications in each pipeline stage) */}
                           <div className="w-full h-2 bg-slate-100 rounded-full overflow-hidden flex">
-                             <div className="bg-blue-500 h-full" style={{ width: `${Math.min(60, job.application_count * 5)}%` }}></div>
-                             <div className="bg-emerald-400 h-full" style={{ width: `${Math.min(20, job.application_count * 2)}%` }}></div>
+                             {PIPELINE.map(({ status, bar }) => (
+                               <div
+                                 key={status}
+                                 className={`${bar} h-full`}
+                                 style={{ width: `${job.application_count ? ((job.status_counts?.[status] || 0) / job.application_count) * 100 : 0}%` }}
+                               ></div>
+                             ))}
                           </div>
 
-                          <div className="flex gap-4 mt-2 text-[10px] font-bold text-slate-400">
-                             <span className="flex items-center gap-1"><span className="w-1.5 h-1.5 rounded-full bg-blue-500"></span> Applied: {job.application_count}</span>
-                             <span className="flex items-center gap-1"><span className="w-1.5 h-1.5 rounded-full bg-emerald-400"></span> Shortlisted: {Math.floor(job.application_count * 0.2)}</span>
+                          <div className="flex flex-wrap gap-4 mt-2 text-[10px] font-bold text-slate-400">
+                             {PIPELINE.map(({ status, bar }) => (
+                               <span key={status} className="flex items-center gap-1"><span className={`w-1.5 h-1.5 rounded-full ${bar}`}></span> {status}: {job.status_counts?.[status] || 0}</span>
+                             ))}
                           </div>
                       </div>
 
@@ -11,47 +11,60 @@ export default function InterviewRoom() {
   const token = localStorage.getItem("token");
 
   const [model, setModel] = useState(null);
-  const [lastFlagTime, setLastFlagTime] = useState(0);
-
-  // 🚀 AUTOMATED FLAGGING LOGIC (Sends Data to Backend)
-  const flagSuspiciousActivity = async (type, reason) => {
-    const now = Date.now();
-    // 🛡️ Cooldown: Prevent spamming the API (limit 1 alert per 5 seconds for visuals)
-    if (now - lastFlagTime < 5000) return;
-
-    try {
-      setLastFlagTime(now);
-      // Extract Application ID from Room Name (e.g., "Interview-15-xyz" -> "15")
-      const appId = roomName.split('-')[1];
-
-      await fetch(`http://localhost:5000/api/applications/${appId}/flag`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${token}`
-        },
-        body: JSON.stringify({
-            type: type,   // "tab_switch", "multiple_faces", etc.
-            reason: reason
-        })
+  const pendingEvents = useRef([]);
+
+  // Extract Application ID from Room Name (e.g., "Interview-15-xyz" -> "15")
+  const appId = roomName.split('-')[1];
+
+  // 📤 Sends the buffered violations as one batch (the server coalesces repeats)
+  const flushEvents = (keepalive = false) => {
+    if (pendingEvents.current.length === 0) return;
+    const events = pendingEvents.current.splice(0, 100);
+
+    fetch(`http://localhost:5000/api/applications/${appId}/proctoring-events`, {
+      method: 'POST',
+      keepalive, // lets the last batch finish while the page is closing
+      headers: {
+        'Content-Type': 'application/json',
+        'Authorization': `Bearer ${token}`
+      },
+      body: JSON.stringify({ events })
+    })
+      .then(res => res.ok ? res.json() : Promise.reject(res.status))
+      .then(data => console.log(`🚩 Sent ${events.length} alert(s), trust score ${data.new_trust_score}%`))
+      .catch(err => {
+        // Network error (fetch threw) or 5xx: retried with the next flush.
+        // 4xx: the server will never accept this batch (bad payload, not this
+        // candidate's application...) - drop it instead of re-sending it forever.
+        if (typeof err === "number" && err < 500) {
+          console.warn(`Flagging rejected (${err}), dropping ${events.length} alert(s)`);
+          return;
+        }
+        console.error("Flagging failed", err);
+        pendingEvents.current.unshift(...events);
       });
-      console.log(`🚩 Sent Alert: ${reason}`);
-    } catch (err) {
-      console.error("Flagging failed", err);
-    }
   };
 
+  // 🚀 AUTOMATED FLAGGING LOGIC (buffered, sent to the backend every few seconds)
+  const flagSuspiciousActivity = (type, reason) => {
+    pendingEvents.current.push({ type, reason, at: Date.now() });
+  };
+
+  useEffect(() => {
+    const flushInterval = setInterval(() => flushEvents(), 5000);
+    return () => {
+      clearInterval(flushInterval);
+      flushEvents(true);
+    };
+  }, [roomName, token]);
+
   // 🛡️ 1. DETECT TAB SWITCHING
   useEffect(() => {
     const handleVisibilityChange = () => {
       if (document.hidden) {
-        // Immediate Alert (No Cooldown for Tab Switching)
-        const appId = roomName.split('-')[1];
-        fetch(`http://localhost:5000/api/applications/${appId}/flag`, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json', 'Authorization': `Bearer ${token}` },
-            body: JSON.stringify({ type: "tab_switch", reason: "Candidate switched tabs" })
-        });
+        // Sent right away - the tab may never come back
+        flagSuspiciousActivity("tab_switch", "Candidate switched tabs");
+        flushEvents(true);
         alert("⚠️ WARNING: Tab switching is monitored. Your trust score has been reduced.");
       }
     };
@@ -4,13 +4,23 @@ import JobDetailsModal from "../components/JobDetailsModal";
 export default function JobsPublic() {
   const [jobs, setJobs] = useState([]);
   const [selectedJob, setSelectedJob] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+
+  const loadJobs = (cursor = null) => {
+    const params = new URLSearchParams({ is_active: "true" });
+    if (cursor) params.set("cursor", cursor);
+    fetch(`http://localhost:5000/api/jobs?${params}`)
+      .then(res => res.json())
+      .then(data => {
+        setJobs(prev => (cursor ? [...prev, ...(data.jobs || [])] : data.jobs || []));
+        setNextCursor(data.next_cursor || null);
+      })
+      .catch(console.error);
+  };
 
   useEffect(() => {
-  fetch("http://localhost:5000/api/jobs")
-    .then(res => res.json())
-    .then(data => setJobs(data.jobs || []))
-    .catch(console.error);
-}, []);
+    loadJobs();
+  }, []);
 
 
   return (
@@ -33,6 +43,17 @@ export default function JobsPublic() {
         ))}
       </div>
 
+      {nextCursor && (
+        <div className="flex justify-center mt-8">
+          <button
+            onClick={() => loadJobs(nextCursor)}
+            className="px-6 py-2 bg-white shadow rounded-lg font-semibold hover:shadow-lg transition"
+          >
+            Load more
+          </button>
+        </div>
+      )}
+
       {selectedJob && (
         <JobDetailsModal
           job={selectedJob}